@@ -0,0 +1,29 @@
+import time
+from koncowy.bench.movies import GENRES, make_movies
+from koncowy.src.cinema import Cinema
+from koncowy.src.staff import Staff
+
+
+def bench_add_movie(count, read_every=None):
+    cinema = Cinema("Bench", "Street 1")
+    manager = Staff("Anna", "Nowak", "manager")
+    movies = make_movies(count, genres=GENRES)
+    start = time.perf_counter()
+    for i, movie in enumerate(movies):
+        cinema.add_movie(manager, movie)
+        if read_every and i % read_every == 0:
+            cinema.has_movie(movie.title)
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'movies':>10} {'reads':>12} {'seconds':>10} {'us/add':>10}")
+    for count in (5_000, 10_000, 20_000):
+        for label, read_every in (("none", None), ("every 1000", 1_000)):
+            elapsed = bench_add_movie(count, read_every)
+            print(f"{count:>10} {label:>12} {elapsed:>10.4f} "
+                  f"{elapsed / count * 1e6:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+import asyncio
+import os
+import random
+import tempfile
+import time
+from koncowy.bench.movies import GENRES, make_movies
+from koncowy.src.box_office import AsyncBoxOffice
+from koncowy.src.cinema import Cinema
+from koncowy.src.customer import Customer
+from koncowy.src.staff import Staff
+
+
+def make_office(cinemas, customers, movies):
+    manager = Staff("Anna", "Nowak", "manager")
+    catalog = make_movies(movies, genres=GENRES)
+    office = AsyncBoxOffice()
+    for i in range(cinemas):
+        cinema = Cinema(f"Cinema {i}", "Street 1")
+        cinema.choose_movies_to_play(manager, catalog)
+        office.add_cinema(cinema)
+    for i in range(customers):
+        customer = Customer("Jan", "Nowak", 30, f"jan{i}@example.com", "x")
+        customer.activate_account()
+        office.add_customer(customer)
+    return office, catalog
+
+
+async def session(office, catalog, cinemas, email, requests, rng, path):
+    token = await office.login(email, "x")
+    done = 1
+    for _ in range(requests):
+        cinema_name = f"Cinema {rng.randrange(cinemas)}"
+        action = rng.random()
+        if action < 0.6:
+            await office.browse(cinema_name, rng.choice(GENRES))
+        elif action < 0.999:
+            await office.buy_ticket(token, cinema_name,
+                                    rng.choice(catalog).title)
+        else:
+            await office.save(cinema_name, path)
+        done += 1
+    return done
+
+
+async def run(sessions, requests, cinemas, path):
+    office, catalog = make_office(cinemas, sessions, 200)
+    rng = random.Random(7)
+    start = time.perf_counter()
+    counts = await asyncio.gather(*(
+        session(office, catalog, cinemas, f"jan{i}@example.com", requests,
+                random.Random(rng.random()), path)
+        for i in range(sessions)))
+    return sum(counts), time.perf_counter() - start
+
+
+def main():
+    path = tempfile.mktemp(suffix=".json")
+    try:
+        for sessions in (100, 1_000, 5_000):
+            total, elapsed = asyncio.run(run(sessions, 20, 4, path))
+            print(f"sessions {sessions:5d}: {total} requests in "
+                  f"{elapsed:.3f} s, {total / elapsed:9.0f} req/s")
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+import random
+import time
+from koncowy.bench.movies import make_movies
+from koncowy.src.cinema import Cinema
+from koncowy.src.customer import Customer
+from koncowy.src.staff import Staff
+
+
+def make_box_office(customers, movies):
+    catalog = make_movies(movies)
+    cinema = Cinema("Bench", "Street 1")
+    cinema.choose_movies_to_play(Staff("Anna", "Nowak", "manager"), catalog)
+    people = [Customer("Jan", "Nowak", 30, f"jan{i}@example.com", "x")
+              for i in range(customers)]
+    return cinema, people, catalog
+
+
+def main():
+    rng = random.Random(5)
+    cinema, people, catalog = make_box_office(10_000, 200)
+    pairs = [(rng.choice(people), rng.choice(catalog))
+             for _ in range(300_000)]
+
+    start = time.perf_counter()
+    for customer, movie in pairs:
+        customer.buy_ticket(movie)
+    loop_time = time.perf_counter() - start
+
+    cinema, people, catalog = make_box_office(10_000, 200)
+    pairs = [(rng.choice(people), rng.choice(catalog))
+             for _ in range(300_000)]
+    start = time.perf_counter()
+    cinema.sell_tickets(pairs)
+    batch_time = time.perf_counter() - start
+
+    print(f"tickets: {len(pairs)}")
+    print(f"buy_ticket loop: {loop_time:.3f} s")
+    print(f"sell_tickets:    {batch_time:.3f} s")
+
+
+if __name__ == '__main__':
+    main()
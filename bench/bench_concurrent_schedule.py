@@ -0,0 +1,65 @@
+import threading
+import time
+from koncowy.bench.movies import GENRES, make_movies
+from koncowy.src.cinema import Cinema
+from koncowy.src.staff import Staff
+
+
+def run(cinema, manager, readers, duration, write_interval):
+    done = threading.Event()
+    reads = [0] * readers
+    writes = [0]
+
+    def read(slot):
+        count = 0
+        while not done.is_set():
+            cinema.list_movies()
+            cinema.get_movies_by_genre("drama")
+            cinema.has_movie("Movie 0")
+            count += 1
+        reads[slot] = count
+
+    def write():
+        extra = make_movies(10_000, "Extra", genres=GENRES)
+        i = 0
+        while not done.is_set():
+            movie = extra[i % len(extra)]
+            if movie in cinema.schedule:
+                cinema.remove_movie(manager, movie)
+            else:
+                cinema.add_movie(manager, movie)
+            i += 1
+            if write_interval:
+                time.sleep(write_interval)
+        writes[0] = i
+
+    threads = [threading.Thread(target=read, args=(slot,))
+               for slot in range(readers)]
+    if write_interval is not None:
+        threads.append(threading.Thread(target=write))
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    done.set()
+    for thread in threads:
+        thread.join()
+    return sum(reads) / duration, writes[0] / duration
+
+
+def main():
+    manager = Staff("Anna", "Nowak", "manager")
+    cinema = Cinema("Bench", "Street 1")
+    cinema.choose_movies_to_play(manager, make_movies(1_000, genres=GENRES))
+    print(f"schedule: {len(cinema.schedule)} movies")
+    for readers in (1, 4, 16):
+        for label, interval in (("no writer", None),
+                                ("writer 1 ms", 0.001),
+                                ("writer busy", 0)):
+            read_rate, write_rate = run(cinema, manager, readers, 1.0,
+                                        interval)
+            print(f"readers {readers:2d}, {label:11s}: "
+                  f"{read_rate:9.0f} reads/s, {write_rate:7.0f} writes/s")
+
+
+if __name__ == '__main__':
+    main()
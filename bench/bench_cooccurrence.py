@@ -0,0 +1,43 @@
+import random
+import time
+from koncowy.bench.movies import make_movies
+from koncowy.src.cinema import Cinema
+from koncowy.src.customer import Customer
+from koncowy.src.recommendation import CoOccurrenceRecommender
+from koncowy.src.staff import Staff
+
+
+def main():
+    rng = random.Random(3)
+    catalog = make_movies(5_000)
+    cinema = Cinema("Bench", "Street 1")
+    cinema.choose_movies_to_play(Staff("Anna", "Nowak", "manager"),
+                                 catalog[:2_500])
+    customers = []
+    for i in range(20_000):
+        customer = Customer("Jan", "Nowak", 30, f"jan{i}@example.com", "x")
+        customer.activate_account()
+        customer.ticket_history = rng.choices(catalog, k=15)
+        customers.append(customer)
+
+    start = time.perf_counter()
+    recommender = CoOccurrenceRecommender(customers)
+    print(f"build index: {time.perf_counter() - start:.3f} s")
+
+    start = time.perf_counter()
+    for customer in customers[:5_000]:
+        customer.buy_ticket(rng.choice(catalog))
+    elapsed = time.perf_counter() - start
+    print(f"buy_ticket with index update: {elapsed / 5_000 * 1e6:.1f} us")
+
+    for recent in (None, 10, None):
+        start = time.perf_counter()
+        for customer in customers[:5_000]:
+            recommender.recommend(customer, cinema, k=10, recent=recent)
+        elapsed = time.perf_counter() - start
+        print(f"recommend top-10 (recent={recent}): "
+              f"{elapsed / 5_000 * 1e6:.1f} us")
+
+
+if __name__ == '__main__':
+    main()
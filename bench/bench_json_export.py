@@ -0,0 +1,47 @@
+import os
+import tempfile
+import time
+import tracemalloc
+from koncowy.bench.movies import make_movies
+from koncowy.src.cinema import Cinema
+
+
+def make_cinema(count):
+    cinema = Cinema("Bench", "Street 1")
+    cinema.schedule = make_movies(count, duration=100, director="Director",
+                                  description="Description")
+    return cinema
+
+
+def measure(export, path):
+    start = time.perf_counter()
+    export(path)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    export(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, os.path.getsize(path)
+
+
+def main():
+    path = os.path.join(tempfile.mkdtemp(), "schedule.json")
+    print(f"{'movies':>8} {'mode':>9} {'seconds':>8} "
+          f"{'peak KiB':>9} {'file KiB':>9}")
+    for count in (10_000, 100_000):
+        cinema = make_cinema(count)
+        modes = [
+            ("indented", cinema.export_schedule_to_json),
+            ("compact", lambda p: cinema.export_schedule_to_json(
+                p, indent=None)),
+            ("jsonl", cinema.export_schedule_to_jsonl),
+        ]
+        for mode, export in modes:
+            elapsed, peak, size = measure(export, path)
+            print(f"{count:>8} {mode:>9} {elapsed:>8.3f} "
+                  f"{peak / 1024:>9.1f} {size / 1024:>9.1f}")
+    os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
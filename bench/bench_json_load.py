@@ -0,0 +1,58 @@
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from koncowy.bench.movies import make_movies
+from koncowy.src.cinema import Cinema
+from koncowy.src.movie import Movie
+
+
+def write_archive(path, count):
+    cinema = Cinema("Bench", "Street 1")
+    cinema.schedule = make_movies(count, duration=100, director="Director",
+                                  description="Description")
+    cinema.save_to_json(path)
+
+
+def load_eagerly(path):
+    with open(path, 'r') as f:
+        data = json.load(f)
+    return [Movie(**{field: m[field] for field in Movie.FIELDS})
+            for m in data['schedule']]
+
+
+def count_streamed(path):
+    return sum(1 for _ in Cinema.iter_movies_from_json(path))
+
+
+def measure(load, path):
+    start = time.perf_counter()
+    load(path)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    load(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    path = os.path.join(tempfile.mkdtemp(), "schedule.json")
+    print(f"{'movies':>8} {'loader':>16} {'seconds':>8} {'peak KiB':>10}")
+    for count in (10_000, 100_000):
+        write_archive(path, count)
+        loaders = [
+            ("json.load", load_eagerly),
+            ("read_from_json", Cinema.read_from_json),
+            ("iter_movies", count_streamed),
+        ]
+        for name, load in loaders:
+            elapsed, peak = measure(load, path)
+            print(f"{count:>8} {name:>16} {elapsed:>8.3f} "
+                  f"{peak / 1024:>10.1f}")
+    os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
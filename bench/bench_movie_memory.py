@@ -0,0 +1,40 @@
+import tracemalloc
+from koncowy.src.movie import Movie
+
+
+class DictMovie:
+    def __init__(self, title, genre, duration, age_restriction,
+                 director, language, release_year, rating, description):
+        self.title = title
+        self.genre = genre
+        self.duration = duration
+        self.age_restriction = age_restriction
+        self.director = director
+        self.language = language
+        self.release_year = release_year
+        self.rating = rating
+        self.description = description
+        self.views = 0
+
+
+def bytes_per_movie(cls, count):
+    title, genre, director = "Title", "Drama", "Director"
+    language, description = "EN", "Description"
+    tracemalloc.start()
+    movies = [cls(title, genre, 100, 0, director, language, 2000, 7.5,
+                  description) for _ in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del movies
+    return current / count
+
+
+def main():
+    count = 100_000
+    print(f"{'layout':>12} {'bytes/movie':>12}")
+    for name, cls in [("__dict__", DictMovie), ("__slots__", Movie)]:
+        print(f"{name:>12} {bytes_per_movie(cls, count):>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import tracemalloc
+from koncowy.bench.movies import make_movies
+from koncowy.src.customer import Customer
+from koncowy.src.movie_registry import MovieRegistry
+
+
+def write_customers(directory, customers, history):
+    catalog = make_movies(history, duration=100, director="Director",
+                          description="Description")
+    paths = []
+    for i in range(customers):
+        customer = Customer("Jan", "Kowalski", 30, f"jan{i}@example.com",
+                            "secret")
+        customer.ticket_history = catalog
+        path = os.path.join(directory, f"customer{i}.json")
+        customer.save_to_json(path)
+        paths.append(path)
+    return paths
+
+
+def loaded_size(paths, registry):
+    tracemalloc.start()
+    customers = [Customer.read_from_json(path, registry=registry)
+                 for path in paths]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    movies = len({id(m) for c in customers for m in c.ticket_history})
+    return current, movies
+
+
+def main():
+    paths = write_customers(tempfile.mkdtemp(), 200, 100)
+    print(f"{'registry':>10} {'KiB':>10} {'movie objects':>14}")
+    for name, registry in [("per file", None), ("shared", MovieRegistry())]:
+        if registry is None:
+            size, movies = 0, 0
+            for path in paths:
+                part, count = loaded_size([path], MovieRegistry())
+                size, movies = size + part, movies + count
+        else:
+            size, movies = loaded_size(paths, registry)
+        print(f"{name:>10} {size / 1024:>10.1f} {movies:>14}")
+    for path in paths:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+import time
+from koncowy.src.movie import Movie
+from koncowy.src.movie_table import MovieTable
+
+LANGUAGES = ["Polski", "English", "Deutsch", "Français"]
+
+
+def make_movies(count):
+    return [Movie._unchecked(f"Movie {i}", "Drama", 90, i % 19, "Director",
+                             LANGUAGES[i % len(LANGUAGES)], 1950 + i % 75,
+                             (i % 101) / 10, "Description")
+            for i in range(count)]
+
+
+def timed(action, repeat=10):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = action()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    movies = make_movies(1_000_000)
+    start = time.perf_counter()
+    table = MovieTable(movies)
+    print(f"build table: {time.perf_counter() - start:.3f} s")
+
+    def python_loop():
+        return [m for m in movies
+                if m.is_highly_rated() and m.is_classic()
+                and m.is_in_language("Polski") and m.is_suitable_for_age(12)]
+
+    def vectorized():
+        return table.indices(table.filter(classic=True, highly_rated=True,
+                                          language="Polski", age=12))
+
+    loop_time, expected = timed(python_loop, repeat=1)
+    table_time, indices = timed(vectorized)
+    assert table.movies(table.filter(classic=True, highly_rated=True,
+                                     language="Polski", age=12)) == expected
+    print(f"python loop: {loop_time * 1000:.1f} ms")
+    print(f"MovieTable:  {table_time * 1000:.1f} ms ({len(indices)} rows)")
+
+
+if __name__ == '__main__':
+    main()
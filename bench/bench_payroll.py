@@ -0,0 +1,66 @@
+import random
+import time
+from datetime import date, timedelta
+from koncowy.src.cinema import Cinema
+from koncowy.src.staff import Staff
+
+ROLES = ["worker", "cashier", "projectionist", "manager"]
+SHIFTS = [("08:00", "13:00"), ("13:00", "21:30"), ("18:00", "23:00"),
+          ("22:00", "04:00")]
+
+
+def make_cinema(staff_count, days):
+    rng = random.Random(9)
+    first = date(2025, 1, 1)
+    dates = [(first + timedelta(days=d)).isoformat() for d in range(days)]
+    cinema = Cinema("Bench", "Street 1")
+    for i in range(staff_count):
+        staff = Staff(f"Name{i}", "Nowak", ROLES[i % len(ROLES)])
+        staff.shifts = [(day,) + rng.choice(SHIFTS)
+                        for day in rng.sample(dates, days * 2 // 3)]
+        cinema.assign_staff(staff)
+    return cinema
+
+
+def python_payroll(staff):
+    hours, roles, weeks = {}, {}, {}
+    for staff_member in staff:
+        shifts = staff_member.shifts
+        for day, time_ in shifts:
+            start = int(time_[:2]) * 60 + int(time_[3:])
+            end_time = shifts.end_of(day, time_)
+            end = int(end_time[:2]) * 60 + int(end_time[3:])
+            length = ((end - start) % (24 * 60)) / 60
+            hours[staff_member] = hours.get(staff_member, 0) + length
+            role = staff_member.position.lower()
+            roles[role] = roles.get(role, 0) + length
+            day_ = date.fromisoformat(day)
+            week = (day_ - timedelta(days=day_.weekday())).isoformat()
+            weeks[week] = weeks.get(week, 0) + length
+    return hours, roles, weeks
+
+
+def main():
+    start = time.perf_counter()
+    cinema = make_cinema(10_000, 365)
+    setup_time = time.perf_counter() - start
+    shift_count = sum(len(s.shifts) for s in cinema.staff)
+
+    start = time.perf_counter()
+    report = cinema.payroll()
+    numpy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hours, roles, weeks = python_payroll(cinema.staff)
+    python_time = time.perf_counter() - start
+    assert abs(sum(roles.values()) - report.hours.sum()) < 1e-6
+    assert report.hours_by_week().keys() == weeks.keys()
+
+    print(f"staff: {len(report.staff)}, shifts: {shift_count} "
+          f"(setup {setup_time:.1f} s)")
+    print(f"python loop payroll: {python_time:.3f} s")
+    print(f"numpy payroll:       {numpy_time:.3f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+import random
+import time
+from koncowy.bench.movies import make_movies
+from koncowy.src.cinema import Cinema
+from koncowy.src.customer import Customer
+from koncowy.src.recommendation import recommend_movies
+from koncowy.src.staff import Staff
+
+GENRES = ["Drama", "Sci-Fi", "Comedy", "Horror", "Romance", "Action"]
+
+
+def make_population(count, tickets):
+    rng = random.Random(1)
+    catalog = make_movies(600, genres=GENRES)
+    customers = []
+    for i in range(count):
+        customer = Customer("Jan", "Nowak", 30, f"jan{i}@example.com", "x")
+        customer.ticket_history = rng.choices(catalog, k=tickets)
+        customers.append(customer)
+    cinema = Cinema("Bench", "Street 1")
+    cinema.choose_movies_to_play(Staff("Anna", "Nowak", "manager"), catalog)
+    return customers, cinema
+
+
+def timed(action):
+    start = time.perf_counter()
+    result = action()
+    return time.perf_counter() - start, result
+
+
+def main():
+    customers, cinema = make_population(200_000, 20)
+    loop_time, expected = timed(
+        lambda: [c.recommend_movie(cinema) for c in customers])
+    batch_time, result = timed(lambda: recommend_movies(customers, cinema))
+    pool_time, pooled = timed(lambda: recommend_movies(
+        customers, cinema, processes=4, chunk_size=50_000))
+    assert result == expected and pooled == expected
+    print(f"customers: {len(customers)}")
+    print(f"recommend_movie loop:       {loop_time:.3f} s")
+    print(f"recommend_movies:           {batch_time:.3f} s")
+    print(f"recommend_movies (4 procs): {pool_time:.3f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+import random
+from datetime import date, timedelta
+from koncowy.src.cinema import Cinema
+from koncowy.src.staff import Staff
+
+ROLES = {"worker": 0.5, "cashier": 0.25, "projectionist": 0.15,
+         "manager": 0.1}
+TIMES = ["08:00", "13:00", "18:00"]
+
+
+def make_cinema(staff_count):
+    cinema = Cinema("Bench", "Street 1")
+    for i in range(staff_count):
+        role = random.Random(i).choices(list(ROLES),
+                                        weights=list(ROLES.values()))[0]
+        cinema.assign_staff(Staff(f"Name{i}", "Nowak", role))
+    return cinema
+
+
+def make_demand(staff_count, weeks, load):
+    first = date(2025, 6, 2)
+    per_slot = {role: int(staff_count * share * load / len(TIMES))
+                for role, share in ROLES.items()}
+    return {((first + timedelta(days=d)).isoformat(), time): dict(per_slot)
+            for d in range(7 * weeks) for time in TIMES}
+
+
+def main():
+    staff_count, weeks = 1_000, 4
+    cinema = make_cinema(staff_count)
+    for load in (0.5, 0.65, 0.7):
+        demand = make_demand(staff_count, weeks, load)
+        roster = cinema.plan_roster(demand, max_hours=5 * 5 * weeks,
+                                    max_days=5 * weeks)
+        required = sum(sum(roles.values()) for roles in demand.values())
+        missing = sum(roster.unfilled.values())
+        print(f"{staff_count} staff x {weeks} weeks, load {load:.2f}: "
+              f"{required} positions, {missing} unfilled, "
+              f"solved in {roster.elapsed:.3f} s")
+
+
+if __name__ == '__main__':
+    main()
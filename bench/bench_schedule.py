@@ -0,0 +1,28 @@
+import time
+from koncowy.bench.movies import make_movies
+from koncowy.src.cinema import Cinema
+from koncowy.src.staff import Staff
+
+
+def bench_choose_movies_to_play(schedule_size, lineup_size):
+    cinema = Cinema("Bench", "Street 1")
+    manager = Staff("Anna", "Nowak", "manager")
+    cinema.choose_movies_to_play(
+        manager, make_movies(schedule_size, "Old", duration=100))
+    lineup = make_movies(lineup_size, "New", duration=100)
+    start = time.perf_counter()
+    cinema.choose_movies_to_play(manager, lineup)
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'schedule':>10} {'lineup':>10} {'seconds':>10} {'us/movie':>10}")
+    for schedule_size, lineup_size in [(5_000, 2_000), (50_000, 20_000),
+                                       (200_000, 80_000)]:
+        elapsed = bench_choose_movies_to_play(schedule_size, lineup_size)
+        print(f"{schedule_size:>10} {lineup_size:>10} {elapsed:>10.4f} "
+              f"{elapsed / lineup_size * 1e6:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+import threading
+import time
+from koncowy.src.movie import Movie
+from koncowy.src.seating import Auditorium, Screening
+
+
+def make_screening(rows, seats):
+    movie = Movie("Movie", "Drama", 90, 0, "D", "EN", 2000, 7.0, "Desc")
+    return Screening(movie, Auditorium("Hall", rows, seats))
+
+
+def sell_out(screening, count):
+    operations = 0
+    while True:
+        try:
+            hold = screening.hold(count=count)
+        except ValueError:
+            return operations
+        screening.confirm(hold)
+        operations += 2
+
+
+def main():
+    for rows, seats, count in ((20, 30, 2), (40, 60, 4), (100, 200, 2)):
+        screening = make_screening(rows, seats)
+        start = time.perf_counter()
+        operations = sell_out(screening, count)
+        elapsed = time.perf_counter() - start
+        print(f"{rows}x{seats} by {count}: {operations} hold/confirm ops, "
+              f"{operations / elapsed:9.0f} ops/s")
+
+    for threads in (1, 4, 16):
+        screening = make_screening(100, 200)
+        counts = [0] * threads
+
+        def worker(slot):
+            counts[slot] = sell_out(screening, 2)
+
+        workers = [threading.Thread(target=worker, args=(slot,))
+                   for slot in range(threads)]
+        start = time.perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        print(f"{threads:2d} threads: {sum(counts) / elapsed:9.0f} ops/s, "
+              f"sold {screening.sold_count()} of "
+              f"{screening.auditorium.capacity}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import random
+import time
+from datetime import date, timedelta
+from koncowy.src.staff import Staff
+
+TIMES = ["08:00", "12:00", "16:00", "20:00"]
+
+
+def main():
+    rng = random.Random(8)
+    first = date(2005, 1, 1)
+    days = 20 * 365
+    staff = Staff("Anna", "Nowak", "worker")
+    start = time.perf_counter()
+    for d in rng.sample(range(days), days // 2):
+        staff.assign_shift((first + timedelta(days=d)).isoformat(),
+                           rng.choice(TIMES))
+    build_time = time.perf_counter() - start
+
+    ranges = []
+    for _ in range(1_000):
+        a = first + timedelta(days=rng.randrange(days - 31))
+        ranges.append((a.isoformat(), (a + timedelta(days=30)).isoformat()))
+
+    start = time.perf_counter()
+    for a, b in ranges[:100]:
+        sorted(s for s in staff.get_schedule() if a <= s.date <= b)
+    scan_time = (time.perf_counter() - start) / 100
+
+    start = time.perf_counter()
+    for a, b in ranges:
+        staff.get_shifts_between(a, b)
+    range_time = (time.perf_counter() - start) / len(ranges)
+
+    start = time.perf_counter()
+    for a, _ in ranges:
+        staff.next_shift(a, "12:00")
+    next_time = (time.perf_counter() - start) / len(ranges)
+
+    start = time.perf_counter()
+    for a, b in ranges:
+        staff.weekly_shift_counts(a, b)
+    week_time = (time.perf_counter() - start) / len(ranges)
+
+    print(f"shifts: {len(staff.shifts)} over 20 years")
+    print(f"assign all shifts:        {build_time:.3f} s")
+    print(f"30-day range, scan+sort:  {scan_time * 1e6:9.1f} us")
+    print(f"30-day range, calendar:   {range_time * 1e6:9.1f} us")
+    print(f"next shift:               {next_time * 1e6:9.1f} us")
+    print(f"weekly counts (30 days):  {week_time * 1e6:9.1f} us")
+
+
+if __name__ == '__main__':
+    main()
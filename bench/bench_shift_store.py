@@ -0,0 +1,51 @@
+import random
+import time
+from datetime import date, timedelta
+from koncowy.src.staff import Staff
+
+TIMES = ["08:00", "12:00", "16:00", "20:00"]
+
+
+def make_slots(days):
+    first = date(2020, 1, 1)
+    return [((first + timedelta(days=d)).isoformat(), time)
+            for d in range(days) for time in TIMES]
+
+
+def main():
+    slots = make_slots(3 * 365)
+    rng = random.Random(2)
+    assigned = rng.sample(slots, len(slots) // 2)
+    queries = [rng.choice(slots) for _ in range(100_000)]
+
+    shifts = list(assigned)
+    start = time.perf_counter()
+    for date_, time_ in queries[:2_000]:
+        (date_, time_) not in shifts
+    list_time = (time.perf_counter() - start) / 2_000
+    start = time.perf_counter()
+    for _ in range(200):
+        len(set(d for d, _ in shifts))
+    list_days_time = (time.perf_counter() - start) / 200
+
+    staff = Staff("Anna", "Nowak", "worker")
+    for date_, time_ in assigned:
+        staff.assign_shift(date_, time_)
+    start = time.perf_counter()
+    for date_, time_ in queries:
+        staff.is_available(date_, time_)
+    store_time = (time.perf_counter() - start) / len(queries)
+    start = time.perf_counter()
+    for _ in range(100_000):
+        staff.worked_days()
+    store_days_time = (time.perf_counter() - start) / 100_000
+
+    print(f"shifts: {len(assigned)}")
+    print(f"is_available list:  {list_time * 1e6:9.2f} us")
+    print(f"is_available store: {store_time * 1e6:9.2f} us")
+    print(f"worked_days list:   {list_days_time * 1e6:9.2f} us")
+    print(f"worked_days store:  {store_days_time * 1e6:9.2f} us")
+
+
+if __name__ == '__main__':
+    main()
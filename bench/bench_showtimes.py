@@ -0,0 +1,60 @@
+import random
+import time
+from datetime import datetime, timedelta
+from koncowy.src.movie import Movie
+from koncowy.src.showtime import Showtime, ShowtimeIndex
+
+
+def make_showtimes(screens, per_screen):
+    movies = [Movie(f"Movie {i}", "Drama", 60 + 10 * (i % 8), 0, "D", "EN",
+                    2000, 7.0, "Desc") for i in range(50)]
+    rng = random.Random(3)
+    showtimes = []
+    for screen in range(screens):
+        start = datetime(2025, 1, 1, 10)
+        for _ in range(per_screen):
+            showtime = Showtime(rng.choice(movies), screen, start)
+            showtimes.append(showtime)
+            start = showtime.end + timedelta(minutes=rng.choice((15, 30)))
+    return showtimes
+
+
+def main():
+    showtimes = make_showtimes(20, 5_000)
+    rng = random.Random(4)
+    first, last = showtimes[0].start, max(s.end for s in showtimes)
+    span = int((last - first).total_seconds() // 60)
+    windows = []
+    for _ in range(1_000):
+        start = first + timedelta(minutes=rng.randrange(span))
+        windows.append((start, start + timedelta(hours=3)))
+
+    start = time.perf_counter()
+    index = ShowtimeIndex(showtimes)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scanned = [[s for s in showtimes if s.overlaps(a, b)]
+               for a, b in windows[:50]]
+    scan_time = (time.perf_counter() - start) / 50
+
+    start = time.perf_counter()
+    found = [index.between(a, b) for a, b in windows]
+    index_time = (time.perf_counter() - start) / len(windows)
+    assert all(sorted(map(id, x)) == sorted(map(id, y))
+               for x, y in zip(scanned, found))
+
+    start = time.perf_counter()
+    for a, _ in windows:
+        index.clash(rng.randrange(20), a, a + timedelta(minutes=120))
+    clash_time = (time.perf_counter() - start) / len(windows)
+
+    print(f"showtimes: {len(index)} on {len(index.screens())} screens")
+    print(f"build index:        {build_time:.3f} s")
+    print(f"window query scan:  {scan_time * 1e6:9.1f} us")
+    print(f"window query index: {index_time * 1e6:9.1f} us")
+    print(f"clash check index:  {clash_time * 1e6:9.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+import os
+import tempfile
+import time
+from koncowy.src.cinema import Cinema
+from koncowy.src.movie import Movie
+
+GENRES = ["Drama", "Sci-Fi", "Comedy", "Horror", "Romance"]
+
+
+def make_cinema(count):
+    cinema = Cinema("Bench", "Street 1")
+    cinema.schedule = (Movie(f"Movie {i}", GENRES[i % len(GENRES)],
+                             80 + i % 90, i % 19, f"Director {i % 500}",
+                             "EN", 1950 + i % 75, (i % 100) / 10,
+                             f"Description of movie {i}")
+                       for i in range(count))
+    return cinema
+
+
+def timed(action):
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    json_path = os.path.join(directory, "schedule.json")
+    snapshot_path = os.path.join(directory, "schedule.snap")
+    print(f"{'movies':>9} {'format':>9} {'save s':>8} {'load s':>8} "
+          f"{'MiB':>8}")
+    for count in (10_000, 100_000, 1_000_000):
+        cinema = make_cinema(count)
+        formats = [
+            ("json", json_path,
+             lambda: cinema.save_to_json(json_path, indent=None),
+             lambda: Cinema.read_from_json(json_path)),
+            ("snapshot", snapshot_path,
+             lambda: cinema.save_to_snapshot(snapshot_path),
+             lambda: Cinema.read_from_snapshot(snapshot_path)),
+        ]
+        for name, path, save, load in formats:
+            save_time = timed(save)
+            load_time = timed(load)
+            size = os.path.getsize(path) / 2 ** 20
+            print(f"{count:>9} {name:>9} {save_time:>8.3f} "
+                  f"{load_time:>8.3f} {size:>8.1f}")
+        os.remove(json_path)
+        os.remove(snapshot_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+import random
+import time
+from datetime import date, timedelta
+from koncowy.src.cinema import Cinema
+from koncowy.src.staff import Staff
+
+ROLES = ["worker", "cashier", "projectionist", "manager"]
+TIMES = ["08:00", "12:00", "16:00", "20:00"]
+
+
+def make_cinema(staff_count, days):
+    rng = random.Random(6)
+    first = date(2025, 6, 1)
+    slots = [((first + timedelta(days=d)).isoformat(), time)
+             for d in range(days) for time in TIMES]
+    cinema = Cinema("Bench", "Street 1")
+    for i in range(staff_count):
+        staff = Staff(f"Name{i}", "Nowak", ROLES[i % len(ROLES)])
+        for slot in rng.sample(slots, len(slots) // 3):
+            staff.assign_shift(*slot)
+        cinema.assign_staff(staff)
+    return cinema, slots
+
+
+def main():
+    cinema, slots = make_cinema(2_000, 28)
+
+    start = time.perf_counter()
+    looped = {slot: [s for s in cinema.staff
+                     if s.position.lower() == "worker"
+                     and s.is_available(*slot)]
+              for slot in slots}
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = cinema.get_free_staff_for_slots(slots, "worker")
+    index_time = time.perf_counter() - start
+    assert looped == indexed
+
+    start = time.perf_counter()
+    for slot in slots:
+        cinema.get_free_staff(*slot, "manager")
+    single_time = (time.perf_counter() - start) / len(slots)
+
+    print(f"staff: {len(cinema.staff)}, slots: {len(slots)}")
+    print(f"loop over staff:          {loop_time:.3f} s")
+    print(f"get_free_staff_for_slots: {index_time:.3f} s")
+    print(f"get_free_staff per slot:  {single_time * 1e6:.1f} us")
+
+
+if __name__ == '__main__':
+    main()
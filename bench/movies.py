@@ -0,0 +1,10 @@
+from koncowy.src.movie import Movie
+
+GENRES = ["Drama", "Comedy", "Sci-Fi", "Horror", "Animation"]
+
+
+def make_movies(count, prefix="Movie", genres=("Drama",), duration=90,
+                director="D", description="Desc"):
+    return [Movie(f"{prefix} {i}", genres[i % len(genres)], duration, 0,
+                  director, "EN", 2000, 7.0, description)
+            for i in range(count)]
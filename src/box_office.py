@@ -0,0 +1,80 @@
+import asyncio
+import secrets
+from koncowy.src.cinema import Cinema
+
+
+class AsyncBoxOffice:
+    def __init__(self, cinemas=(), customers=()):
+        self._cinemas = {}
+        self._locks = {}
+        self._customers = {}
+        self._sessions = {}
+        for cinema in cinemas:
+            self.add_cinema(cinema)
+        for customer in customers:
+            self.add_customer(customer)
+
+    def add_cinema(self, cinema):
+        if cinema.name in self._cinemas:
+            raise ValueError("Cinema is already registered.")
+        self._cinemas[cinema.name] = cinema
+        self._locks[cinema.name] = asyncio.Lock()
+
+    def add_customer(self, customer):
+        if customer.email in self._customers:
+            raise ValueError("Customer is already registered.")
+        self._customers[customer.email] = customer
+
+    def cinema(self, name):
+        cinema = self._cinemas.get(name)
+        if cinema is None:
+            raise ValueError("Cinema '{}' not found.".format(name))
+        return cinema
+
+    def customer(self, token):
+        customer = self._sessions.get(token)
+        if customer is None:
+            raise PermissionError("Session is not logged in.")
+        return customer
+
+    async def login(self, email, password):
+        customer = self._customers.get(email)
+        if customer is None:
+            raise ValueError("Invalid login credentials.")
+        customer.login(email, password)
+        token = secrets.token_hex(16)
+        self._sessions[token] = customer
+        return token
+
+    async def logout(self, token):
+        self.customer(token)
+        del self._sessions[token]
+
+    async def browse(self, cinema_name, genre=None):
+        cinema = self.cinema(cinema_name)
+        if genre is None:
+            return list(cinema.schedule)
+        return cinema.get_movies_by_genre(genre)
+
+    async def buy_ticket(self, token, cinema_name, title):
+        customer = self.customer(token)
+        cinema = self.cinema(cinema_name)
+        async with self._locks[cinema_name]:
+            movie = cinema.get_movie_by_title(title)
+            cinema.sell_tickets([(customer, movie)])
+        return movie
+
+    async def save(self, cinema_name, filename):
+        cinema = self.cinema(cinema_name)
+        async with self._locks[cinema_name]:
+            await asyncio.to_thread(cinema.save_to_json, filename)
+
+    async def save_customer(self, token, filename):
+        customer = self.customer(token)
+        await asyncio.to_thread(customer.save_to_json, filename)
+
+    async def load(self, filename, registry=None):
+        cinema = await asyncio.to_thread(Cinema.read_from_json, filename,
+                                         registry)
+        self.add_cinema(cinema)
+        return cinema
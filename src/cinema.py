@@ -1,28 +1,114 @@
-import json
+import threading
+from contextlib import contextmanager
+from koncowy.src.json_stream import (dump_json, dump_json_lines,
+                                     iter_json_array, iter_json_lines,
+                                     iter_json_object)
 from koncowy.src.movie import Movie
+from koncowy.src.movie_registry import default_registry
+from koncowy.src.payroll import compute_payroll
+from koncowy.src.roster import solve_roster
+from koncowy.src.schedule import Schedule
+from koncowy.src.seating import Screening
+from koncowy.src.showtime import Showtime, ShowtimeIndex
+from koncowy.src.snapshot import read_snapshot, write_snapshot
+from koncowy.src.staff_registry import StaffRegistry
 
 
 class Cinema:
     def __init__(self, name, address):
         if not name or not address:
             raise ValueError("Cinema name and address cannot be empty.")
+        self._listeners = []
+        self._write_lock = threading.Lock()
         self.name = name
         self.address = address
+        self.screenings = []
+        self.showtimes = ShowtimeIndex()
         self.schedule = []
         self.staff = []
 
     def __str__(self):
         return f"Cinema: {self.name}, {self.address}"
 
+    @property
+    def schedule(self):
+        return self._schedule
+
+    @schedule.setter
+    def schedule(self, movies):
+        self._replace_schedule(Schedule(movies))
+        self._notify("schedule_changed")
+
+    def _replace_schedule(self, schedule):
+        with self._write_lock:
+            if hasattr(self, "_working"):
+                self._drop_movies([movie for movie in self._working
+                                   if movie not in schedule])
+            self._working = schedule
+            self._schedule = schedule.copy().freeze()
+
+    def _drop_movies(self, movies):
+        if not movies:
+            return
+        movies = set(movies)
+        self.showtimes.remove_movies(movies)
+        screenings = []
+        for screening in self.screenings:
+            if screening.movie in movies:
+                screening.cancel()
+            else:
+                screenings.append(screening)
+        self.screenings = screenings
+
+    @contextmanager
+    def _editing_schedule(self):
+        with self._write_lock:
+            try:
+                yield self._working
+            finally:
+                self._schedule = self._working.copy().freeze()
+
+    def add_listener(self, listener):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self._listeners.remove(listener)
+
+    def _notify(self, event, *args):
+        for listener in list(self._listeners):
+            listener(self, event, *args)
+
+    @property
+    def staff(self):
+        return self._staff
+
+    @staff.setter
+    def staff(self, staff):
+        if hasattr(self, "_staff"):
+            self._staff.clear()
+        self._staff = StaffRegistry(staff)
+
     def assign_staff(self, staff_member):
         if staff_member is None:
             raise ValueError("Staff member cannot be None.")
-        self.staff.append(staff_member)
+        self._staff.add(staff_member)
 
     def get_staff_by_role(self, role):
         if not role or not isinstance(role, str):
             raise ValueError("Invalid role.")
-        return [s for s in self.staff if s.position.lower() == role.lower()]
+        return self._staff.by_role(role)
+
+    def get_free_staff(self, date, time, role=None):
+        return self._staff.free_at(date, time, role)
+
+    def get_free_staff_for_slots(self, slots, role=None):
+        return self._staff.free_for_slots(slots, role)
+
+    def payroll(self, start_date=None, end_date=None):
+        return compute_payroll(self._staff, start_date, end_date)
+
+    def plan_roster(self, demand, **constraints):
+        return solve_roster(self._staff, demand, **constraints)
 
     def add_staff_member(self, staff_member_requesting, staff_member_to_add):
         if staff_member_requesting is None or staff_member_to_add is None:
@@ -31,25 +117,69 @@ class Cinema:
             raise PermissionError("Only managers can add staff members.")
         if staff_member_to_add in self.staff:
             raise ValueError("Staff member is already added.")
-        self.staff.append(staff_member_to_add)
+        self._staff.add(staff_member_to_add)
 
     def add_movie(self, staff_member, movie):
         if staff_member is None or movie is None:
             raise ValueError("Staff member and movie cannot be None.")
         if staff_member.position.lower() != "manager":
             raise PermissionError("Only managers can add movies.")
-        if movie in self.schedule:
-            raise ValueError("Movie is already in the schedule.")
-        self.schedule.append(movie)
+        with self._editing_schedule() as schedule:
+            if not schedule.add(movie):
+                raise ValueError("Movie is already in the schedule.")
+        self._notify("schedule_changed")
 
     def remove_movie(self, staff_member, movie):
         if staff_member is None or movie is None:
             raise ValueError("Staff member and movie cannot be None.")
         if staff_member.position.lower() != "manager":
             raise PermissionError("Only managers can remove movies.")
-        if movie not in self.schedule:
-            raise ValueError("Movie not found in schedule.")
-        self.schedule.remove(movie)
+        with self._editing_schedule() as schedule:
+            schedule.remove(movie)
+            self._drop_movies([movie])
+        self._notify("schedule_changed")
+
+    def add_screening(self, staff_member, movie, auditorium, **options):
+        if staff_member is None or movie is None or auditorium is None:
+            raise ValueError("Staff member, movie and auditorium "
+                             "cannot be None.")
+        if staff_member.position.lower() != "manager":
+            raise PermissionError("Only managers can add screenings.")
+        screening = Screening(movie, auditorium, **options)
+        with self._write_lock:
+            if movie not in self._working:
+                raise ValueError("Movie not found in schedule.")
+            self.screenings.append(screening)
+        return screening
+
+    def get_screenings(self, movie):
+        return [screening for screening in self.screenings
+                if screening.movie is movie]
+
+    def add_showtime(self, staff_member, movie, screen, start):
+        if staff_member is None or movie is None:
+            raise ValueError("Staff member and movie cannot be None.")
+        if staff_member.position.lower() != "manager":
+            raise PermissionError("Only managers can add showtimes.")
+        showtime = Showtime(movie, screen, start)
+        with self._write_lock:
+            if movie not in self._working:
+                raise ValueError("Movie not found in schedule.")
+            self.showtimes.add(showtime)
+        return showtime
+
+    def remove_showtime(self, staff_member, showtime):
+        if staff_member is None or showtime is None:
+            raise ValueError("Staff member and showtime cannot be None.")
+        if staff_member.position.lower() != "manager":
+            raise PermissionError("Only managers can remove showtimes.")
+        with self._write_lock:
+            self.showtimes.remove(showtime)
+
+    def get_showtimes_between(self, start, end, screen=None):
+        if start >= end:
+            raise ValueError("Start must be before end.")
+        return self.showtimes.between(start, end, screen)
 
     def remove_all_movies(self, staff):
         if not staff or staff.position.lower() != "manager":
@@ -63,31 +193,52 @@ class Cinema:
             raise ValueError("Movies must be provided as a list.")
         if staff_member.position.lower() != "manager":
             raise PermissionError("Only managers can choose movies to play.")
-        for movie in movies:
-            if movie is None:
-                raise ValueError("Movie in selection cannot be None.")
-            if movie not in self.schedule:
-                self.schedule.append(movie)
+        if any(movie is None for movie in movies):
+            raise ValueError("Movie in selection cannot be None.")
+        with self._editing_schedule() as schedule:
+            added = [movie for movie in movies if schedule.add(movie)]
+        if added:
+            self._notify("schedule_changed")
+
+    def sell_tickets(self, pairs):
+        pairs = list(pairs)
+        orders = {}
+        schedule = self.schedule
+        for customer, movie in pairs:
+            if customer is None:
+                raise ValueError("Customer cannot be None.")
+            customer._validate_ticket(movie)
+            if movie not in schedule:
+                raise ValueError("Movie not found in schedule.")
+            orders.setdefault(customer, []).append(movie)
+        for customer, movies in orders.items():
+            customer._record_tickets(movies)
+        Movie.watch_all(movie for _, movie in pairs)
+        for customer, movies in orders.items():
+            customer._notify("tickets_bought", movies)
+        return len(pairs)
 
     def list_movies(self):
         return [movie.title for movie in self.schedule]
 
     def has_movie(self, title):
-        return any(movie.title == title for movie in self.schedule)
+        if not isinstance(title, str):
+            return False
+        return any(movie.title == title
+                   for movie in self.schedule.by_title(title))
 
     def get_movie_by_title(self, title):
         if not title or not isinstance(title, str):
             raise ValueError("Invalid movie title.")
-        for movie in self.schedule:
-            if movie.title.lower() == title.lower():
-                return movie
+        movie = self.schedule.first_by_title(title)
+        if movie is not None:
+            return movie
         raise ValueError("Movie titled '{}' not found.".format(title))
 
     def get_movies_by_genre(self, genre):
         if not genre:
             raise ValueError("Genre cannot be empty.")
-        return [movie for movie in self.schedule
-                if movie.genre.lower() == genre.lower()]
+        return self.schedule.by_genre(genre)
 
     def list_current_movies(self):
         return [movie.short_description() for movie in self.schedule]
@@ -99,16 +250,12 @@ class Cinema:
         self.schedule = []
 
     def count_movies_by_genre(self):
-        genres = {}
-        for m in self.schedule:
-            genres[m.genre] = genres.get(m.genre, 0) + 1
-        return genres
+        return self.schedule.genre_counts()
 
     def remove_staff_member_by_name(self,
                                     first_name, last_name):
-        self.staff = [s for s in self.staff
-                      if not (s.first_name == first_name
-                              and s.last_name == last_name)]
+        for staff_member in self._staff.by_name(first_name, last_name):
+            self._staff.remove(staff_member)
 
     def to_dict(self):
         return {
@@ -122,33 +269,72 @@ class Cinema:
         with open(filename, 'w') as f:
             f.write(str(self))
 
-    def save_to_json(self, filename):
+    def _iter_schedule_dicts(self):
+        return (movie.to_dict() for movie in self.schedule)
+
+    def save_to_json(self, filename, indent=4):
+        data = {
+            "name": self.name,
+            "address": self.address,
+            "schedule": self._iter_schedule_dicts(),
+            "staff": (str(staff) for staff in self.staff)
+        }
+        with open(filename, 'w') as f:
+            dump_json(data, f, indent=indent)
+
+    def export_schedule_to_json(self, filename, indent=4):
         with open(filename, 'w') as f:
-            json.dump(self.to_dict(), f, indent=4)  # type: ignore
+            dump_json(self._iter_schedule_dicts(), f, indent=indent)
 
-    def export_schedule_to_json(self, filename):
+    def export_schedule_to_jsonl(self, filename):
         with open(filename, 'w') as f:
-            json.dump([movie.to_dict() for movie
-                       in self.schedule], f,  # type: ignore
-                      indent=4)
+            dump_json_lines(self._iter_schedule_dicts(), f)
+
+    def save_to_snapshot(self, filename):
+        with open(filename, 'wb') as f:
+            write_snapshot(f, self.name, self.address, self.schedule)
+
+    @staticmethod
+    def read_from_snapshot(filename, registry=None):
+        registry = default_registry if registry is None else registry
+        with open(filename, 'rb') as f:
+            name, address, movies = read_snapshot(f)
+        cinema = Cinema(name, address)
+        cinema._replace_schedule(Schedule(registry.intern(movie)
+                                          for movie in movies))
+        return cinema
+
+    def import_schedule_from_jsonl(self, staff_member, filename,
+                                   batch_size=1000):
+        for movies in Cinema.iter_movies_from_jsonl(filename, batch_size):
+            self.choose_movies_to_play(staff_member, movies)
+
+    @staticmethod
+    def iter_movies_from_json(filename, registry=None):
+        registry = default_registry if registry is None else registry
+        with open(filename, 'r') as f:
+            for m in iter_json_array(f, key='schedule'):
+                yield registry.movie_from_dict(m)
+
+    @staticmethod
+    def iter_movies_from_jsonl(filename, batch_size=1000, registry=None):
+        registry = default_registry if registry is None else registry
+        with open(filename, 'r') as f:
+            for batch in iter_json_lines(f, batch_size):
+                yield [registry.movie_from_dict(m) for m in batch]
 
     @staticmethod
-    def read_from_json(filename):
+    def read_from_json(filename, registry=None):
+        registry = default_registry if registry is None else registry
+        fields = {}
+        schedule = Schedule()
         with open(filename, 'r') as f:
-            data = json.load(f)
-            cinema = Cinema(data['name'], data['address'])
-            cinema.schedule = [
-                Movie(
-                    title=m['title'],
-                    genre=m['genre'],
-                    duration=m['duration'],
-                    age_restriction=m['age_restriction'],
-                    director=m['director'],
-                    language=m['language'],
-                    release_year=m['release_year'],
-                    rating=m['rating'],
-                    description=m['description']
-                )
-                for m in data.get('schedule', [])
-            ]
-            return cinema
+            for key, value in iter_json_object(f, stream_keys=('schedule',)):
+                if key == 'schedule':
+                    for m in value or ():
+                        schedule.add(registry.movie_from_dict(m))
+                elif key in ('name', 'address'):
+                    fields[key] = value
+        cinema = Cinema(fields['name'], fields['address'])
+        cinema._replace_schedule(schedule)
+        return cinema
@@ -1,6 +1,7 @@
 import json
 import re
 from koncowy.src.movie import Movie
+from koncowy.src.movie_registry import default_registry
 
 
 class Customer:
@@ -10,6 +11,7 @@ class Customer:
         if not Customer._validate_email(email):
             raise ValueError("Invalid email format.")
 
+        self._listeners = []
         self.first_name = first_name
         self.last_name = last_name
         self.age = age
@@ -19,6 +21,45 @@ class Customer:
         self.ticket_history = []
         self.loyalty_points = 0
 
+    @property
+    def ticket_history(self):
+        if self._history_view is None:
+            self._history_view = tuple(self._ticket_history)
+        return self._history_view
+
+    @ticket_history.setter
+    def ticket_history(self, movies):
+        old_history = getattr(self, "_ticket_history", [])
+        self._ticket_history = list(movies)
+        self._history_view = None
+        self._genre_counts = {}
+        self._genre_order = {}
+        self._favourite_genre = None
+        for movie in self._ticket_history:
+            self._count_genre(movie.genre)
+        self._notify("history_replaced", old_history)
+
+    def add_listener(self, listener):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self._listeners.remove(listener)
+
+    def _notify(self, event, *args):
+        for listener in list(self._listeners):
+            listener(self, event, *args)
+
+    def _count_genre(self, genre):
+        count = self._genre_counts.get(genre, 0) + 1
+        self._genre_counts[genre] = count
+        order = self._genre_order.setdefault(genre, len(self._genre_order))
+        favourite = self._favourite_genre
+        if (favourite is None
+                or count > self._genre_counts[favourite]
+                or (count == self._genre_counts[favourite]
+                    and order < self._genre_order[favourite])):
+            self._favourite_genre = genre
+
     @staticmethod
     def _validate_email(email):
         return re.match(r"[^@]+@[^@]+\.[^@]+", email)
@@ -39,15 +80,41 @@ class Customer:
             return True
         raise ValueError("Invalid login credentials.")
 
-    def buy_ticket(self, movie):
+    def _validate_ticket(self, movie):
         if not isinstance(movie, Movie):
             raise ValueError("Invalid movie object.")
         if self.age < movie.age_restriction:
             raise ValueError("Customer does not meet the "
                              "age restriction for this movie.")
-        self.ticket_history.append(movie)
-        movie.watch()
-        self.loyalty_points += 10
+
+    def _record_tickets(self, movies):
+        self._ticket_history.extend(movies)
+        self._history_view = None
+        for movie in movies:
+            self._count_genre(movie.genre)
+        self.loyalty_points += 10 * len(movies)
+
+    def buy_ticket(self, movie, hold=None):
+        self._validate_ticket(movie)
+        movies = [movie]
+        if hold is not None:
+            if hold.screening.movie is not movie:
+                raise ValueError("Hold is for a different movie.")
+            movies = [movie] * len(hold.screening.confirm(hold))
+        self._record_tickets(movies)
+        movie.watch(len(movies))
+        self._notify("tickets_bought", movies)
+        return True
+
+    def buy_tickets(self, movies):
+        movies = list(movies)
+        for movie in movies:
+            self._validate_ticket(movie)
+        if not movies:
+            return True
+        self._record_tickets(movies)
+        Movie.watch_all(movies)
+        self._notify("tickets_bought", movies)
         return True
 
     def get_watch_history(self):
@@ -65,14 +132,18 @@ class Customer:
         self.loyalty_points = 0
 
     def recommend_movie(self, cinema):
-        if not self.ticket_history:
+        fav_genre = self.favourite_genre()
+        if fav_genre is None:
             return None
-        fav_genre = max(set(m.genre for m in self.ticket_history),
-                        key=lambda g: sum(1 for m in
-                                          self.ticket_history if m.genre == g))
         recommended = cinema.get_movies_by_genre(fav_genre)
         return recommended[0] if recommended else None
 
+    def favourite_genre(self):
+        return self._favourite_genre
+
+    def genre_counts(self):
+        return dict(self._genre_counts)
+
     def has_ticket_for(self, movie_title):
         return any(m.title == movie_title for m in self.ticket_history)
 
@@ -110,7 +181,8 @@ class Customer:
             json.dump(self.to_dict(), f, indent=4)  # type: ignore
 
     @staticmethod
-    def read_from_json(filename):
+    def read_from_json(filename, registry=None):
+        registry = default_registry if registry is None else registry
         with open(filename, 'r') as f:
             data = json.load(f)
             customer = Customer(
@@ -123,17 +195,7 @@ class Customer:
             customer.is_active = data.get('is_active', False)
             customer.loyalty_points = data.get('loyalty_points', 0)
             customer.ticket_history = [
-                Movie(
-                    m['title'],
-                    m['genre'],
-                    m['duration'],
-                    m['age_restriction'],
-                    m['director'],
-                    m['language'],
-                    m['release_year'],
-                    m['rating'],
-                    m['description']
-                )
+                registry.movie_from_dict(m)
                 for m in data.get('watch_history', [])
             ]
             return customer
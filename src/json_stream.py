@@ -0,0 +1,195 @@
+import json
+
+COMPACT_SEPARATORS = (",", ":")
+NUMBER_CHARS = frozenset("0123456789+-.eE")
+
+
+def _is_stream(value):
+    return hasattr(value, "__next__")
+
+
+def _has_stream(value):
+    if _is_stream(value):
+        return True
+    if isinstance(value, dict):
+        return any(_has_stream(item) for item in value.values())
+    return False
+
+
+def _dumps(value, indent, level):
+    if indent is None:
+        return json.dumps(value, separators=COMPACT_SEPARATORS)
+    if isinstance(value, dict) and value:
+        opening, closing = "{", "}"
+        items = (json.dumps(key) + ": " + _dumps(item, indent, level + 1)
+                 for key, item in value.items())
+    elif isinstance(value, (list, tuple)) and value:
+        opening, closing = "[", "]"
+        items = (_dumps(item, indent, level + 1) for item in value)
+    else:
+        return json.dumps(value)
+    item_prefix = "\n" + " " * (indent * (level + 1))
+    return (opening + item_prefix + ("," + item_prefix).join(items)
+            + "\n" + " " * (indent * level) + closing)
+
+
+def iter_json(value, indent=None, level=0):
+    if isinstance(value, dict) and _has_stream(value):
+        yield from _iter_container("{", "}", value.items(), indent, level)
+    elif _is_stream(value):
+        yield from _iter_container("[", "]", value, indent, level)
+    else:
+        yield _dumps(value, indent, level)
+
+
+def _iter_container(opening, closing, items, indent, level):
+    if indent is None:
+        item_prefix, closing_prefix = "", ""
+        key_separator = COMPACT_SEPARATORS[1]
+    else:
+        item_prefix = "\n" + " " * (indent * (level + 1))
+        closing_prefix = "\n" + " " * (indent * level)
+        key_separator = ": "
+    yield opening
+    empty = True
+    for item in items:
+        yield item_prefix if empty else "," + item_prefix
+        empty = False
+        if opening == "{":
+            key, item = item
+            yield json.dumps(key) + key_separator
+        yield from iter_json(item, indent, level + 1)
+    yield closing if empty else closing_prefix + closing
+
+
+def dump_json(value, f, indent=None):
+    for chunk in iter_json(value, indent):
+        f.write(chunk)
+
+
+def dump_json_lines(items, f):
+    for item in items:
+        f.write(json.dumps(item, separators=COMPACT_SEPARATORS))
+        f.write("\n")
+
+
+class _StreamReader:
+    def __init__(self, f, chunk_size):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, size):
+        if self._eof:
+            return False
+        chunk = self._f.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self):
+        while True:
+            buffer, pos = self._buffer, self._pos
+            while pos < len(buffer) and buffer[pos] in " \t\n\r":
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'",
+                                       self._buffer, self._pos)
+        self._pos += 1
+
+    def value(self):
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill(size):
+                    raise
+                size *= 2
+                continue
+            if ((end == len(self._buffer)
+                 or self._buffer[end] in NUMBER_CHARS)
+                    and self._fill(size)):
+                continue
+            self._pos = end
+            return value
+
+    def items(self, closing, read_item):
+        if self.peek() == closing:
+            self._pos += 1
+            return
+        while True:
+            yield read_item()
+            separator = self.peek()
+            self._pos += 1
+            if separator == closing:
+                return
+            if separator != ",":
+                raise json.JSONDecodeError(
+                    f"Expecting ',' or '{closing}'",
+                    self._buffer, self._pos - 1)
+
+
+def iter_json_array(f, key=None, chunk_size=65536):
+    reader = _StreamReader(f, chunk_size)
+    if key is None or reader.peek() == "[":
+        reader.expect("[")
+        yield from reader.items("]", reader.value)
+        return
+    for name, value in _iter_object(reader, (key,)):
+        if name == key and value:
+            yield from value
+
+
+def iter_json_object(f, stream_keys=(), chunk_size=65536):
+    return _iter_object(_StreamReader(f, chunk_size), stream_keys)
+
+
+def _iter_object(reader, stream_keys):
+    reader.expect("{")
+
+    def read_pair():
+        key = reader.value()
+        reader.expect(":")
+        if key in stream_keys and reader.peek() == "[":
+            reader.expect("[")
+            return key, reader.items("]", reader.value)
+        return key, reader.value()
+
+    for key, value in reader.items("}", read_pair):
+        yield key, value
+        if _is_stream(value):
+            for _ in value:
+                pass
+
+
+def iter_json_lines(f, batch_size=None):
+    batch = []
+    for line in f:
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        if batch_size is None:
+            yield item
+            continue
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
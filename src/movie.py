@@ -1,7 +1,16 @@
 import json
+import threading
+
+_SHARD_LOCK = threading.Lock()
 
 
 class Movie:
+    FIELDS = ("title", "genre", "duration", "age_restriction", "director",
+              "language", "release_year", "rating", "description")
+    __slots__ = FIELDS + ("_views", "_view_shards", "__weakref__")
+    CLASSIC_BEFORE_YEAR = 2000
+    HIGH_RATING = 8.0
+
     def __init__(self, title, genre, duration, age_restriction,
                  director, language, release_year, rating, description):
         if duration <= 0:
@@ -21,10 +30,65 @@ class Movie:
         self.release_year = release_year
         self.rating = rating
         self.description = description
-        self.views = 0
+        self._views = 0
+        self._view_shards = None
+
+    @classmethod
+    def _unchecked(cls, title, genre, duration, age_restriction, director,
+                   language, release_year, rating, description, views=0):
+        movie = cls.__new__(cls)
+        movie.title = title
+        movie.genre = genre
+        movie.duration = duration
+        movie.age_restriction = age_restriction
+        movie.director = director
+        movie.language = language
+        movie.release_year = release_year
+        movie.rating = rating
+        movie.description = description
+        movie._views = views
+        movie._view_shards = None
+        return movie
 
-    def watch(self):
-        self.views += 1
+    def identity(self):
+        return self.title, self.director, self.release_year
+
+    @property
+    def views(self):
+        shards = self._view_shards
+        if shards is None:
+            return self._views
+        return self._views + sum(cell[0] for cell in shards.values())
+
+    @views.setter
+    def views(self, value):
+        with _SHARD_LOCK:
+            self._views = value
+            self._view_shards = None
+
+    def _view_shard(self):
+        with _SHARD_LOCK:
+            shards = dict(self._view_shards or {})
+            cell = shards.setdefault(threading.get_ident(), [0])
+            self._view_shards = shards
+        return cell
+
+    def watch(self, times=1):
+        if times < 0:
+            raise ValueError("Views cannot decrease.")
+        shards = self._view_shards
+        cell = None if shards is None else shards.get(threading.get_ident())
+        if cell is None:
+            cell = self._view_shard()
+        cell[0] += times
+
+    @staticmethod
+    def watch_all(movies):
+        views = {}
+        for movie in movies:
+            views[movie] = views.get(movie, 0) + 1
+        for movie, count in views.items():
+            movie.watch(count)
 
     def is_suitable_for_age(self, age):
         if age < 0:
@@ -35,7 +99,7 @@ class Movie:
         return f"{self.title} ({self.genre}, {self.release_year})"
 
     def is_classic(self):
-        return self.release_year < 2000
+        return self.release_year < self.CLASSIC_BEFORE_YEAR
 
     def increase_rating(self, value):
         if value < 0:
@@ -43,7 +107,7 @@ class Movie:
         self.rating = min(10, self.rating + value)
 
     def is_highly_rated(self):
-        return self.rating >= 8.0
+        return self.rating >= self.HIGH_RATING
 
     def is_in_language(self, language):
         if not language:
@@ -59,7 +123,9 @@ class Movie:
         self.description = new_description
 
     def to_dict(self):
-        return self.__dict__
+        data = {field: getattr(self, field) for field in self.FIELDS}
+        data["views"] = self.views
+        return data
 
     def save_to_file(self, filename):
         with open(filename, 'w') as f:
@@ -75,7 +141,8 @@ class Movie:
             data = json.load(f)
         views = data.pop("views", 0)
         movie = Movie(**data)
-        movie.views = views
+        movie._views = views
+        movie._view_shards = None
         return movie
 
     def __str__(self):
@@ -0,0 +1,45 @@
+import weakref
+from koncowy.src.movie import Movie
+
+
+class MovieRegistry:
+    def __init__(self):
+        self._movies = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        return len(self._movies)
+
+    def __contains__(self, movie):
+        return self._movies.get(movie.identity()) is movie
+
+    def get(self, title, director, release_year):
+        return self._movies.get((title, director, release_year))
+
+    @staticmethod
+    def _matches(movie, data):
+        return all(getattr(movie, field) == data[field]
+                   for field in Movie.FIELDS)
+
+    # Data that differs from the canonical instance (a newer file, or a
+    # movie edited after loading) is returned as a separate, un-interned
+    # movie: the canonical instance is never overwritten and never lost.
+    def intern(self, movie):
+        canonical = self._movies.setdefault(movie.identity(), movie)
+        if canonical is movie or self._matches(canonical, movie.to_dict()):
+            return canonical
+        return movie
+
+    def movie_from_dict(self, data):
+        key = (data['title'], data['director'], data['release_year'])
+        movie = self._movies.get(key)
+        if movie is not None and self._matches(movie, data):
+            return movie
+        loaded = Movie(**{field: data[field] for field in Movie.FIELDS})
+        return loaded if movie is not None else self._movies.setdefault(
+            key, loaded)
+
+    def clear(self):
+        self._movies.clear()
+
+
+default_registry = MovieRegistry()
@@ -0,0 +1,67 @@
+import numpy as np
+from koncowy.src.movie import Movie
+
+
+class MovieTable:
+    def __init__(self, movies):
+        self._movies = list(movies)
+        self.rating = np.fromiter((m.rating for m in self._movies),
+                                  dtype=np.float64, count=len(self._movies))
+        self.release_year = np.fromiter(
+            (m.release_year for m in self._movies),
+            dtype=np.int64, count=len(self._movies))
+        self.age_restriction = np.fromiter(
+            (m.age_restriction for m in self._movies),
+            dtype=np.float64, count=len(self._movies))
+        self._languages = {}
+        self.language = np.fromiter(
+            (self._languages.setdefault(m.language.lower(),
+                                        len(self._languages))
+             for m in self._movies),
+            dtype=np.int32, count=len(self._movies))
+
+    @classmethod
+    def from_cinema(cls, cinema):
+        return cls(cinema.schedule)
+
+    def __len__(self):
+        return len(self._movies)
+
+    def is_classic(self):
+        return self.release_year < Movie.CLASSIC_BEFORE_YEAR
+
+    def is_highly_rated(self):
+        return self.rating >= Movie.HIGH_RATING
+
+    def is_in_language(self, language):
+        if not language:
+            raise ValueError("Language cannot be empty.")
+        code = self._languages.get(language.lower())
+        if code is None:
+            return np.zeros(len(self._movies), dtype=bool)
+        return self.language == code
+
+    def is_suitable_for_age(self, age):
+        if age < 0:
+            raise ValueError("Age cannot be negative.")
+        return self.age_restriction <= age
+
+    def filter(self, classic=None, highly_rated=None, language=None,
+               age=None):
+        mask = np.ones(len(self._movies), dtype=bool)
+        if classic is not None:
+            mask &= self.is_classic() == classic
+        if highly_rated is not None:
+            mask &= self.is_highly_rated() == highly_rated
+        if language is not None:
+            mask &= self.is_in_language(language)
+        if age is not None:
+            mask &= self.is_suitable_for_age(age)
+        return mask
+
+    @staticmethod
+    def indices(mask):
+        return np.flatnonzero(mask)
+
+    def movies(self, mask):
+        return [self._movies[i] for i in np.flatnonzero(mask)]
@@ -0,0 +1,65 @@
+from array import array
+from datetime import date as Date
+import numpy as np
+
+
+class PayrollReport:
+    def __init__(self, staff, hours, roles, role_hours, weeks,
+                 weekly_hours):
+        self.staff = staff
+        self.hours = hours
+        self.roles = roles
+        self.role_hours = role_hours
+        self.weeks = weeks
+        self.weekly_hours = weekly_hours
+        self._rows = {staff_member: row
+                      for row, staff_member in enumerate(staff)}
+
+    def hours_for(self, staff_member):
+        return float(self.hours[self._rows[staff_member]])
+
+    def weekly_hours_for(self, staff_member):
+        row = self.weekly_hours[self._rows[staff_member]]
+        return dict(zip(self.weeks, row.tolist()))
+
+    def hours_by_role(self):
+        return dict(zip(self.roles, self.role_hours.tolist()))
+
+    def hours_by_week(self):
+        return dict(zip(self.weeks, self.weekly_hours.sum(axis=0).tolist()))
+
+
+def compute_payroll(staff, start=None, end=None):
+    staff = list(dict.fromkeys(staff))
+    roles = {}
+    role_codes = np.fromiter(
+        (roles.setdefault(staff_member.position.lower(), len(roles))
+         for staff_member in staff), dtype=np.int64, count=len(staff))
+    ordinals, minutes, counts = array("q"), array("q"), []
+    for staff_member in staff:
+        days, durations = staff_member.shifts.minutes_by_day(start, end)
+        ordinals += days
+        minutes += durations
+        counts.append(len(days))
+    ordinals = np.frombuffer(ordinals, dtype=np.int64)
+    hours = np.frombuffer(minutes, dtype=np.int64) / 60
+    rows = np.repeat(np.arange(len(staff)), counts)
+
+    staff_hours = np.bincount(rows, weights=hours, minlength=len(staff))
+    role_hours = np.bincount(role_codes, weights=staff_hours,
+                             minlength=len(roles))
+    if len(ordinals):
+        week_starts = ordinals - (ordinals - 1) % 7
+        first = int(week_starts.min())
+        columns = (week_starts - first) // 7
+        week_count = int(columns.max()) + 1
+        weekly = np.bincount(rows * week_count + columns, weights=hours,
+                             minlength=len(staff) * week_count)
+        weekly = weekly.reshape(len(staff), week_count)
+        weeks = [Date.fromordinal(first + 7 * i).isoformat()
+                 for i in range(week_count)]
+    else:
+        weekly = np.zeros((len(staff), 0))
+        weeks = []
+    return PayrollReport(staff, staff_hours, list(roles), role_hours,
+                         weeks, weekly)
@@ -0,0 +1,238 @@
+import heapq
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+import numpy as np
+
+
+def _count_matrix(histograms):
+    genres = {}
+    rows, columns, counts, ranks = [], [], [], []
+    for row, histogram in enumerate(histograms):
+        for rank, (genre, count) in enumerate(histogram.items()):
+            rows.append(row)
+            columns.append(genres.setdefault(genre, len(genres)))
+            counts.append(count)
+            ranks.append(rank)
+    shape = (len(histograms), len(genres))
+    count_matrix = np.zeros(shape, dtype=np.int64)
+    count_matrix[rows, columns] = counts
+    first_seen = np.full(shape, np.iinfo(np.int64).max)
+    first_seen[rows, columns] = ranks
+    return list(genres), count_matrix, first_seen
+
+
+def _favourites(histograms):
+    genres, counts, first_seen = _count_matrix(histograms)
+    if not genres:
+        return [None] * len(histograms)
+    best = counts.max(axis=1)
+    candidates = np.where(counts == best[:, None], first_seen,
+                          np.iinfo(np.int64).max)
+    choice = candidates.argmin(axis=1)
+    return [genres[column] if count else None
+            for column, count in zip(choice.tolist(), best.tolist())]
+
+
+def genre_count_matrix(customers):
+    return _count_matrix([c.genre_counts() for c in customers])
+
+
+def favourite_genres(customers):
+    return _favourites([c.genre_counts() for c in customers])
+
+
+def _chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def recommend_movies(customers, cinema, processes=None, chunk_size=10000):
+    histograms = [c.genre_counts() for c in customers]
+    if processes and len(histograms) > chunk_size:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            parts = executor.map(_favourites,
+                                 _chunks(histograms, chunk_size))
+            genres = [genre for part in parts for genre in part]
+    else:
+        genres = _favourites(histograms)
+    recommended = {}
+    for genre in set(genres) - {None}:
+        movies = cinema.get_movies_by_genre(genre)
+        recommended[genre] = movies[0] if movies else None
+    return [recommended.get(genre) for genre in genres]
+
+
+class CoOccurrenceRecommender:
+    def __init__(self, customers=(), neighbourhood=50):
+        self.neighbourhood = neighbourhood
+        self._neighbours = {}
+        self._top_neighbours = {}
+        self._histories = {}
+        for customer in customers:
+            self.track(customer)
+
+    def track(self, customer):
+        if customer in self._histories:
+            return
+        self._histories[customer] = {}
+        for movie in customer.ticket_history:
+            self._add(customer, movie)
+        customer.add_listener(self._on_customer_event)
+
+    def untrack(self, customer):
+        customer.remove_listener(self._on_customer_event)
+        self._forget(customer)
+        del self._histories[customer]
+
+    def co_occurrence(self, movie, other):
+        return self._neighbours.get(movie, {}).get(other, 0)
+
+    def recommend(self, customer, cinema, k=5, recent=50):
+        history = self._histories.get(customer)
+        if not history or k <= 0:
+            return []
+        seen = list(history)
+        if recent is not None:
+            seen = seen[-recent:]
+        scores = {}
+        for movie in seen:
+            for other, count in self._closest(movie):
+                scores[other] = scores.get(other, 0) + count
+        schedule = cinema.schedule
+        recommended = []
+        for movie in sorted(scores, key=scores.__getitem__, reverse=True):
+            if (movie not in history and movie in schedule
+                    and customer.can_watch(movie)):
+                recommended.append(movie)
+                if len(recommended) == k:
+                    break
+        return recommended
+
+    def _closest(self, movie):
+        neighbours = self._neighbours.get(movie, {})
+        if self.neighbourhood is None:
+            return neighbours.items()
+        closest = self._top_neighbours.get(movie)
+        if closest is None:
+            closest = heapq.nlargest(self.neighbourhood, neighbours.items(),
+                                     key=itemgetter(1))
+            self._top_neighbours[movie] = closest
+        return closest
+
+    def _add(self, customer, movie):
+        history = self._histories[customer]
+        if movie in history:
+            del history[movie]
+            history[movie] = None
+            return
+        neighbours = self._neighbours.setdefault(movie, {})
+        for other in history:
+            neighbours[other] = neighbours.get(other, 0) + 1
+            other_neighbours = self._neighbours[other]
+            other_neighbours[movie] = other_neighbours.get(movie, 0) + 1
+            self._top_neighbours.pop(other, None)
+        self._top_neighbours.pop(movie, None)
+        history[movie] = None
+
+    def _forget(self, customer):
+        history = self._histories[customer]
+        seen = list(history)
+        for i, movie in enumerate(seen):
+            self._top_neighbours.pop(movie, None)
+            for other in seen[i + 1:]:
+                for a, b in ((movie, other), (other, movie)):
+                    neighbours = self._neighbours[a]
+                    if neighbours[b] == 1:
+                        del neighbours[b]
+                    else:
+                        neighbours[b] -= 1
+        history.clear()
+
+    def _on_customer_event(self, customer, event, *args):
+        if event == "tickets_bought":
+            for movie in args[0]:
+                self._add(customer, movie)
+        elif event == "history_replaced":
+            self._forget(customer)
+            for movie in customer.ticket_history:
+                self._add(customer, movie)
+
+
+class RecommendationCache:
+    _MISSING = object()
+
+    def __init__(self, maxsize=1024, ttl=None, recommender=None,
+                 clock=time.monotonic):
+        if maxsize <= 0:
+            raise ValueError("Cache size must be positive.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("TTL must be positive.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._recommender = recommender or (
+            lambda customer, cinema: customer.recommend_movie(cinema))
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._keys = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, customer, cinema):
+        key = (customer, cinema)
+        entry = self._entries.get(key, self._MISSING)
+        if entry is not self._MISSING:
+            value, expires = entry
+            if expires is None or self._clock() < expires:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self._discard(key)
+        self.misses += 1
+        value = self._recommender(customer, cinema)
+        self._store(key, value)
+        return value
+
+    def invalidate(self, owner):
+        for key in list(self._keys.get(owner, ())):
+            self._discard(key)
+
+    def clear(self):
+        for key in list(self._entries):
+            self._discard(key)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "size": len(self._entries),
+                "maxsize": self.maxsize}
+
+    def _store(self, key, value):
+        expires = None if self.ttl is None else self._clock() + self.ttl
+        self._entries[key] = (value, expires)
+        for owner in key:
+            keys = self._keys.get(owner)
+            if keys is None:
+                keys = self._keys[owner] = set()
+                owner.add_listener(self._on_owner_event)
+            keys.add(key)
+        while len(self._entries) > self.maxsize:
+            self._discard(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _discard(self, key):
+        del self._entries[key]
+        for owner in key:
+            keys = self._keys[owner]
+            keys.discard(key)
+            if not keys:
+                del self._keys[owner]
+                owner.remove_listener(self._on_owner_event)
+
+    def _on_owner_event(self, owner, event, *args):
+        if event in ("tickets_bought", "history_replaced",
+                     "schedule_changed"):
+            self.invalidate(owner)
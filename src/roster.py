@@ -0,0 +1,230 @@
+import heapq
+import time
+from datetime import datetime, timedelta
+from koncowy.src.shift_store import (DEFAULT_SHIFT_HOURS, normalize_shift,
+                                     shift_end)
+
+
+class Roster:
+    def __init__(self, assignments, unfilled, elapsed,
+                 shift_hours=DEFAULT_SHIFT_HOURS):
+        self.assignments = assignments
+        self.unfilled = unfilled
+        self.elapsed = elapsed
+        self.shift_hours = shift_hours
+
+    def is_complete(self):
+        return not self.unfilled
+
+    def shifts_for(self, staff_member):
+        return [slot for slot, roles in self.assignments.items()
+                if any(staff_member in members for members in roles.values())]
+
+    def apply(self):
+        for (date, time_), roles in self.assignments.items():
+            for members in roles.values():
+                for staff_member in members:
+                    staff_member.assign_shift(
+                        date, time_, shift_end(time_, self.shift_hours))
+
+
+class RosterSolver:
+    def __init__(self, staff, demand, max_hours=None, max_days=None,
+                 shift_hours=DEFAULT_SHIFT_HOURS):
+        self.max_hours = max_hours
+        self.max_days = max_days
+        self.shift_hours = shift_hours
+        self._roles = {}
+        for staff_member in dict.fromkeys(staff):
+            self._roles.setdefault(staff_member.position.lower(),
+                                   []).append(staff_member)
+        self._demand = []
+        for slot, roles in demand.items():
+            slot = normalize_shift(*slot)
+            for role, headcount in roles.items():
+                if headcount < 0:
+                    raise ValueError("Headcount cannot be negative.")
+                if headcount:
+                    self._demand.append((slot, role.lower(), headcount))
+        self._demand.sort(key=lambda entry: entry[0])
+        self._conflicts = self._find_conflicts()
+
+    def _find_conflicts(self):
+        starts = [(slot, datetime.fromisoformat(f"{slot.date}T{slot.time}"))
+                  for slot in dict.fromkeys(slot for slot, _, _
+                                            in self._demand)]
+        length = timedelta(hours=self.shift_hours)
+        conflicts = {slot: [] for slot, _ in starts}
+        for i, (slot, start) in enumerate(starts):
+            for other, other_start in starts[i:]:
+                if other_start >= start + length:
+                    break
+                conflicts[slot].append(other)
+                if other != slot:
+                    conflicts[other].append(slot)
+        return conflicts
+
+    def _reset(self):
+        self._hours = {}
+        self._days = {}
+        self._new = {}
+        self._fits = {}
+        window = ((self._demand[0][0].date, self._demand[-1][0].date)
+                  if self._demand else None)
+        for members in self._roles.values():
+            for staff_member in members:
+                days = {}
+                minutes = 0
+                if window is not None:
+                    _, durations = staff_member.shifts.minutes_by_day(*window)
+                    minutes = sum(durations)
+                    for date, _ in staff_member.shifts.between(*window):
+                        days[date] = days.get(date, 0) + 1
+                self._hours[staff_member] = minutes / 60
+                self._days[staff_member] = days
+                self._new[staff_member] = {}
+
+    def solve(self, time_limit=None):
+        start = time.perf_counter()
+        deadline = None if time_limit is None else start + time_limit
+        self._reset()
+        unfilled = {}
+        for slot, role, headcount in self._demand:
+            missing = headcount - self._fill(slot, role, headcount)
+            if missing:
+                unfilled[(slot, role)] = missing
+        for key in list(unfilled):
+            if self._expired(deadline):
+                break
+            slot, role = key
+            while unfilled[key] and self._relieve(slot, role, deadline):
+                unfilled[key] -= 1
+            if not unfilled[key]:
+                del unfilled[key]
+        for role in self._roles:
+            if self._expired(deadline):
+                break
+            self._balance(role, deadline)
+        return Roster(self._assignments(), unfilled,
+                      time.perf_counter() - start, self.shift_hours)
+
+    @staticmethod
+    def _expired(deadline):
+        return deadline is not None and time.perf_counter() > deadline
+
+    def _fits_existing(self, staff_member, slot):
+        if not staff_member.shifts:
+            return True
+        fits = self._fits.get((staff_member, slot))
+        if fits is None:
+            end = shift_end(slot.time, self.shift_hours)
+            fits = staff_member.shifts.clash(*slot, end) is None
+            self._fits[(staff_member, slot)] = fits
+        return fits
+
+    def _can_take(self, staff_member, slot):
+        new = self._new[staff_member]
+        if any(other in new for other in self._conflicts[slot]):
+            return False
+        if not self._fits_existing(staff_member, slot):
+            return False
+        if (self.max_hours is not None and self._hours[staff_member]
+                + self.shift_hours > self.max_hours):
+            return False
+        days = self._days[staff_member]
+        return (self.max_days is None or slot.date in days
+                or len(days) < self.max_days)
+
+    def _take(self, staff_member, slot, role):
+        self._new[staff_member][slot] = role
+        self._hours[staff_member] += self.shift_hours
+        days = self._days[staff_member]
+        days[slot.date] = days.get(slot.date, 0) + 1
+
+    def _drop(self, staff_member, slot):
+        role = self._new[staff_member].pop(slot)
+        self._hours[staff_member] -= self.shift_hours
+        days = self._days[staff_member]
+        days[slot.date] -= 1
+        if not days[slot.date]:
+            del days[slot.date]
+        return role
+
+    def _fill(self, slot, role, headcount):
+        chosen = heapq.nsmallest(
+            headcount,
+            (staff_member for staff_member in self._roles.get(role, ())
+             if self._can_take(staff_member, slot)),
+            key=lambda staff_member: (
+                self._hours[staff_member],
+                slot.date not in self._days[staff_member]))
+        for staff_member in chosen:
+            self._take(staff_member, slot, role)
+        return len(chosen)
+
+    def _has_spare_hours(self, members):
+        return self.max_hours is None or any(
+            self._hours[staff_member] + self.shift_hours <= self.max_hours
+            for staff_member in members)
+
+    def _relieve(self, slot, role, deadline):
+        members = self._roles.get(role, ())
+        if not self._has_spare_hours(members):
+            return False
+        for blocked in members:
+            if self._expired(deadline):
+                return False
+            if slot in self._new[blocked] or slot in blocked.shifts:
+                continue
+            if self._can_take(blocked, slot):
+                self._take(blocked, slot, role)
+                return True
+            for other_slot in list(self._new[blocked]):
+                other_role = self._drop(blocked, other_slot)
+                if self._can_take(blocked, slot):
+                    for helper in members:
+                        if (helper is not blocked
+                                and self._can_take(helper, other_slot)):
+                            self._take(helper, other_slot, other_role)
+                            self._take(blocked, slot, role)
+                            return True
+                self._take(blocked, other_slot, other_role)
+        return False
+
+    def _balance(self, role, deadline):
+        members = self._roles[role]
+        improved = True
+        while improved and not self._expired(deadline):
+            improved = False
+            ordered = sorted(members, key=self._hours.__getitem__)
+            low, high = 0, len(ordered) - 1
+            while low < high:
+                busiest, idlest = ordered[high], ordered[low]
+                if (self._hours[busiest] - self._hours[idlest]
+                        <= self.shift_hours):
+                    break
+                if self._move_one(busiest, idlest):
+                    improved = True
+                    high -= 1
+                low += 1
+
+    def _move_one(self, source, target):
+        for slot in list(self._new[source]):
+            if self._can_take(target, slot):
+                self._take(target, slot, self._drop(source, slot))
+                return True
+        return False
+
+    def _assignments(self):
+        assignments = {}
+        for staff_member, slots in self._new.items():
+            for slot, role in slots.items():
+                assignments.setdefault(slot, {}).setdefault(
+                    role, []).append(staff_member)
+        return dict(sorted(assignments.items()))
+
+
+def solve_roster(staff, demand, max_hours=None, max_days=None,
+                 shift_hours=DEFAULT_SHIFT_HOURS, time_limit=None):
+    solver = RosterSolver(staff, demand, max_hours, max_days, shift_hours)
+    return solver.solve(time_limit)
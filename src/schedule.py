@@ -0,0 +1,246 @@
+from itertools import chain
+
+CHUNK_SIZE = 128
+
+
+def _fold(value):
+    return str(value or "").lower()
+
+
+class _ShardedMap:
+    def __init__(self):
+        self._shards = [{}]
+        self._owned = None
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key):
+        return key in self._shards[hash(key) & (len(self._shards) - 1)]
+
+    def get(self, key, default=None):
+        return self._shards[hash(key) & (len(self._shards) - 1)].get(
+            key, default)
+
+    def copy(self):
+        clone = _ShardedMap.__new__(_ShardedMap)
+        clone._shards = list(self._shards)
+        clone._owned = set()
+        clone._size = self._size
+        self._owned = set()
+        return clone
+
+    def _shard(self, key):
+        i = hash(key) & (len(self._shards) - 1)
+        if self._owned is not None and i not in self._owned:
+            self._shards[i] = dict(self._shards[i])
+            self._owned.add(i)
+        return self._shards[i]
+
+    def set(self, key, value):
+        shards = self._shards
+        i = hash(key) & (len(shards) - 1)
+        shard = shards[i]
+        if self._owned is not None and i not in self._owned:
+            shard = shards[i] = dict(shard)
+            self._owned.add(i)
+        size = len(shard)
+        shard[key] = value
+        if len(shard) > size:
+            self._size += 1
+            if self._size > CHUNK_SIZE * len(shards):
+                self._reshard(2 * len(shards))
+
+    def pop(self, key):
+        value = self._shard(key).pop(key)
+        self._size -= 1
+        return value
+
+    def _reshard(self, count):
+        shards = [{} for _ in range(count)]
+        for shard in self._shards:
+            for key, value in shard.items():
+                shards[hash(key) & (count - 1)][key] = value
+        self._shards = shards
+        self._owned = None
+
+
+class _Chunks:
+    def __init__(self):
+        self._chunks = {}
+        self._owned = None
+        self._next = 0
+        self._size = 0
+
+    def __iter__(self):
+        return chain.from_iterable(self._chunks.values())
+
+    def __len__(self):
+        return self._size
+
+    def copy(self):
+        clone = _Chunks.__new__(_Chunks)
+        clone._chunks = dict(self._chunks)
+        clone._owned = set()
+        clone._next = self._next
+        clone._size = self._size
+        self._owned = set()
+        return clone
+
+    def _chunk(self, key):
+        if self._owned is not None and key not in self._owned:
+            self._chunks[key] = dict(self._chunks[key])
+            self._owned.add(key)
+        return self._chunks[key]
+
+    def append(self, item):
+        key = self._next - 1
+        chunk = self._chunks.get(key)
+        if chunk is None or len(chunk) >= CHUNK_SIZE:
+            key = self._next
+            self._next += 1
+            chunk = self._chunks[key] = {}
+            if self._owned is not None:
+                self._owned.add(key)
+        elif self._owned is not None and key not in self._owned:
+            chunk = self._chunks[key] = dict(chunk)
+            self._owned.add(key)
+        chunk[item] = None
+        self._size += 1
+        return key
+
+    def discard(self, item, key):
+        chunk = self._chunk(key)
+        del chunk[item]
+        self._size -= 1
+        if not chunk:
+            del self._chunks[key]
+
+
+class Schedule:
+    def __init__(self, movies=()):
+        self._index = _ShardedMap()
+        self._movies = _Chunks()
+        self._titles = _ShardedMap()
+        self._genres = {}
+        self._genre_counts = {}
+        self._owned = None
+        self._frozen = False
+        for movie in movies:
+            self.add(movie)
+
+    def __iter__(self):
+        return iter(self._movies)
+
+    def __len__(self):
+        return len(self._movies)
+
+    def __contains__(self, movie):
+        return movie in self._index
+
+    def __getitem__(self, index):
+        return list(self._movies)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, Schedule):
+            return list(self._movies) == list(other._movies)
+        if isinstance(other, (list, tuple)):
+            return list(self._movies) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Schedule({list(self._movies)!r})"
+
+    @property
+    def frozen(self):
+        return self._frozen
+
+    def freeze(self):
+        self._frozen = True
+        self._owned = None
+        return self
+
+    def copy(self):
+        clone = Schedule.__new__(Schedule)
+        clone._index = self._index.copy()
+        clone._movies = self._movies.copy()
+        clone._titles = self._titles.copy()
+        clone._genres = dict(self._genres)
+        clone._genre_counts = dict(self._genre_counts)
+        clone._owned = set()
+        clone._frozen = False
+        if not self._frozen:
+            self._owned = set()
+        return clone
+
+    def _check_writable(self):
+        if self._frozen:
+            raise ValueError("Schedule snapshot is read-only.")
+
+    def _genre_bucket(self, key):
+        bucket = self._genres.get(key)
+        if self._owned is None or key in self._owned:
+            if bucket is None:
+                bucket = self._genres[key] = _Chunks()
+            return bucket
+        bucket = self._genres[key] = (_Chunks() if bucket is None
+                                      else bucket.copy())
+        self._owned.add(key)
+        return bucket
+
+    def add(self, movie):
+        self._check_writable()
+        if movie in self._index:
+            return False
+        title, genre = movie.title.lower(), _fold(movie.genre)
+        self._index.set(movie, (self._movies.append(movie),
+                                self._genre_bucket(genre).append(movie)))
+        self._titles.set(title, self._titles.get(title, ()) + (movie,))
+        self._genre_counts[movie.genre] = (
+            self._genre_counts.get(movie.genre, 0) + 1)
+        return True
+
+    def remove(self, movie):
+        self._check_writable()
+        if movie not in self._index:
+            raise ValueError("Movie not found in schedule.")
+        key, genre_key = self._index.pop(movie)
+        self._movies.discard(movie, key)
+        title = movie.title.lower()
+        same_title = tuple(other for other in self._titles.get(title)
+                           if other is not movie)
+        if same_title:
+            self._titles.set(title, same_title)
+        else:
+            self._titles.pop(title)
+        genre = _fold(movie.genre)
+        bucket = self._genre_bucket(genre)
+        bucket.discard(movie, genre_key)
+        if not len(bucket):
+            del self._genres[genre]
+        if self._genre_counts[movie.genre] == 1:
+            del self._genre_counts[movie.genre]
+        else:
+            self._genre_counts[movie.genre] -= 1
+
+    def clear(self):
+        self._check_writable()
+        self._index = _ShardedMap()
+        self._movies = _Chunks()
+        self._titles = _ShardedMap()
+        self._genres = {}
+        self._genre_counts = {}
+        self._owned = None
+
+    def by_title(self, title):
+        return list(self._titles.get(title.lower(), ()))
+
+    def first_by_title(self, title):
+        return next(iter(self._titles.get(title.lower(), ())), None)
+
+    def by_genre(self, genre):
+        return list(self._genres.get(_fold(genre), ()))
+
+    def genre_counts(self):
+        return dict(self._genre_counts)
@@ -0,0 +1,180 @@
+import heapq
+import itertools
+import threading
+import time
+
+
+class Auditorium:
+    def __init__(self, name, rows, seats_per_row):
+        if not name:
+            raise ValueError("Auditorium name cannot be empty.")
+        if rows <= 0 or seats_per_row <= 0:
+            raise ValueError("Auditorium must have at least one seat.")
+        self.name = name
+        self.rows = rows
+        self.seats_per_row = seats_per_row
+
+    @property
+    def capacity(self):
+        return self.rows * self.seats_per_row
+
+    def __str__(self):
+        return (f"Auditorium: {self.name}, "
+                f"{self.rows} rows x {self.seats_per_row} seats")
+
+
+class Hold:
+    def __init__(self, screening, seats, expires):
+        self.screening = screening
+        self.seats = seats
+        self.expires = expires
+
+
+class Screening:
+    def __init__(self, movie, auditorium, hold_ttl=300,
+                 clock=time.monotonic):
+        if hold_ttl <= 0:
+            raise ValueError("Hold TTL must be positive.")
+        self.movie = movie
+        self.auditorium = auditorium
+        self.hold_ttl = hold_ttl
+        self._clock = clock
+        self._full = (1 << auditorium.seats_per_row) - 1
+        self._taken = [0] * auditorium.rows
+        self._sold = [0] * auditorium.rows
+        self._holds = {}
+        self._expiries = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self.cancelled = False
+        middle = auditorium.rows - 1
+        self._row_order = sorted(range(auditorium.rows),
+                                 key=lambda row: (abs(2 * row - middle), row))
+
+    def available_count(self):
+        with self._lock:
+            self._expire()
+            return self.auditorium.capacity - sum(
+                row.bit_count() for row in self._taken)
+
+    def sold_count(self):
+        with self._lock:
+            return sum(row.bit_count() for row in self._sold)
+
+    def is_available(self, row, seat):
+        masks = self._masks([(row, seat)])
+        with self._lock:
+            self._expire()
+            return not self._taken[row] & masks[row]
+
+    def is_sold(self, row, seat):
+        masks = self._masks([(row, seat)])
+        with self._lock:
+            return bool(self._sold[row] & masks[row])
+
+    def best_available(self, count):
+        with self._lock:
+            self._expire()
+            return self._find(count)
+
+    def hold(self, seats=None, count=None):
+        if seats is not None:
+            seats = list(seats)
+            masks = self._masks(seats)
+        with self._lock:
+            self._check_open()
+            self._expire()
+            if seats is None:
+                seats = self._find(count)
+                if seats is None:
+                    raise ValueError("Not enough adjacent seats available.")
+                masks = self._masks(seats)
+            for row, mask in masks.items():
+                if self._taken[row] & mask:
+                    raise ValueError("Seat is not available.")
+            for row, mask in masks.items():
+                self._taken[row] |= mask
+            hold = Hold(self, tuple(seats), self._clock() + self.hold_ttl)
+            self._holds[hold] = masks
+            heapq.heappush(self._expiries,
+                           (hold.expires, next(self._sequence), hold))
+            return hold
+
+    def confirm(self, hold):
+        with self._lock:
+            self._check_open()
+            self._expire()
+            masks = self._holds.pop(hold, None)
+            if masks is None:
+                raise ValueError("Hold has expired or was already used.")
+            for row, mask in masks.items():
+                self._sold[row] |= mask
+            return hold.seats
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+            for hold in list(self._holds):
+                self._release(hold)
+            self._expiries.clear()
+
+    def _check_open(self):
+        if self.cancelled:
+            raise ValueError("Screening was cancelled.")
+
+    def release(self, hold):
+        with self._lock:
+            if hold in self._holds:
+                self._release(hold)
+
+    def _release(self, hold):
+        for row, mask in self._holds.pop(hold).items():
+            self._taken[row] &= ~mask
+
+    def _expire(self):
+        now = self._clock()
+        expiries = self._expiries
+        while expiries and expiries[0][0] <= now:
+            hold = heapq.heappop(expiries)[2]
+            if hold in self._holds:
+                self._release(hold)
+
+    def _masks(self, seats):
+        masks = {}
+        for row, seat in seats:
+            if not (0 <= row < self.auditorium.rows
+                    and 0 <= seat < self.auditorium.seats_per_row):
+                raise ValueError("Seat does not exist.")
+            bit = 1 << seat
+            if masks.get(row, 0) & bit:
+                raise ValueError("Seat is listed more than once.")
+            masks[row] = masks.get(row, 0) | bit
+        if not masks:
+            raise ValueError("No seats selected.")
+        return masks
+
+    def _find(self, count):
+        width = self.auditorium.seats_per_row
+        if not isinstance(count, int) or not 0 < count <= width:
+            raise ValueError("Invalid number of seats.")
+        for row in self._row_order:
+            starts = ~self._taken[row] & self._full
+            length = 1
+            while length < count and starts:
+                step = min(length, count - length)
+                starts &= starts >> step
+                length += step
+            if not starts:
+                continue
+            ideal = (width - count) // 2
+            left = starts & ((2 << ideal) - 1)
+            right = starts >> ideal
+            candidates = []
+            if left:
+                candidates.append(left.bit_length() - 1)
+            if right:
+                candidates.append(ideal + (right & -right).bit_length() - 1)
+            best = min(candidates,
+                       key=lambda start: abs(2 * start + count - width))
+            return [(row, seat) for seat in range(best, best + count)]
+        return None
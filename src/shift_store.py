@@ -0,0 +1,245 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from datetime import date as Date
+
+Shift = namedtuple("Shift", ["date", "time"])
+DEFAULT_SHIFT_HOURS = 5
+DAY_MINUTES = 24 * 60
+
+
+def _ordinal(day):
+    if isinstance(day, Date):
+        return day.toordinal()
+    try:
+        return Date.fromisoformat(day).toordinal()
+    except (TypeError, ValueError):
+        raise ValueError("Invalid shift date.") from None
+
+
+def _iso_date(ordinal):
+    return Date.fromordinal(ordinal).isoformat()
+
+
+def _week_start(ordinal):
+    return ordinal - (ordinal - 1) % 7
+
+
+def _clock_minutes(value):
+    try:
+        hours, minutes = (int(part) for part in value.split(":"))
+    except (AttributeError, ValueError):
+        raise ValueError("Invalid shift time.") from None
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        raise ValueError("Invalid shift time.")
+    return hours * 60 + minutes
+
+
+def _clock_text(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def normalize_shift(date, time):
+    return Shift(_iso_date(_ordinal(date)), _clock_text(_clock_minutes(time)))
+
+
+def shift_end(time, hours=DEFAULT_SHIFT_HOURS):
+    minutes = (_clock_minutes(time) + round(hours * 60)) % DAY_MINUTES
+    return _clock_text(minutes)
+
+
+def shift_minutes(time, end):
+    minutes = (_clock_minutes(end) - _clock_minutes(time)) % DAY_MINUTES
+    if not minutes:
+        raise ValueError("Shift end must differ from its start.")
+    return minutes
+
+
+class ShiftStore:
+    def __init__(self, shifts=()):
+        self._slots = {}
+        self._dates = {}
+        self._keys = []
+        self._sorted = []
+        self._ordinals = array("q")
+        self._minutes = array("q")
+        self._total_minutes = 0
+        for shift in shifts:
+            self.add(*shift)
+
+    def __iter__(self):
+        return iter(self._slots)
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, shift):
+        try:
+            return normalize_shift(*shift) in self._slots
+        except (TypeError, ValueError):
+            return False
+
+    def __getitem__(self, index):
+        return list(self._slots)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, ShiftStore):
+            return list(self._slots) == list(other._slots)
+        if isinstance(other, (list, tuple)):
+            return list(self._slots) == [tuple(shift) for shift in other]
+        return NotImplemented
+
+    def __repr__(self):
+        return f"ShiftStore({list(self._slots)!r})"
+
+    @staticmethod
+    def _key(date, time):
+        return _ordinal(date), _clock_minutes(time)
+
+    def add(self, date, time, end=None, strict=False):
+        key = self._key(date, time)
+        shift = Shift(_iso_date(key[0]), _clock_text(key[1]))
+        if shift in self._slots:
+            return False
+        end = shift_end(shift.time) if end is None else end
+        minutes = shift_minutes(shift.time, end)
+        clash = self._clash(key, minutes) if strict else None
+        if clash is not None:
+            raise ValueError(f"Shift clashes with {clash!r}.")
+        self._slots[shift] = _clock_text(_clock_minutes(end))
+        self._dates.setdefault(shift.date, {})[shift.time] = None
+        i = bisect_right(self._keys, key)
+        self._keys.insert(i, key)
+        self._sorted.insert(i, shift)
+        self._ordinals.insert(i, key[0])
+        self._minutes.insert(i, minutes)
+        self._total_minutes += minutes
+        return True
+
+    def _start(self, i):
+        ordinal, minutes = self._keys[i]
+        return ordinal * DAY_MINUTES + minutes
+
+    def _clash(self, key, minutes):
+        start = key[0] * DAY_MINUTES + key[1]
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._start(i) < start + minutes:
+            return self._sorted[i]
+        while i and self._start(i - 1) > start - DAY_MINUTES:
+            i -= 1
+            if self._start(i) + self._minutes[i] > start:
+                return self._sorted[i]
+        return None
+
+    def clash(self, date, time, end=None):
+        end = shift_end(time) if end is None else end
+        return self._clash(self._key(date, time), shift_minutes(time, end))
+
+    def remove(self, date, time):
+        key = self._key(date, time)
+        shift = Shift(_iso_date(key[0]), _clock_text(key[1]))
+        if shift not in self._slots:
+            raise ValueError("Shift not found.")
+        del self._slots[shift]
+        times = self._dates[shift.date]
+        del times[shift.time]
+        if not times:
+            del self._dates[shift.date]
+        i = bisect_left(self._keys, key)
+        self._total_minutes -= self._minutes[i]
+        del self._keys[i], self._sorted[i]
+        del self._ordinals[i], self._minutes[i]
+
+    def clear(self):
+        self._slots.clear()
+        self._dates.clear()
+        self._keys.clear()
+        self._sorted.clear()
+        self._ordinals = array("q")
+        self._minutes = array("q")
+        self._total_minutes = 0
+
+    def end_of(self, date, time):
+        return self._slots[normalize_shift(date, time)]
+
+    def with_end_times(self):
+        return [(date, time, end)
+                for (date, time), end in self._slots.items()]
+
+    def total_hours(self):
+        return self._total_minutes / 60
+
+    def minutes_by_day(self, start=None, end=None):
+        lo = (0 if start is None
+              else bisect_left(self._keys, (_ordinal(start),)))
+        hi = (len(self._keys) if end is None
+              else bisect_left(self._keys, (_ordinal(end) + 1,)))
+        return self._ordinals[lo:hi], self._minutes[lo:hi]
+
+    def ordered(self):
+        return list(self._sorted)
+
+    def _range(self, start, end):
+        return (bisect_left(self._keys, (_ordinal(start),)),
+                bisect_left(self._keys, (_ordinal(end) + 1,)))
+
+    def between(self, start, end):
+        lo, hi = self._range(start, end)
+        return self._sorted[lo:hi]
+
+    def next_shift(self, date, time=None):
+        key = ((_ordinal(date),) if time is None
+               else self._key(date, time))
+        i = bisect_left(self._keys, key)
+        return self._sorted[i] if i < len(self._sorted) else None
+
+    def week_counts(self, start, end):
+        first = _week_start(_ordinal(start))
+        last = _ordinal(end)
+        counts = dict.fromkeys(range(first, last + 1, 7), 0)
+        lo, hi = self._range(start, end)
+        for ordinal, _ in self._keys[lo:hi]:
+            counts[_week_start(ordinal)] += 1
+        return {Date.fromordinal(week).isoformat(): count
+                for week, count in counts.items()}
+
+    def on_date(self, date):
+        return list(self._dates.get(_iso_date(_ordinal(date)), ()))
+
+    def dates(self):
+        return list(self._dates)
+
+    def day_count(self):
+        return len(self._dates)
+
+
+class ShiftView:
+    _WRITES = frozenset(("add", "remove", "clear"))
+
+    def __init__(self, store):
+        self._store = store
+
+    def __getattr__(self, name):
+        if name.startswith("_") or name in ShiftView._WRITES:
+            raise AttributeError(f"Shift view is read-only: {name}")
+        return getattr(self._store, name)
+
+    def __iter__(self):
+        return iter(self._store)
+
+    def __len__(self):
+        return len(self._store)
+
+    def __contains__(self, shift):
+        return shift in self._store
+
+    def __getitem__(self, index):
+        return self._store[index]
+
+    def __eq__(self, other):
+        if isinstance(other, ShiftView):
+            other = other._store
+        return self._store == other
+
+    def __repr__(self):
+        return f"ShiftView({list(self._store)!r})"
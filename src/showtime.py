@@ -0,0 +1,126 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from operator import attrgetter
+
+
+class Showtime:
+    def __init__(self, movie, screen, start):
+        if movie is None:
+            raise ValueError("Movie cannot be None.")
+        if not isinstance(start, datetime):
+            raise ValueError("Start must be a datetime.")
+        self.movie = movie
+        self.screen = screen
+        self.start = start
+        self.end = start + timedelta(minutes=movie.duration)
+
+    def overlaps(self, start, end):
+        return self.start < end and start < self.end
+
+    def __repr__(self):
+        return (f"Showtime({self.movie.title!r}, {self.screen!r}, "
+                f"{self.start:%Y-%m-%d %H:%M}-{self.end:%H:%M})")
+
+
+class _ScreenTimeline:
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.showtimes = []
+
+    def clash(self, start, end):
+        i = bisect_right(self.starts, start)
+        if i and self.ends[i - 1] > start:
+            return self.showtimes[i - 1]
+        if i < len(self.starts) and self.starts[i] < end:
+            return self.showtimes[i]
+        return None
+
+    def insert(self, showtime):
+        i = bisect_right(self.starts, showtime.start)
+        self.starts.insert(i, showtime.start)
+        self.ends.insert(i, showtime.end)
+        self.showtimes.insert(i, showtime)
+
+    def delete(self, showtime):
+        i = bisect_left(self.starts, showtime.start)
+        if i == len(self.showtimes) or self.showtimes[i] is not showtime:
+            raise ValueError("Showtime not found.")
+        del self.starts[i], self.ends[i], self.showtimes[i]
+
+    def discard_movies(self, movies):
+        kept, removed = [], []
+        for showtime in self.showtimes:
+            (removed if showtime.movie in movies else kept).append(showtime)
+        if removed:
+            self.showtimes = kept
+            self.starts = [showtime.start for showtime in kept]
+            self.ends = [showtime.end for showtime in kept]
+        return removed
+
+    def between(self, start, end):
+        first = bisect_right(self.ends, start)
+        last = bisect_left(self.starts, end, lo=first)
+        return self.showtimes[first:last]
+
+
+class ShowtimeIndex:
+    def __init__(self, showtimes=()):
+        self._screens = {}
+        self._count = 0
+        for showtime in showtimes:
+            self.add(showtime)
+
+    def __iter__(self):
+        return heapq.merge(*(timeline.showtimes
+                             for timeline in self._screens.values()),
+                           key=attrgetter("start"))
+
+    def __len__(self):
+        return self._count
+
+    def screens(self):
+        return list(self._screens)
+
+    def clash(self, screen, start, end):
+        timeline = self._screens.get(screen)
+        return timeline.clash(start, end) if timeline else None
+
+    def add(self, showtime):
+        timeline = self._screens.setdefault(showtime.screen,
+                                            _ScreenTimeline())
+        clash = timeline.clash(showtime.start, showtime.end)
+        if clash is not None:
+            raise ValueError(f"Showtime clashes with {clash!r}.")
+        timeline.insert(showtime)
+        self._count += 1
+
+    def remove(self, showtime):
+        timeline = self._screens.get(showtime.screen)
+        if timeline is None:
+            raise ValueError("Showtime not found.")
+        timeline.delete(showtime)
+        self._count -= 1
+        if not timeline.showtimes:
+            del self._screens[showtime.screen]
+
+    def remove_movies(self, movies):
+        movies = set(movies)
+        removed = []
+        if not movies:
+            return removed
+        for screen, timeline in list(self._screens.items()):
+            removed += timeline.discard_movies(movies)
+            if not timeline.showtimes:
+                del self._screens[screen]
+        self._count -= len(removed)
+        return removed
+
+    def between(self, start, end, screen=None):
+        if screen is not None:
+            timeline = self._screens.get(screen)
+            return timeline.between(start, end) if timeline else []
+        return list(heapq.merge(*(timeline.between(start, end)
+                                  for timeline in self._screens.values()),
+                                key=attrgetter("start")))
@@ -0,0 +1,120 @@
+import json
+import struct
+import sys
+from array import array
+from koncowy.src.movie import Movie
+
+MAGIC = b"KINOSNP1"
+TEXT_COLUMNS = ("title", "genre", "director", "language", "description")
+NUMERIC_COLUMNS = ("duration", "age_restriction", "release_year",
+                   "rating", "views")
+NULL_INDEX = 0xFFFFFFFF
+_LENGTH = struct.Struct("<Q")
+
+
+def _to_bytes(values):
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode, data):
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def _pack_numbers(values):
+    values = list(values)
+    missing = None
+    if None in values:
+        missing = bytearray((len(values) + 7) // 8)
+        for i, value in enumerate(values):
+            if value is None:
+                missing[i // 8] |= 1 << (i % 8)
+        values = [0 if value is None else value for value in values]
+    try:
+        return array("q", values), missing
+    except TypeError:
+        return array("d", values), missing
+
+
+def _unpack_missing(values, missing):
+    for i in range(len(values)):
+        if missing[i // 8] >> (i % 8) & 1:
+            values[i] = None
+    return values
+
+
+def _pack_strings(values):
+    table = {}
+    indexes = array("I", (NULL_INDEX if value is None
+                          else table.setdefault(value, len(table))
+                          for value in values))
+    offsets = array("I", [0])
+    for value in table:
+        offsets.append(offsets[-1] + len(value))
+    blob = "".join(table).encode("utf-8")
+    return indexes, offsets, blob
+
+
+def write_snapshot(f, name, address, movies):
+    movies = list(movies)
+    header = {"name": name, "address": address, "count": len(movies),
+              "numeric": {}, "missing": []}
+    sections = []
+    for column in TEXT_COLUMNS:
+        indexes, offsets, blob = _pack_strings(
+            getattr(movie, column) for movie in movies)
+        sections += [_to_bytes(indexes), _to_bytes(offsets), blob]
+    for column in NUMERIC_COLUMNS:
+        values, missing = _pack_numbers(getattr(movie, column)
+                                        for movie in movies)
+        header["numeric"][column] = values.typecode
+        sections.append(_to_bytes(values))
+        if missing is not None:
+            header["missing"].append(column)
+            sections.append(bytes(missing))
+    f.write(MAGIC)
+    for section in [json.dumps(header).encode("utf-8")] + sections:
+        f.write(_LENGTH.pack(len(section)))
+        f.write(section)
+
+
+def _iter_sections(data):
+    view = memoryview(data)
+    pos = len(MAGIC)
+    while pos < len(view):
+        length, = _LENGTH.unpack_from(view, pos)
+        pos += _LENGTH.size
+        yield view[pos:pos + length]
+        pos += length
+
+
+def read_snapshot(f):
+    data = f.read()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not a cinema snapshot file.")
+    sections = _iter_sections(data)
+    header = json.loads(bytes(next(sections)).decode("utf-8"))
+    columns = {}
+    for column in TEXT_COLUMNS:
+        indexes = _from_bytes("I", next(sections))
+        offsets = _from_bytes("I", next(sections))
+        text = str(next(sections), "utf-8")
+        table = [text[start:end]
+                 for start, end in zip(offsets, offsets[1:])]
+        columns[column] = [None if i == NULL_INDEX else table[i]
+                           for i in indexes]
+    missing = header.get("missing", ())
+    for column in NUMERIC_COLUMNS:
+        columns[column] = _from_bytes(header["numeric"][column],
+                                      next(sections)).tolist()
+        if column in missing:
+            _unpack_missing(columns[column], next(sections))
+    movies = [Movie._unchecked(*fields) for fields in zip(
+        *(columns[column] for column in Movie.FIELDS + ("views",)))]
+    return header["name"], header["address"], movies
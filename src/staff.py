@@ -1,4 +1,6 @@
 import json
+from koncowy.src.shift_store import (
+    ShiftStore, ShiftView, normalize_shift)
 
 
 class Staff:
@@ -6,16 +8,51 @@ class Staff:
         if not first_name or not last_name or not position:
             raise ValueError("First name, "
                              "last name and position cannot be empty.")
+        self._listeners = []
         self.first_name = first_name
         self.last_name = last_name
         self.position = position
         self.shifts = []
         self.tasks_completed = []
 
-    def assign_shift(self, date, time):
-        if (date, time) in self.shifts:
+    @property
+    def shifts(self):
+        return self._shifts_view
+
+    @shifts.setter
+    def shifts(self, shifts):
+        old_shifts = getattr(self, "_shifts", None)
+        self._shifts = ShiftStore(shifts)
+        self._shifts_view = ShiftView(self._shifts)
+        if old_shifts is not None:
+            self._notify("shifts_replaced", old_shifts)
+
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, new_position):
+        old_position = getattr(self, "_position", None)
+        self._position = new_position
+        if old_position is not None and old_position != new_position:
+            self._notify("position_changed", old_position)
+
+    def add_listener(self, listener):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self._listeners.remove(listener)
+
+    def _notify(self, event, *args):
+        for listener in list(self._listeners):
+            listener(self, event, *args)
+
+    def assign_shift(self, date, time, end=None, strict=False):
+        shift = normalize_shift(date, time)
+        if not self._shifts.add(*shift, end, strict):
             raise ValueError("Shift already assigned for this date and time.")
-        self.shifts.append((date, time))
+        self._notify("shift_assigned", *shift)
 
     def is_manager(self):
         return self.position.lower() == "manager"
@@ -29,19 +66,31 @@ class Staff:
         return self.tasks_completed
 
     def is_available(self, date, time):
-        return (date, time) not in self.shifts
+        return (date, time) not in self._shifts
 
     def get_schedule(self):
-        return self.shifts
+        return list(self._shifts)
+
+    def get_sorted_schedule(self):
+        return self._shifts.ordered()
+
+    def get_shifts_between(self, start_date, end_date):
+        return self._shifts.between(start_date, end_date)
+
+    def next_shift(self, date, time=None):
+        return self._shifts.next_shift(date, time)
+
+    def weekly_shift_counts(self, start_date, end_date):
+        return self._shifts.week_counts(start_date, end_date)
 
     def clear_schedule(self):
         self.shifts = []
 
     def total_hours_assigned(self):
-        return len(self.shifts) * 5  # jedna zmiana = 5h
+        return self._shifts.total_hours()
 
     def worked_days(self):
-        return len(set(date for date, _ in self.shifts))
+        return self._shifts.day_count()
 
     def has_task(self, task):
         return task in self.tasks_completed
@@ -58,7 +107,14 @@ class Staff:
         self.position = new_position
 
     def to_dict(self):
-        return self.__dict__
+        return {
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "position": self.position,
+            "shifts": [list(shift)
+                       for shift in self._shifts.with_end_times()],
+            "tasks_completed": self.tasks_completed
+        }
 
     def save_to_json(self, filename):
         with open(filename, 'w') as f:
@@ -0,0 +1,124 @@
+from koncowy.src.shift_store import normalize_shift
+
+
+class StaffRegistry:
+    def __init__(self, staff=()):
+        self._members = {}
+        self._roles = {}
+        self._names = {}
+        self._busy = {}
+        for staff_member in staff:
+            self.add(staff_member)
+
+    def __iter__(self):
+        for staff_member, count in list(self._members.items()):
+            for _ in range(count):
+                yield staff_member
+
+    def __len__(self):
+        return sum(self._members.values())
+
+    def __contains__(self, staff_member):
+        return staff_member in self._members
+
+    def __getitem__(self, index):
+        return list(self)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (StaffRegistry, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"StaffRegistry({list(self)!r})"
+
+    @staticmethod
+    def _role_key(role):
+        return role.lower()
+
+    @staticmethod
+    def _name_key(staff_member):
+        return staff_member.first_name, staff_member.last_name
+
+    def count(self, staff_member):
+        return self._members.get(staff_member, 0)
+
+    def add(self, staff_member):
+        if staff_member in self._members:
+            self._members[staff_member] += 1
+            return
+        self._members[staff_member] = 1
+        self._roles.setdefault(self._role_key(staff_member.position),
+                               {})[staff_member] = None
+        self._names.setdefault(self._name_key(staff_member),
+                               {})[staff_member] = None
+        for shift in staff_member.shifts:
+            self._busy.setdefault(shift, {})[staff_member] = None
+        staff_member.add_listener(self._on_staff_event)
+
+    def remove(self, staff_member):
+        if staff_member not in self._members:
+            raise ValueError("Staff member not found.")
+        del self._members[staff_member]
+        self._discard(self._roles, self._role_key(staff_member.position),
+                      staff_member)
+        self._discard(self._names, self._name_key(staff_member),
+                      staff_member)
+        for shift in staff_member.shifts:
+            self._discard(self._busy, shift, staff_member)
+        staff_member.remove_listener(self._on_staff_event)
+
+    def clear(self):
+        for staff_member in list(self._members):
+            self.remove(staff_member)
+
+    def by_role(self, role):
+        return list(self._roles.get(self._role_key(role), ()))
+
+    def by_name(self, first_name, last_name):
+        return list(self._names.get((first_name, last_name), ()))
+
+    def busy_at(self, date, time):
+        return list(self._busy.get(normalize_shift(date, time), ()))
+
+    def free_at(self, date, time, role=None):
+        return self.free_for_slots([(date, time)], role)[(date, time)]
+
+    def free_for_slots(self, slots, role=None):
+        if role is None:
+            candidates = list(self._members)
+        else:
+            candidates = self.by_role(role)
+        free = {}
+        for date, time in slots:
+            busy = self._busy.get(normalize_shift(date, time))
+            free[(date, time)] = (
+                [staff_member for staff_member in candidates
+                 if staff_member not in busy]
+                if busy else list(candidates))
+        return free
+
+    @staticmethod
+    def _discard(index, key, staff_member):
+        bucket = index.get(key)
+        if bucket is None or staff_member not in bucket:
+            return
+        del bucket[staff_member]
+        if not bucket:
+            del index[key]
+
+    def _on_staff_event(self, staff_member, event, *args):
+        if event == "position_changed":
+            old_position, = args
+            self._discard(self._roles, self._role_key(old_position),
+                          staff_member)
+            self._roles.setdefault(self._role_key(staff_member.position),
+                                   {})[staff_member] = None
+        elif event == "shift_assigned":
+            self._busy.setdefault(args, {})[staff_member] = None
+        elif event == "shifts_replaced":
+            old_shifts, = args
+            for shift in old_shifts:
+                self._discard(self._busy, shift, staff_member)
+            for shift in staff_member.shifts:
+                self._busy.setdefault(shift, {})[staff_member] = None
@@ -0,0 +1,99 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from koncowy.src.box_office import AsyncBoxOffice
+from koncowy.src.cinema import Cinema
+from koncowy.src.customer import Customer
+from koncowy.src.movie import Movie
+from koncowy.src.staff import Staff
+
+
+class TestAsyncBoxOffice(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.cinema = Cinema("KinoTest", "Testowa 123")
+        self.movies = [
+            Movie("Inception", "Sci-Fi", 148, 13, "Nolan", "EN", 2010, 8.8,
+                  "Dreams"),
+            Movie("Cartoon", "Animation", 80, 0, "D", "EN", 2020, 7.0,
+                  "Desc"),
+        ]
+        self.cinema.choose_movies_to_play(Staff("Anna", "Nowak", "manager"),
+                                          self.movies)
+        self.customer = Customer("Jan", "Nowak", 30, "jan@example.com",
+                                 "pass")
+        self.customer.activate_account()
+        self.office = AsyncBoxOffice([self.cinema], [self.customer])
+
+    async def test_login(self):
+        inactive = Customer("Ola", "Nowak", 8, "ola@example.com", "pass")
+        self.office.add_customer(inactive)
+        test_cases = [
+            ("valid", "jan@example.com", "pass", None),
+            ("wrong_password", "jan@example.com", "bad", ValueError),
+            ("unknown_email", "nobody@example.com", "pass", ValueError),
+            ("inactive_account", "ola@example.com", "pass", ValueError),
+        ]
+        for case, email, password, expected_exception in test_cases:
+            with self.subTest(case=case):
+                if expected_exception:
+                    with self.assertRaises(expected_exception):
+                        await self.office.login(email, password)
+                else:
+                    token = await self.office.login(email, password)
+                    self.assertIs(self.office.customer(token), self.customer)
+
+    async def test_logout_ends_session(self):
+        token = await self.office.login("jan@example.com", "pass")
+        await self.office.logout(token)
+        with self.assertRaises(PermissionError):
+            await self.office.buy_ticket(token, "KinoTest", "Inception")
+
+    async def test_browse(self):
+        test_cases = [
+            ("all", None, self.movies),
+            ("by_genre", "animation", [self.movies[1]]),
+            ("no_match", "Horror", []),
+        ]
+        for case, genre, expected in test_cases:
+            with self.subTest(case=case):
+                self.assertEqual(
+                    await self.office.browse("KinoTest", genre), expected)
+        with self.assertRaises(ValueError):
+            await self.office.browse("Missing")
+
+    async def test_concurrent_buy_ticket(self):
+        token = await self.office.login("jan@example.com", "pass")
+        bought = await asyncio.gather(*(
+            self.office.buy_ticket(token, "KinoTest", "Cartoon")
+            for _ in range(50)))
+        self.assertEqual(bought, [self.movies[1]] * 50)
+        self.assertEqual(self.movies[1].views, 50)
+        self.assertEqual(self.customer.loyalty_points, 500)
+
+    async def test_buy_ticket_unknown_title(self):
+        token = await self.office.login("jan@example.com", "pass")
+        with self.assertRaises(ValueError):
+            await self.office.buy_ticket(token, "KinoTest", "Missing")
+        self.assertEqual(self.customer.ticket_history, ())
+
+    async def test_save_and_load(self):
+        path = tempfile.mktemp(suffix=".json")
+        try:
+            await self.office.save("KinoTest", path)
+            office = AsyncBoxOffice()
+            cinema = await office.load(path)
+            self.assertEqual(cinema.list_movies(), ["Inception", "Cartoon"])
+            self.assertEqual(
+                [movie.identity() for movie in
+                 await office.browse("KinoTest", "sci-fi")],
+                [self.movies[0].identity()])
+            with self.assertRaises(ValueError):
+                await office.load(path)
+        finally:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,13 @@
 import unittest
 import tempfile
 import os
+import threading
+from datetime import datetime
 from koncowy.src.cinema import Cinema
+from koncowy.src.customer import Customer
 from koncowy.src.movie import Movie
+from koncowy.src.movie_registry import MovieRegistry
+from koncowy.src.seating import Auditorium
 from koncowy.src.staff import Staff
 
 
@@ -360,6 +365,151 @@ class TestCinema(unittest.TestCase):
         self.assertEqual(data[0]["director"], "Christopher Nolan")
         os.remove(path)
 
+    def test_export_schedule_to_json_formats(self):
+        import json
+        self.cinema.add_movie(self.manager, self.movie)
+        expected = [self.movie.to_dict()]
+        test_cases = [
+            ("indented", 4, json.dumps(expected, indent=4)),
+            ("compact", None, json.dumps(expected, separators=(",", ":"))),
+        ]
+        for case, indent, expected_text in test_cases:
+            with self.subTest(case=case):
+                path = tempfile.mktemp(suffix=".json")
+                self.cinema.export_schedule_to_json(path, indent=indent)
+                with open(path, 'r') as f:
+                    self.assertEqual(f.read(), expected_text)
+                os.remove(path)
+
+    def test_export_schedule_to_jsonl(self):
+        import json
+        movie2 = Movie("Matrix", "Sci-Fi", 136, 16, "Wachowski",
+                       "EN", 1999, 8.7, "Desc")
+        self.cinema.choose_movies_to_play(self.manager, [self.movie, movie2])
+        path = tempfile.mktemp(suffix=".jsonl")
+        self.cinema.export_schedule_to_jsonl(path)
+        with open(path, 'r') as f:
+            lines = f.read().splitlines()
+        self.assertEqual([json.loads(line)["title"] for line in lines],
+                         ["Inception", "Matrix"])
+        os.remove(path)
+
+    def test_save_to_json_matches_to_dict(self):
+        import json
+        self.cinema.add_movie(self.manager, self.movie)
+        self.cinema.assign_staff(self.worker)
+        for indent in (4, None):
+            with self.subTest(indent=indent):
+                path = tempfile.mktemp(suffix=".json")
+                self.cinema.save_to_json(path, indent=indent)
+                with open(path, 'r') as f:
+                    self.assertEqual(json.load(f), self.cinema.to_dict())
+                os.remove(path)
+
+    def test_iter_movies_from_json(self):
+        movie2 = Movie("Matrix", "Sci-Fi", 136, 16, "Wachowski",
+                       "EN", 1999, 8.7, "Desc")
+        self.cinema.choose_movies_to_play(self.manager, [self.movie, movie2])
+        test_cases = [
+            ("save_to_json", self.cinema.save_to_json),
+            ("export_schedule_to_json", self.cinema.export_schedule_to_json),
+        ]
+        for case, save in test_cases:
+            with self.subTest(case=case):
+                path = tempfile.mktemp(suffix=".json")
+                save(path)
+                movies = list(Cinema.iter_movies_from_json(path))
+                self.assertEqual([m.title for m in movies],
+                                 ["Inception", "Matrix"])
+                self.assertIsInstance(movies[0], Movie)
+                os.remove(path)
+
+    def test_read_from_json_restores_schedule_order(self):
+        movies = [Movie(f"T{i}", "Drama", 100, 0, "D", "EN", 2000,
+                        7.0, "Desc") for i in range(5)]
+        self.cinema.choose_movies_to_play(self.manager, movies)
+        path = tempfile.mktemp(suffix=".json")
+        self.cinema.save_to_json(path, indent=None)
+        loaded = Cinema.read_from_json(path)
+        self.assertEqual(loaded.address, "Testowa 123")
+        self.assertEqual(loaded.list_movies(), ["T0", "T1", "T2", "T3", "T4"])
+        self.assertEqual(loaded.count_movies_by_genre(), {"Drama": 5})
+        os.remove(path)
+
+    def test_import_schedule_from_jsonl(self):
+        movies = [Movie(f"T{i}", "Drama", 100, 0, "D", "EN", 2000,
+                        7.0, "Desc") for i in range(5)]
+        self.cinema.choose_movies_to_play(self.manager, movies)
+        path = tempfile.mktemp(suffix=".jsonl")
+        self.cinema.export_schedule_to_jsonl(path)
+        batches = list(Cinema.iter_movies_from_jsonl(path, batch_size=2))
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        test_cases = [
+            ("manager", self.manager, None),
+            ("worker", self.worker, PermissionError),
+        ]
+        for case, staff, expected_exception in test_cases:
+            with self.subTest(case=case):
+                cinema = Cinema("Other", "Street 2")
+                if expected_exception:
+                    with self.assertRaises(expected_exception):
+                        cinema.import_schedule_from_jsonl(staff, path)
+                else:
+                    cinema.import_schedule_from_jsonl(staff, path,
+                                                      batch_size=2)
+                    self.assertEqual(cinema.list_movies(),
+                                     self.cinema.list_movies())
+        os.remove(path)
+
+    def test_save_and_read_from_snapshot(self):
+        movie2 = Movie("Matrix", "Sci-Fi", 136, 16, "Wachowski",
+                       "EN", 1999, 8.7, "Desc")
+        self.cinema.choose_movies_to_play(self.manager, [self.movie, movie2])
+        path = tempfile.mktemp(suffix=".snap")
+        self.cinema.save_to_snapshot(path)
+        loaded = Cinema.read_from_snapshot(path)
+        self.assertEqual(str(loaded), str(self.cinema))
+        self.assertEqual(loaded.list_movies(), ["Inception", "Matrix"])
+        self.assertEqual(loaded.get_movies_by_genre("sci-fi")[1].director,
+                         "Wachowski")
+        os.remove(path)
+
+    def test_loaders_share_movie_instances(self):
+        registry = MovieRegistry()
+        self.cinema.add_movie(self.manager, self.movie)
+        json_path = tempfile.mktemp(suffix=".json")
+        snapshot_path = tempfile.mktemp(suffix=".snap")
+        self.cinema.save_to_json(json_path)
+        self.cinema.save_to_snapshot(snapshot_path)
+        loaded = [
+            Cinema.read_from_json(json_path, registry=registry),
+            Cinema.read_from_json(json_path, registry=registry),
+            Cinema.read_from_snapshot(snapshot_path, registry=registry),
+        ]
+        canonical = loaded[0].schedule[0]
+        for cinema in loaded:
+            self.assertIs(cinema.schedule[0], canonical)
+        self.assertIs(next(Cinema.iter_movies_from_json(
+            json_path, registry=registry)), canonical)
+        self.assertIsNot(canonical, self.movie)
+        os.remove(json_path)
+        os.remove(snapshot_path)
+
+    def test_reload_after_editing_loaded_movie(self):
+        registry = MovieRegistry()
+        self.cinema.add_movie(self.manager, self.movie)
+        path = tempfile.mktemp(suffix=".json")
+        self.cinema.save_to_json(path)
+        try:
+            first = Cinema.read_from_json(path, registry=registry)
+            first.schedule[0].increase_rating(1)
+            second = Cinema.read_from_json(path, registry=registry)
+        finally:
+            os.remove(path)
+        self.assertEqual(second.schedule[0].rating, 8.8)
+        self.assertIs(registry.get("Inception", "Christopher Nolan", 2010),
+                      first.schedule[0])
+
     def test_add_movie_with_invalid_role_should_fail(self):
         technician = Staff("Ola", "Tester", "technician")
         with self.assertRaises(PermissionError):
@@ -597,6 +747,327 @@ class TestCinema(unittest.TestCase):
         self.assertIn("KinoTest", result)
         self.assertIn("Testowa 123", result)
 
+    def test_title_and_genre_index_follow_mutations(self):
+        matrix = Movie("Matrix", "Sci-Fi", 136, 16, "Wachowski",
+                       "EN", 1999, 8.7, "Desc")
+        titanic = Movie("Titanic", "Drama", 195, 13, "Cameron",
+                        "EN", 1997, 9.0, "Desc")
+        test_cases = [
+            ("add_movie", lambda c: c.add_movie(self.manager, matrix),
+             ["Matrix"], {"sci-fi": [matrix]}),
+            ("choose_movies_to_play",
+             lambda c: c.choose_movies_to_play(self.manager,
+                                               [matrix, titanic]),
+             ["Matrix", "Titanic"],
+             {"sci-fi": [matrix], "drama": [titanic]}),
+            ("remove_movie",
+             lambda c: (c.add_movie(self.manager, matrix),
+                        c.remove_movie(self.manager, matrix)),
+             [], {"sci-fi": []}),
+            ("remove_all_movies",
+             lambda c: (c.add_movie(self.manager, matrix),
+                        c.remove_all_movies(self.manager)),
+             [], {"sci-fi": []}),
+            ("clear_schedule",
+             lambda c: (c.add_movie(self.manager, titanic),
+                        c.clear_schedule()),
+             [], {"drama": []}),
+            ("schedule_assignment",
+             lambda c: setattr(c, "schedule", [titanic]),
+             ["Titanic"], {"DRAMA": [titanic], "sci-fi": []}),
+        ]
+        for case, mutate, present, genres in test_cases:
+            with self.subTest(case=case):
+                cinema = Cinema("KinoTest", "Testowa 123")
+                mutate(cinema)
+                for title in ("Matrix", "Titanic"):
+                    self.assertEqual(cinema.has_movie(title),
+                                     title in present)
+                for title in present:
+                    self.assertEqual(
+                        cinema.get_movie_by_title(title.upper()).title,
+                        title)
+                for genre, expected in genres.items():
+                    self.assertEqual(cinema.get_movies_by_genre(genre),
+                                     expected)
+
+    def test_count_movies_by_genre_after_mutations(self):
+        drama = Movie("Titanic", "Drama", 195, 13, "Cameron",
+                      "EN", 1997, 9.0, "Desc")
+        test_cases = [
+            ("remove_movie",
+             lambda c: c.remove_movie(self.manager, drama),
+             {"Sci-Fi": 1}),
+            ("remove_all_movies",
+             lambda c: c.remove_all_movies(self.manager), {}),
+            ("clear_schedule", lambda c: c.clear_schedule(), {}),
+            ("schedule_assignment",
+             lambda c: setattr(c, "schedule", [drama]), {"Drama": 1}),
+        ]
+        for case, mutate, expected in test_cases:
+            with self.subTest(case=case):
+                cinema = Cinema("KinoTest", "Testowa 123")
+                cinema.choose_movies_to_play(self.manager,
+                                             [self.movie, drama])
+                mutate(cinema)
+                self.assertEqual(cinema.count_movies_by_genre(), expected)
+
+    def test_get_staff_by_role_after_change_position(self):
+        cinema = Cinema("KinoTest", "Testowa 123")
+        cinema.assign_staff(self.worker)
+        self.worker.change_position("manager")
+        self.assertEqual(cinema.get_staff_by_role("worker"), [])
+        self.assertEqual(cinema.get_staff_by_role("Manager"), [self.worker])
+
+    def test_remove_staff_member_by_name_removes_duplicates(self):
+        cinema = Cinema("KinoTest", "Testowa 123")
+        cinema.assign_staff(self.worker)
+        cinema.assign_staff(self.worker)
+        cinema.assign_staff(self.manager)
+        cinema.remove_staff_member_by_name("Jan", "Kowalski")
+        self.assertEqual(cinema.staff, [self.manager])
+        self.assertEqual(cinema.get_staff_by_role("worker"), [])
+
+    def test_schedule_listeners_notified(self):
+        events = []
+        self.cinema.add_listener(lambda *args: events.append(args))
+        self.cinema.add_movie(self.manager, self.movie)
+        with self.assertRaises(ValueError):
+            self.cinema.choose_movies_to_play(self.manager, [self.movie, None])
+        self.cinema.remove_movie(self.manager, self.movie)
+        self.cinema.clear_schedule()
+        self.assertEqual(events, [(self.cinema, "schedule_changed")] * 3)
+
+    def test_sell_tickets(self):
+        adult = Customer("Jan", "Nowak", 30, "jan@example.com", "pass")
+        child = Customer("Ola", "Nowak", 8, "ola@example.com", "pass")
+        cartoon = Movie("Cartoon", "Animation", 80, 0, "D", "EN", 2020,
+                        7.0, "Desc")
+        self.cinema.choose_movies_to_play(self.manager, [self.movie, cartoon])
+        sold = self.cinema.sell_tickets([(adult, self.movie),
+                                         (child, cartoon),
+                                         (adult, cartoon)])
+        self.assertEqual(sold, 3)
+        self.assertEqual(adult.ticket_history, (self.movie, cartoon))
+        self.assertEqual(child.ticket_history, (cartoon,))
+        self.assertEqual((self.movie.views, cartoon.views), (1, 2))
+        self.assertEqual(adult.loyalty_points, 20)
+
+    def test_sell_tickets_is_all_or_nothing(self):
+        adult = Customer("Jan", "Nowak", 30, "jan@example.com", "pass")
+        child = Customer("Ola", "Nowak", 8, "ola@example.com", "pass")
+        unscheduled = Movie("Elsewhere", "Drama", 90, 0, "D", "EN", 2020,
+                            7.0, "Desc")
+        self.cinema.add_movie(self.manager, self.movie)
+        test_cases = [
+            ("age_restriction", [(adult, self.movie), (child, self.movie)]),
+            ("not_scheduled", [(adult, self.movie), (adult, unscheduled)]),
+            ("missing_customer", [(adult, self.movie), (None, self.movie)]),
+            ("invalid_movie", [(adult, self.movie), (adult, None)]),
+        ]
+        for case, pairs in test_cases:
+            with self.subTest(case=case):
+                with self.assertRaises(ValueError):
+                    self.cinema.sell_tickets(pairs)
+                self.assertEqual(adult.ticket_history, ())
+                self.assertEqual(self.movie.views, 0)
+
+    def test_has_movie_is_case_sensitive(self):
+        self.cinema.add_movie(self.manager, self.movie)
+        self.assertTrue(self.cinema.has_movie("Inception"))
+        self.assertFalse(self.cinema.has_movie("inception"))
+
+    def test_get_movie_by_title_returns_first_added_duplicate(self):
+        duplicate = Movie("INCEPTION", "Drama", 100, 0, "D", "PL",
+                          2001, 5.0, "Desc")
+        self.cinema.add_movie(self.manager, self.movie)
+        self.cinema.add_movie(self.manager, duplicate)
+        self.assertIs(self.cinema.get_movie_by_title("inception"),
+                      self.movie)
+        self.cinema.remove_movie(self.manager, self.movie)
+        self.assertIs(self.cinema.get_movie_by_title("inception"),
+                      duplicate)
+
+    def test_schedule_snapshot_is_not_changed_by_writers(self):
+        self.cinema.add_movie(self.manager, self.movie)
+        snapshot = self.cinema.schedule
+        extra = Movie("Extra", "Drama", 90, 0, "D", "EN", 2001, 6.0, "Desc")
+        self.cinema.add_movie(self.manager, extra)
+        self.cinema.remove_movie(self.manager, self.movie)
+        self.assertEqual(snapshot, [self.movie])
+        self.assertEqual(snapshot.by_genre("drama"), [])
+        self.assertEqual(self.cinema.schedule, [extra])
+        with self.assertRaises(ValueError):
+            snapshot.add(extra)
+
+    def test_schedule_snapshot_is_reused_until_next_write(self):
+        self.cinema.add_movie(self.manager, self.movie)
+        snapshot = self.cinema.schedule
+        self.assertIs(self.cinema.schedule, snapshot)
+        self.assertTrue(snapshot.frozen)
+        self.cinema.remove_movie(self.manager, self.movie)
+        self.assertIsNot(self.cinema.schedule, snapshot)
+        self.assertEqual(snapshot, [self.movie])
+
+    def test_readers_do_not_wait_for_writers(self):
+        self.cinema.add_movie(self.manager, self.movie)
+        titles = []
+        with self.cinema._editing_schedule() as schedule:
+            schedule.add(Movie("Extra", "Drama", 90, 0, "D", "EN", 2001,
+                               6.0, "Desc"))
+            reader = threading.Thread(
+                target=lambda: titles.append(self.cinema.list_movies()))
+            reader.start()
+            reader.join(timeout=5)
+            self.assertFalse(reader.is_alive())
+        self.assertEqual(titles, [["Inception"]])
+        self.assertEqual(self.cinema.list_movies(), ["Inception", "Extra"])
+
+    def test_choose_movies_to_play_publishes_nothing_on_error(self):
+        self.cinema.add_movie(self.manager, self.movie)
+        extra = Movie("Extra", "Drama", 90, 0, "D", "EN", 2001, 6.0, "Desc")
+        with self.assertRaises(ValueError):
+            self.cinema.choose_movies_to_play(self.manager, [extra, None])
+        self.assertEqual(self.cinema.schedule, [self.movie])
+
+    def test_readers_see_consistent_snapshots_during_writes(self):
+        movies = [Movie(f"Movie {i}", "Drama", 90, 0, "D", "EN", 2001,
+                        6.0, "Desc") for i in range(200)]
+        errors = []
+        done = threading.Event()
+
+        def read():
+            while not done.is_set():
+                schedule = self.cinema.schedule
+                titles = [movie.title for movie in schedule]
+                if (schedule.by_genre("drama") != list(schedule)
+                        or len(titles) != len(set(titles))):
+                    errors.append(titles)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        try:
+            for movie in movies:
+                self.cinema.add_movie(self.manager, movie)
+            for movie in movies[::2]:
+                self.cinema.remove_movie(self.manager, movie)
+        finally:
+            done.set()
+            for reader in readers:
+                reader.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(self.cinema.schedule, movies[1::2])
+
+    def test_add_screening(self):
+        hall = Auditorium("Hall 1", 10, 20)
+        self.cinema.add_movie(self.manager, self.movie)
+        unscheduled = Movie("Elsewhere", "Drama", 90, 0, "D", "EN", 2020,
+                            7.0, "Desc")
+        test_cases = [
+            ("not_manager", self.worker, self.movie, PermissionError),
+            ("not_scheduled", self.manager, unscheduled, ValueError),
+            ("missing_movie", self.manager, None, ValueError),
+        ]
+        for case, staff_member, movie, expected_exception in test_cases:
+            with self.subTest(case=case):
+                with self.assertRaises(expected_exception):
+                    self.cinema.add_screening(staff_member, movie, hall)
+        screening = self.cinema.add_screening(self.manager, self.movie, hall,
+                                              hold_ttl=60)
+        self.assertEqual(screening.hold_ttl, 60)
+        self.assertEqual(self.cinema.get_screenings(self.movie), [screening])
+        self.assertEqual(self.cinema.get_screenings(unscheduled), [])
+
+    def test_showtimes(self):
+        self.cinema.add_movie(self.manager, self.movie)
+        evening = self.cinema.add_showtime(self.manager, self.movie, 3,
+                                           datetime(2025, 5, 20, 19))
+        test_cases = [
+            ("not_manager", self.worker, self.movie, 1, PermissionError),
+            ("clash", self.manager, self.movie, 3, ValueError),
+            ("missing_movie", self.manager, None, 1, ValueError),
+        ]
+        for case, staff_member, movie, screen, expected_exception in \
+                test_cases:
+            with self.subTest(case=case):
+                with self.assertRaises(expected_exception):
+                    self.cinema.add_showtime(staff_member, movie, screen,
+                                             datetime(2025, 5, 20, 20))
+        self.assertEqual(self.cinema.get_showtimes_between(
+            datetime(2025, 5, 20, 18), datetime(2025, 5, 20, 21)), [evening])
+        with self.assertRaises(ValueError):
+            self.cinema.get_showtimes_between(datetime(2025, 5, 20, 21),
+                                              datetime(2025, 5, 20, 18))
+        self.cinema.remove_showtime(self.manager, evening)
+        self.assertEqual(len(self.cinema.showtimes), 0)
+
+    def test_removing_movie_drops_its_showtimes_and_screenings(self):
+        other = Movie("Other", "Drama", 90, 0, "D", "EN", 2020, 7.0, "Desc")
+        test_cases = [
+            ("remove_movie",
+             lambda c: c.remove_movie(self.manager, self.movie), [other]),
+            ("remove_all_movies",
+             lambda c: c.remove_all_movies(self.manager), []),
+            ("clear_schedule", lambda c: c.clear_schedule(), []),
+            ("replace_schedule",
+             lambda c: setattr(c, "schedule", [other]), [other]),
+        ]
+        for case, remove, remaining in test_cases:
+            with self.subTest(case=case):
+                cinema = Cinema("KinoTest", "Testowa 123")
+                cinema.choose_movies_to_play(self.manager,
+                                             [self.movie, other])
+                cinema.add_showtime(self.manager, self.movie, 1,
+                                    datetime(2025, 5, 20, 19))
+                kept = cinema.add_showtime(self.manager, other, 2,
+                                           datetime(2025, 5, 20, 19))
+                screening = cinema.add_screening(
+                    self.manager, self.movie, Auditorium("Hall 1", 2, 5))
+                hold = screening.hold(count=2)
+                customer = Customer("Jan", "Nowak", 30, "jan@example.com",
+                                    "pass")
+                remove(cinema)
+                self.assertEqual(cinema.get_showtimes_between(
+                    datetime(2025, 5, 20), datetime(2025, 5, 21)),
+                    [kept] if remaining else [])
+                self.assertEqual(len(cinema.showtimes), len(remaining))
+                self.assertEqual(cinema.get_screenings(self.movie), [])
+                self.assertTrue(screening.cancelled)
+                with self.assertRaises(ValueError):
+                    customer.buy_ticket(self.movie, hold)
+                self.assertEqual(customer.ticket_history, ())
+                self.assertEqual(screening.sold_count(), 0)
+
+    def test_get_free_staff(self):
+        self.cinema.assign_staff(self.manager)
+        self.cinema.assign_staff(self.worker)
+        self.worker.assign_shift("2025-05-20", "10:00")
+        self.assertEqual(self.cinema.get_free_staff("2025-05-20", "10:00"),
+                         [self.manager])
+        week = [(f"2025-05-{day}", "10:00") for day in range(19, 26)]
+        free = self.cinema.get_free_staff_for_slots(week, "worker")
+        self.assertEqual(free[("2025-05-20", "10:00")], [])
+        self.assertEqual(free[("2025-05-21", "10:00")], [self.worker])
+        self.worker.clear_schedule()
+        self.assertEqual(
+            self.cinema.get_free_staff("2025-05-20", "10:00", "worker"),
+            [self.worker])
+
+    def test_plan_roster(self):
+        self.cinema.assign_staff(self.manager)
+        self.cinema.assign_staff(self.worker)
+        demand = {("2025-06-02", "10:00"): {"worker": 1, "manager": 1}}
+        roster = self.cinema.plan_roster(demand, max_hours=40)
+        self.assertEqual(roster.assignments[("2025-06-02", "10:00")],
+                         {"worker": [self.worker], "manager": [self.manager]})
+
+    def test_add_movie_without_genre(self):
+        untyped = Movie("Untyped", None, 90, 0, "D", "EN", 2001, 6.0, "Desc")
+        self.cinema.add_movie(self.manager, untyped)
+        self.assertTrue(self.cinema.has_movie("Untyped"))
+        self.assertEqual(self.cinema.get_movies_by_genre("Drama"), [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,6 +3,8 @@ import tempfile
 import os
 from koncowy.src.customer import Customer
 from koncowy.src.movie import Movie
+from koncowy.src.movie_registry import MovieRegistry
+from koncowy.src.seating import Auditorium, Screening
 
 
 class TestCustomer(unittest.TestCase):
@@ -239,6 +241,118 @@ class TestCustomer(unittest.TestCase):
                 result = self.customer.recommend_movie(cinema)
                 self.assertEqual(result, expected)
 
+    def test_favourite_genre(self):
+        def movie(genre):
+            return Movie(f"{genre} film", genre, 90, 0, "D", "EN",
+                         2020, 7.0, "Desc")
+
+        test_cases = [
+            ("no_history", [], None),
+            ("single_genre", ["Drama"], "Drama"),
+            ("clear_winner", ["Drama", "Horror", "Horror"], "Horror"),
+            ("tie_goes_to_first_seen", ["Horror", "Drama", "Drama",
+                                        "Horror"], "Horror"),
+            ("tie_first_seen_catches_up", ["Drama", "Horror", "Horror",
+                                           "Drama"], "Drama"),
+        ]
+        for case, genres, expected in test_cases:
+            for source in ("buy_ticket", "assignment"):
+                with self.subTest(case=case, source=source):
+                    customer = Customer("Jan", "Nowak", 30,
+                                        "jan@example.com", "pass")
+                    movies = [movie(genre) for genre in genres]
+                    if source == "buy_ticket":
+                        for m in movies:
+                            customer.buy_ticket(m)
+                    else:
+                        customer.ticket_history = movies
+                    self.assertEqual(customer.favourite_genre(), expected)
+
+    def test_genre_counts_rebuilt_by_read_from_json(self):
+        movies = [Movie(f"T{i}", genre, 90, 0, "D", "EN", 2020, 7.0, "Desc")
+                  for i, genre in enumerate(["Drama", "Comedy", "Comedy"])]
+        for m in movies:
+            self.customer.buy_ticket(m)
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as tmp:
+            tmp_path = tmp.name
+        self.customer.save_to_json(tmp_path)
+        loaded = Customer.read_from_json(tmp_path)
+        self.assertEqual(loaded.genre_counts(), {"Drama": 1, "Comedy": 2})
+        self.assertEqual(loaded.favourite_genre(), "Comedy")
+        os.remove(tmp_path)
+
+    def test_buy_tickets(self):
+        calls = []
+
+        class CountingMovie(Movie):
+            def watch(self, times=1):
+                calls.append((self.title, times))
+                super().watch(times)
+
+        kids = CountingMovie("Kids", "Animation", 80, 0, "D", "EN",
+                             2020, 7.0, "Desc")
+        drama = CountingMovie("Drama", "Drama", 120, 12, "D", "EN",
+                              2020, 7.0, "Desc")
+        self.customer.buy_tickets([kids, drama, kids])
+        self.assertEqual(self.customer.ticket_history, (kids, drama, kids))
+        self.assertEqual(self.customer.loyalty_points, 30)
+        self.assertEqual(self.customer.favourite_genre(), "Animation")
+        self.assertEqual(sorted(calls), [("Drama", 1), ("Kids", 2)])
+        self.assertEqual((kids.views, drama.views), (2, 1))
+
+    def test_buy_tickets_is_all_or_nothing(self):
+        kids = Movie("Kids", "Animation", 80, 0, "D", "EN", 2020, 7.0, "Desc")
+        adult = Movie("Adult", "Horror", 80, 30, "D", "EN", 2020, 7.0,
+                      "Desc")
+        test_cases = [
+            ("age_restriction", [kids, adult]),
+            ("invalid_movie", [kids, "Not a movie"]),
+        ]
+        for case, movies in test_cases:
+            with self.subTest(case=case):
+                with self.assertRaises(ValueError):
+                    self.customer.buy_tickets(movies)
+                self.assertEqual(self.customer.ticket_history, ())
+                self.assertEqual(self.customer.loyalty_points, 0)
+                self.assertEqual(kids.views, 0)
+
+    def test_buy_tickets_notifies_once(self):
+        events = []
+        self.customer.add_listener(lambda *args: events.append(args))
+        kids = Movie("Kids", "Animation", 80, 0, "D", "EN", 2020, 7.0, "Desc")
+        self.customer.buy_tickets([])
+        self.customer.buy_tickets([kids, kids])
+        self.assertEqual(events,
+                         [(self.customer, "tickets_bought", [kids, kids])])
+
+    def test_ticket_history_is_read_only(self):
+        kids = Movie("Kids", "Animation", 80, 0, "D", "EN", 2020, 7.0, "Desc")
+        drama = Movie("Drama", "Drama", 120, 12, "D", "EN", 2020, 7.0, "Desc")
+        self.customer.buy_ticket(kids)
+        history = self.customer.ticket_history
+        with self.assertRaises(AttributeError):
+            history.append(drama)
+        self.customer.buy_tickets([drama, drama])
+        self.assertEqual(history, (kids,))
+        self.assertEqual(self.customer.ticket_history, (kids, drama, drama))
+        self.assertEqual(self.customer.favourite_genre(), "Drama")
+
+    def test_buy_ticket_with_hold(self):
+        kids = Movie("Kids", "Animation", 80, 0, "D", "EN", 2020, 7.0, "Desc")
+        other = Movie("Other", "Drama", 80, 0, "D", "EN", 2020, 7.0, "Desc")
+        screening = Screening(kids, Auditorium("Hall 1", 2, 5))
+        hold = screening.hold(count=3)
+        with self.assertRaises(ValueError):
+            self.customer.buy_ticket(other, hold)
+        self.assertTrue(self.customer.buy_ticket(kids, hold))
+        self.assertEqual(self.customer.ticket_history, (kids,) * 3)
+        self.assertEqual(self.customer.loyalty_points, 30)
+        self.assertEqual(kids.views, 3)
+        self.assertEqual(screening.sold_count(), 3)
+        with self.assertRaises(ValueError):
+            self.customer.buy_ticket(kids, hold)
+        self.assertEqual(self.customer.ticket_history, (kids,) * 3)
+
     def test_to_dict(self):
         data = self.customer.to_dict()
         self.assertEqual(data['first_name'], "John")
@@ -276,6 +390,22 @@ class TestCustomer(unittest.TestCase):
         self.assertEqual(len(loaded.ticket_history), 1)
         os.remove(tmp_path)
 
+    def test_read_from_json_shares_movie_instances(self):
+        registry = MovieRegistry()
+        movie = Movie("Movie F", "Action", 100, 10, "Director F",
+                      "EN", 2023, 9.0, "Description F")
+        canonical = registry.intern(movie)
+        self.customer.ticket_history = [movie, movie]
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as tmp:
+            tmp_path = tmp.name
+        self.customer.save_to_json(tmp_path)
+        first = Customer.read_from_json(tmp_path, registry=registry)
+        second = Customer.read_from_json(tmp_path, registry=registry)
+        self.assertIs(first.ticket_history[0], canonical)
+        self.assertIs(first.ticket_history[1], canonical)
+        self.assertIs(second.ticket_history[0], canonical)
+        os.remove(tmp_path)
+
     def test_ticket_and_has_ticket_logic(self):
         movie = Movie("Movie G",
                       "Sci-Fi",
@@ -0,0 +1,138 @@
+import io
+import json
+import unittest
+from koncowy.src.json_stream import (dump_json, dump_json_lines, iter_json,
+                                     iter_json_array, iter_json_lines,
+                                     iter_json_object)
+
+
+class TestJsonStream(unittest.TestCase):
+
+    def test_matches_json_dumps(self):
+        values = [
+            ("empty_list", []),
+            ("empty_dict", {}),
+            ("flat_list", [1, "a", None]),
+            ("list_of_dicts", [{"a": 1, "b": [1, 2]}, {"c": {"d": "e"}}]),
+            ("nested_dict", {"name": "X", "items": [{"a": 1}], "e": []}),
+        ]
+        for indent in (4, 2, None):
+            for case, value in values:
+                with self.subTest(case=case, indent=indent):
+                    if isinstance(value, list):
+                        stream = iter(value)
+                    else:
+                        stream = {k: iter(v) if isinstance(v, list) else v
+                                  for k, v in value.items()}
+                    text = "".join(iter_json(stream, indent))
+                    if indent is None:
+                        expected = json.dumps(value, separators=(",", ":"))
+                    else:
+                        expected = json.dumps(value, indent=indent)
+                    self.assertEqual(text, expected)
+
+    def test_iter_json_is_lazy(self):
+        consumed = []
+
+        def items():
+            for i in range(3):
+                consumed.append(i)
+                yield {"i": i}
+
+        chunks = iter_json(items(), indent=None)
+        next(chunks)
+        self.assertEqual(consumed, [])
+        next(chunks)
+        next(chunks)
+        self.assertEqual(consumed, [0])
+
+    def test_dump_json(self):
+        f = io.StringIO()
+        dump_json(iter([{"a": 1}]), f, indent=None)
+        self.assertEqual(f.getvalue(), '[{"a":1}]')
+
+    def test_dump_json_lines(self):
+        f = io.StringIO()
+        dump_json_lines(iter([{"a": 1}, {"b": "x y"}]), f)
+        self.assertEqual(f.getvalue(), '{"a":1}\n{"b":"x y"}\n')
+
+    def test_iter_json_array_across_chunk_boundaries(self):
+        items = [{"title": "A b", "rating": 8.25, "tags": [1, 22]},
+                 12345, "x", None, True, [], {}]
+        for indent in (None, 4):
+            for chunk_size in (1, 3, 7, 65536):
+                with self.subTest(indent=indent, chunk_size=chunk_size):
+                    f = io.StringIO(json.dumps(items, indent=indent))
+                    self.assertEqual(
+                        list(iter_json_array(f, chunk_size=chunk_size)),
+                        items)
+
+    def test_iter_json_array_numbers_across_chunk_boundaries(self):
+        test_cases = [
+            ("floats", "[7.5, 1.25, 3]", [7.5, 1.25, 3]),
+            ("exponents", "[1e10,2.5E-3,-4e+2]", [1e10, 2.5e-3, -4e+2]),
+            ("negative", "[-12.75, -0.5]", [-12.75, -0.5]),
+        ]
+        for case, text, expected in test_cases:
+            for chunk_size in range(1, 6):
+                with self.subTest(case=case, chunk_size=chunk_size):
+                    self.assertEqual(
+                        list(iter_json_array(io.StringIO(text),
+                                             chunk_size=chunk_size)),
+                        expected)
+
+    def test_iter_json_array_by_key(self):
+        document = {"name": "X", "schedule": [{"a": 1}, {"a": 2}],
+                    "staff": ["s"]}
+        test_cases = [
+            ("object", json.dumps(document), [{"a": 1}, {"a": 2}]),
+            ("top_level_array", json.dumps([{"a": 3}]), [{"a": 3}]),
+            ("missing_key", json.dumps({"name": "X"}), []),
+            ("null_value", json.dumps({"schedule": None}), []),
+        ]
+        for case, text, expected in test_cases:
+            with self.subTest(case=case):
+                f = io.StringIO(text)
+                self.assertEqual(
+                    list(iter_json_array(f, key="schedule", chunk_size=5)),
+                    expected)
+
+    def test_iter_json_object_streams_selected_keys(self):
+        text = json.dumps({"name": "X", "schedule": [1, 2, 3],
+                           "staff": ["a"]}, indent=4)
+        pairs = iter_json_object(io.StringIO(text),
+                                 stream_keys=("schedule",), chunk_size=4)
+        self.assertEqual(next(pairs), ("name", "X"))
+        key, schedule = next(pairs)
+        self.assertEqual(key, "schedule")
+        self.assertEqual(next(schedule), 1)
+        self.assertEqual(next(pairs), ("staff", ["a"]))
+        self.assertEqual(list(pairs), [])
+
+    def test_invalid_documents_should_fail(self):
+        test_cases = [
+            ("truncated_array", iter_json_array, "[1, 2"),
+            ("missing_comma", iter_json_array, "[1 2]"),
+            ("not_an_array", iter_json_array, "{}"),
+            ("truncated_object", iter_json_object, '{"a": 1'),
+        ]
+        for case, reader, text in test_cases:
+            with self.subTest(case=case):
+                with self.assertRaises(json.JSONDecodeError):
+                    list(reader(io.StringIO(text), chunk_size=2))
+
+    def test_iter_json_lines(self):
+        text = '{"a":1}\n\n{"a":2}\n{"a":3}\n'
+        test_cases = [
+            ("single_items", None, [{"a": 1}, {"a": 2}, {"a": 3}]),
+            ("batches", 2, [[{"a": 1}, {"a": 2}], [{"a": 3}]]),
+        ]
+        for case, batch_size, expected in test_cases:
+            with self.subTest(case=case):
+                self.assertEqual(
+                    list(iter_json_lines(io.StringIO(text), batch_size)),
+                    expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
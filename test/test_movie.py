@@ -2,6 +2,8 @@ import unittest
 import tempfile
 import os
 import json
+import sys
+import threading
 from koncowy.src.movie import Movie
 
 
@@ -54,6 +56,49 @@ class TestMovie(unittest.TestCase):
                     movie.watch()
                 self.assertEqual(movie.views, expected_views)
 
+    def test_watch_times(self):
+        self.movie.watch(3)
+        self.assertEqual(self.movie.views, 3)
+        with self.assertRaises(ValueError):
+            self.movie.watch(-1)
+
+    def test_concurrent_watch_counts_every_view(self):
+        threads_count, watches = 16, 5000
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            barrier = threading.Barrier(threads_count)
+
+            def worker():
+                barrier.wait()
+                for _ in range(watches):
+                    self.movie.watch()
+                self.movie.watch(2)
+
+            threads = [threading.Thread(target=worker)
+                       for _ in range(threads_count)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        expected = threads_count * (watches + 2)
+        self.assertEqual(self.movie.views, expected)
+        self.assertEqual(self.movie.to_dict()["views"], expected)
+        self.assertIn(f"Views: {expected}", str(self.movie))
+
+    def test_views_assignment_resets_counter(self):
+        self.movie.watch(5)
+        self.movie.views = 2
+        self.movie.watch()
+        self.assertEqual(self.movie.views, 3)
+
+    def test_watch_all_aggregates_views(self):
+        other = Movie("Other", "Drama", 90, 0, "D", "EN", 2000, 7.0, "Desc")
+        Movie.watch_all([self.movie, other, self.movie])
+        self.assertEqual((self.movie.views, other.views), (2, 1))
+
     def test_is_suitable_for_age(self):
         test_cases = [
             (20, True),
@@ -139,6 +184,30 @@ class TestMovie(unittest.TestCase):
 
         os.remove(tmp_file.name)
 
+    def test_movie_is_slotted(self):
+        self.assertFalse(hasattr(self.movie, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.movie.poster = "poster.png"
+
+    def test_to_dict_is_a_copy(self):
+        data = self.movie.to_dict()
+        data["title"] = "Changed"
+        data["views"] = 100
+        self.assertEqual(self.movie.title, "Inception")
+        self.assertEqual(self.movie.views, 0)
+        self.assertEqual(list(data), list(Movie.FIELDS) + ["views"])
+
+    def test_save_to_json_keeps_views(self):
+        self.movie.watch()
+        self.movie.watch()
+        with tempfile.NamedTemporaryFile(delete=False,
+                                         suffix=".json") as tmp_file:
+            tmp_file.close()
+            self.movie.save_to_json(tmp_file.name)
+            loaded_movie = Movie.read_from_json(tmp_file.name)
+            self.assertEqual(loaded_movie.to_dict(), self.movie.to_dict())
+        os.remove(tmp_file.name)
+
     def test_save_to_file_and_read(self):
         with tempfile.NamedTemporaryFile(delete=False,
                                          suffix='.txt') as tmp_file:
@@ -0,0 +1,104 @@
+import gc
+import unittest
+from koncowy.src.movie import Movie
+from koncowy.src.movie_registry import MovieRegistry
+
+
+class TestMovieRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = MovieRegistry()
+        self.movie = Movie("Inception", "Sci-Fi", 148, 13,
+                           "Christopher Nolan", "English", 2010, 8.8,
+                           "Dreams within dreams")
+
+    def test_intern_returns_canonical_instance(self):
+        duplicate = Movie("Inception", "Sci-Fi", 148, 13,
+                          "Christopher Nolan", "English", 2010, 8.8,
+                          "Dreams within dreams")
+        self.assertIs(self.registry.intern(self.movie), self.movie)
+        self.assertIs(self.registry.intern(duplicate), self.movie)
+        self.assertIn(self.movie, self.registry)
+        self.assertNotIn(duplicate, self.registry)
+        self.assertEqual(len(self.registry), 1)
+
+    def test_intern_conflicting_movie_is_not_interned(self):
+        conflicting = Movie("Inception", "Thriller", 148, 13,
+                            "Christopher Nolan", "English", 2010, 9.5,
+                            "Dreams within dreams")
+        self.registry.intern(self.movie)
+        self.assertIs(self.registry.intern(conflicting), conflicting)
+        self.assertNotIn(conflicting, self.registry)
+        self.assertIs(self.registry.get("Inception", "Christopher Nolan",
+                                        2010), self.movie)
+
+    def test_movie_from_dict(self):
+        test_cases = [
+            ("registered", True, True),
+            ("not_registered", False, False),
+        ]
+        for case, register, expect_same in test_cases:
+            with self.subTest(case=case):
+                registry = MovieRegistry()
+                if register:
+                    registry.intern(self.movie)
+                loaded = registry.movie_from_dict(self.movie.to_dict())
+                self.assertEqual(loaded is self.movie, expect_same)
+                self.assertEqual(loaded.to_dict(), self.movie.to_dict())
+                self.assertIs(registry.movie_from_dict(
+                    self.movie.to_dict()), loaded)
+
+    def test_movie_from_dict_conflicting_data(self):
+        test_cases = [
+            ("rating", {"rating": 9.5}),
+            ("genre", {"genre": "Thriller"}),
+            ("description", {"description": "Other description"}),
+        ]
+        self.registry.intern(self.movie)
+        for case, changes in test_cases:
+            with self.subTest(case=case):
+                data = dict(self.movie.to_dict(), **changes)
+                loaded = self.registry.movie_from_dict(data)
+                self.assertIsNot(loaded, self.movie)
+                self.assertEqual(getattr(loaded, case), changes[case])
+                self.assertNotEqual(getattr(self.movie, case), changes[case])
+                self.assertIs(self.registry.get("Inception",
+                                                "Christopher Nolan", 2010),
+                              self.movie)
+
+    def test_movie_from_dict_after_canonical_edit(self):
+        data = self.movie.to_dict()
+        self.registry.intern(self.movie)
+        self.movie.increase_rating(1)
+        loaded = self.registry.movie_from_dict(data)
+        self.assertEqual(loaded.rating, 8.8)
+        self.assertEqual(self.movie.rating, 9.8)
+
+    def test_movie_from_dict_ignores_views(self):
+        self.registry.intern(self.movie)
+        data = dict(self.movie.to_dict(), views=42)
+        self.assertIs(self.registry.movie_from_dict(data), self.movie)
+
+    def test_movie_from_dict_missing_field_should_fail(self):
+        with self.assertRaises(KeyError):
+            self.registry.movie_from_dict({"title": "Broken"})
+
+    def test_get(self):
+        self.registry.intern(self.movie)
+        self.assertIs(self.registry.get("Inception", "Christopher Nolan",
+                                        2010), self.movie)
+        self.assertIsNone(self.registry.get("Inception", "Other", 2010))
+
+    def test_unused_movies_are_released(self):
+        self.registry.movie_from_dict(self.movie.to_dict())
+        gc.collect()
+        self.assertEqual(len(self.registry), 0)
+
+    def test_clear(self):
+        self.registry.intern(self.movie)
+        self.registry.clear()
+        self.assertEqual(len(self.registry), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
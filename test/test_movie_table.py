@@ -0,0 +1,77 @@
+import unittest
+from koncowy.src.cinema import Cinema
+from koncowy.src.movie import Movie
+from koncowy.src.movie_table import MovieTable
+from koncowy.src.staff import Staff
+
+
+class TestMovieTable(unittest.TestCase):
+
+    def setUp(self):
+        self.movies = [
+            Movie("Inception", "Sci-Fi", 148, 13, "Nolan", "English",
+                  2010, 8.8, "Desc"),
+            Movie("Rejs", "Komedia", 69, 12, "Piwowski", "Polski",
+                  1970, 8.1, "Desc"),
+            Movie("Potop", "Dramat", 315, 12, "Hoffman", "polski",
+                  1974, 7.9, "Desc"),
+            Movie("Psy", "Kryminał", 104, 16, "Pasikowski", "Polski",
+                  1992, 8.0, "Desc"),
+        ]
+        self.table = MovieTable(self.movies)
+
+    def test_predicates_match_movie_methods(self):
+        test_cases = [
+            ("classic", MovieTable.is_classic, Movie.is_classic, ()),
+            ("highly_rated", MovieTable.is_highly_rated,
+             Movie.is_highly_rated, ()),
+            ("language", MovieTable.is_in_language, Movie.is_in_language,
+             ("POLSKI",)),
+            ("unknown_language", MovieTable.is_in_language,
+             Movie.is_in_language, ("Deutsch",)),
+            ("age_12", MovieTable.is_suitable_for_age,
+             Movie.is_suitable_for_age, (12,)),
+        ]
+        for case, table_predicate, movie_predicate, args in test_cases:
+            with self.subTest(case=case):
+                self.assertEqual(
+                    table_predicate(self.table, *args).tolist(),
+                    [movie_predicate(m, *args) for m in self.movies])
+
+    def test_combined_filter(self):
+        mask = self.table.filter(classic=True, highly_rated=True,
+                                 language="polski", age=12)
+        self.assertEqual(self.table.indices(mask).tolist(), [1])
+        self.assertEqual(self.table.movies(mask), [self.movies[1]])
+
+    def test_filter_negated_flags(self):
+        mask = self.table.filter(classic=False)
+        self.assertEqual(self.table.movies(mask), [self.movies[0]])
+        self.assertTrue(self.table.filter().all())
+
+    def test_invalid_arguments_should_fail(self):
+        test_cases = [
+            ("empty_language", lambda: self.table.is_in_language("")),
+            ("negative_age", lambda: self.table.is_suitable_for_age(-1)),
+        ]
+        for case, call in test_cases:
+            with self.subTest(case=case):
+                with self.assertRaises(ValueError):
+                    call()
+
+    def test_from_cinema(self):
+        cinema = Cinema("KinoTest", "Testowa 123")
+        cinema.choose_movies_to_play(Staff("Anna", "Nowak", "manager"),
+                                     self.movies)
+        table = MovieTable.from_cinema(cinema)
+        self.assertEqual(len(table), 4)
+        self.assertEqual(table.movies(table.is_classic()), self.movies[1:])
+
+    def test_empty_table(self):
+        table = MovieTable([])
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.movies(table.filter(language="EN")), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
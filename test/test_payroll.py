@@ -0,0 +1,65 @@
+import unittest
+from koncowy.src.cinema import Cinema
+from koncowy.src.payroll import compute_payroll
+from koncowy.src.staff import Staff
+
+
+class TestPayroll(unittest.TestCase):
+
+    def setUp(self):
+        self.anna = Staff("Anna", "Nowak", "Manager")
+        self.jan = Staff("Jan", "Kowalski", "worker")
+        self.ewa = Staff("Ewa", "Lis", "worker")
+        self.idle = Staff("Piotr", "Zych", "cashier")
+        self.anna.assign_shift("2025-06-02", "08:00", "16:00")
+        self.anna.assign_shift("2025-06-09", "08:00", "12:00")
+        self.jan.assign_shift("2025-06-03", "10:00")
+        self.jan.assign_shift("2025-06-08", "22:00", "02:00")
+        self.ewa.assign_shift("2025-06-10", "12:00", "15:30")
+        self.staff = [self.anna, self.jan, self.ewa, self.idle]
+
+    def test_hours_per_employee(self):
+        report = compute_payroll(self.staff)
+        test_cases = [
+            ("manager", self.anna, 12),
+            ("overnight_shift", self.jan, 9),
+            ("half_hour", self.ewa, 3.5),
+            ("no_shifts", self.idle, 0),
+        ]
+        for case, staff_member, expected in test_cases:
+            with self.subTest(case=case):
+                self.assertEqual(report.hours_for(staff_member), expected)
+
+    def test_hours_by_role_and_week(self):
+        report = compute_payroll(self.staff)
+        self.assertEqual(report.hours_by_role(),
+                         {"manager": 12, "worker": 12.5, "cashier": 0})
+        self.assertEqual(report.hours_by_week(),
+                         {"2025-06-02": 17, "2025-06-09": 7.5})
+        self.assertEqual(report.weekly_hours_for(self.jan),
+                         {"2025-06-02": 9, "2025-06-09": 0})
+
+    def test_date_range(self):
+        report = compute_payroll(self.staff, "2025-06-03", "2025-06-09")
+        self.assertEqual(report.hours_for(self.anna), 4)
+        self.assertEqual(report.hours_for(self.jan), 9)
+        self.assertEqual(report.hours_for(self.ewa), 0)
+        self.assertEqual(report.weeks, ["2025-06-02", "2025-06-09"])
+
+    def test_no_shifts(self):
+        report = compute_payroll([self.idle, self.idle])
+        self.assertEqual(report.staff, [self.idle])
+        self.assertEqual(report.hours_by_week(), {})
+        self.assertEqual(report.hours_by_role(), {"cashier": 0})
+
+    def test_cinema_payroll_uses_distinct_staff(self):
+        cinema = Cinema("KinoTest", "Testowa 123")
+        for staff_member in self.staff + [self.jan]:
+            cinema.assign_staff(staff_member)
+        report = cinema.payroll()
+        self.assertEqual(report.staff, self.staff)
+        self.assertEqual(report.hours_for(self.jan), 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,291 @@
+import random
+import unittest
+from koncowy.src.cinema import Cinema
+from koncowy.src.customer import Customer
+from koncowy.src.movie import Movie
+from koncowy.src.recommendation import (CoOccurrenceRecommender,
+                                        RecommendationCache,
+                                        favourite_genres,
+                                        genre_count_matrix,
+                                        recommend_movies)
+from koncowy.src.staff import Staff
+
+GENRES = ["Drama", "Sci-Fi", "Comedy", "Horror", "drama"]
+
+
+class TestRecommendation(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.catalog = [Movie(f"Movie {i}", GENRES[i % len(GENRES)], 90, 0,
+                              "D", "EN", 2000, 7.0, "Desc")
+                        for i in range(20)]
+        self.customers = []
+        for i in range(60):
+            customer = Customer("Jan", "Nowak", 30, f"jan{i}@example.com",
+                                "pass")
+            for _ in range(rng.randrange(0, 8)):
+                customer.buy_ticket(rng.choice(self.catalog))
+            self.customers.append(customer)
+        self.cinema = Cinema("KinoTest", "Testowa 123")
+        self.cinema.choose_movies_to_play(
+            Staff("Anna", "Nowak", "manager"),
+            [m for m in self.catalog if m.genre != "Horror"])
+
+    def test_genre_count_matrix(self):
+        customer = self.customers[0]
+        customer.ticket_history = [self.catalog[1], self.catalog[0],
+                                   self.catalog[6]]
+        genres, counts, first_seen = genre_count_matrix([customer])
+        self.assertEqual(genres, ["Sci-Fi", "Drama"])
+        self.assertEqual(counts.tolist(), [[2, 1]])
+        self.assertEqual(first_seen.tolist(), [[0, 1]])
+
+    def test_favourite_genres_match_customer(self):
+        self.assertEqual(favourite_genres(self.customers),
+                         [c.favourite_genre() for c in self.customers])
+
+    def test_recommend_movies_match_customer(self):
+        expected = [c.recommend_movie(self.cinema) for c in self.customers]
+        test_cases = [
+            ("single_process", {}),
+            ("process_pool", {"processes": 2, "chunk_size": 16}),
+        ]
+        for case, options in test_cases:
+            with self.subTest(case=case):
+                result = recommend_movies(self.customers, self.cinema,
+                                          **options)
+                self.assertEqual(len(result), len(expected))
+                for got, want in zip(result, expected):
+                    self.assertIs(got, want)
+
+    def test_empty_population(self):
+        self.assertEqual(recommend_movies([], self.cinema), [])
+        no_history = Customer("Ewa", "Lis", 20, "ewa@example.com", "pass")
+        self.assertEqual(recommend_movies([no_history], self.cinema), [None])
+
+
+class TestCoOccurrenceRecommender(unittest.TestCase):
+
+    def setUp(self):
+        self.movies = [Movie(f"Movie {i}", "Drama", 90, 16 if i == 4 else 0,
+                             "D", "EN", 2000, 7.0, "Desc")
+                       for i in range(6)]
+        self.customers = [Customer("Jan", "Nowak", age, f"jan{i}@example.com",
+                                   "pass")
+                          for i, age in enumerate([14, 14, 20, 14])]
+        for customer in self.customers:
+            customer.activate_account()
+        histories = [[0, 1, 2], [0, 1], [0, 3, 4], [0]]
+        for customer, history in zip(self.customers, histories):
+            for index in history:
+                customer.buy_ticket(self.movies[index])
+        self.cinema = Cinema("KinoTest", "Testowa 123")
+        self.cinema.choose_movies_to_play(Staff("Anna", "Nowak", "manager"),
+                                          self.movies[:5])
+        self.recommender = CoOccurrenceRecommender(self.customers)
+
+    def test_co_occurrence_counts(self):
+        test_cases = [
+            ("shared_twice", 0, 1, 2),
+            ("symmetric", 1, 0, 2),
+            ("shared_once", 0, 3, 1),
+            ("never_together", 1, 3, 0),
+            ("unknown_movie", 5, 0, 0),
+        ]
+        for case, a, b, expected in test_cases:
+            with self.subTest(case=case):
+                self.assertEqual(self.recommender.co_occurrence(
+                    self.movies[a], self.movies[b]), expected)
+
+    def test_recommend_ranks_and_filters(self):
+        result = self.recommender.recommend(self.customers[3], self.cinema)
+        self.assertEqual(result, [self.movies[1], self.movies[2],
+                                  self.movies[3]])
+        self.assertEqual(self.recommender.recommend(
+            self.customers[3], self.cinema, k=1), [self.movies[1]])
+
+    def test_recommend_scores_recent_history_by_default(self):
+        customer = self.customers[3]
+        customer.buy_tickets(Movie(f"Extra {i}", "Drama", 90, 0, "D", "EN",
+                                   2000, 7.0, "Desc") for i in range(50))
+        test_cases = [
+            ("default_window", {}, []),
+            ("whole_history", {"recent": None},
+             [self.movies[1], self.movies[2], self.movies[3]]),
+            ("no_results", {"recent": None, "k": 0}, []),
+        ]
+        for case, options, expected in test_cases:
+            with self.subTest(case=case):
+                self.assertEqual(self.recommender.recommend(
+                    customer, self.cinema, **options), expected)
+
+    def test_neighbourhood_limits_scored_neighbours(self):
+        test_cases = [
+            ("exact", None, [self.movies[1], self.movies[2],
+                             self.movies[3]]),
+            ("closest_only", 1, [self.movies[1]]),
+        ]
+        for case, neighbourhood, expected in test_cases:
+            with self.subTest(case=case):
+                recommender = CoOccurrenceRecommender(
+                    self.customers, neighbourhood=neighbourhood)
+                self.assertEqual(
+                    recommender.recommend(self.customers[3], self.cinema),
+                    expected)
+
+    def test_recommend_excludes_watched_and_unschedulable(self):
+        self.cinema.remove_movie(Staff("Anna", "Nowak", "manager"),
+                                 self.movies[2])
+        self.assertEqual(
+            self.recommender.recommend(self.customers[1], self.cinema),
+            [self.movies[3]])
+
+    def test_recommend_for_untracked_or_inactive_customer(self):
+        stranger = Customer("Ewa", "Lis", 20, "ewa@example.com", "pass")
+        self.assertEqual(self.recommender.recommend(stranger, self.cinema),
+                         [])
+        self.customers[3].deactivate_account()
+        self.assertEqual(
+            self.recommender.recommend(self.customers[3], self.cinema), [])
+
+    def test_updates_incrementally_on_buy_ticket(self):
+        self.customers[3].buy_ticket(self.movies[3])
+        self.assertEqual(self.recommender.co_occurrence(
+            self.movies[0], self.movies[3]), 2)
+        self.customers[3].buy_ticket(self.movies[3])
+        self.assertEqual(self.recommender.co_occurrence(
+            self.movies[0], self.movies[3]), 2)
+        self.assertEqual(
+            self.recommender.recommend(self.customers[3], self.cinema,
+                                       recent=1), [])
+
+    def test_history_replacement_and_untrack(self):
+        self.customers[0].ticket_history = [self.movies[1], self.movies[3]]
+        self.assertEqual(self.recommender.co_occurrence(
+            self.movies[0], self.movies[2]), 0)
+        self.assertEqual(self.recommender.co_occurrence(
+            self.movies[1], self.movies[3]), 1)
+        self.recommender.untrack(self.customers[1])
+        self.assertEqual(self.recommender.co_occurrence(
+            self.movies[0], self.movies[1]), 0)
+        self.customers[1].buy_ticket(self.movies[3])
+        self.assertEqual(self.recommender.co_occurrence(
+            self.movies[1], self.movies[3]), 1)
+
+
+class TestRecommendationCache(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+        self.calls = []
+        self.manager = Staff("Anna", "Nowak", "manager")
+        self.drama = Movie("Drama 1", "Drama", 90, 0, "D", "EN", 2000,
+                           7.0, "Desc")
+        self.comedy = Movie("Comedy 1", "Comedy", 90, 0, "D", "EN", 2000,
+                            7.0, "Desc")
+        self.cinema = Cinema("KinoTest", "Testowa 123")
+        self.cinema.add_movie(self.manager, self.drama)
+        self.customers = [Customer("Jan", "Nowak", 30, f"jan{i}@example.com",
+                                   "pass") for i in range(3)]
+        for customer in self.customers:
+            customer.buy_ticket(self.drama)
+        self.cache = RecommendationCache(maxsize=2, ttl=10,
+                                         recommender=self.recommend,
+                                         clock=lambda: self.now)
+
+    def recommend(self, customer, cinema):
+        self.calls.append(customer)
+        return customer.recommend_movie(cinema)
+
+    def test_hits_and_misses(self):
+        customer = self.customers[0]
+        self.assertIs(self.cache.get(customer, self.cinema), self.drama)
+        self.assertIs(self.cache.get(customer, self.cinema), self.drama)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(self.calls, [customer])
+
+    def test_caches_missing_recommendation(self):
+        customer = Customer("Ewa", "Lis", 20, "ewa@example.com", "pass")
+        self.assertIsNone(self.cache.get(customer, self.cinema))
+        self.assertIsNone(self.cache.get(customer, self.cinema))
+        self.assertEqual(len(self.calls), 1)
+
+    def test_lru_eviction(self):
+        first, second, third = self.customers
+        self.cache.get(first, self.cinema)
+        self.cache.get(second, self.cinema)
+        self.cache.get(first, self.cinema)
+        self.cache.get(third, self.cinema)
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.evictions, 1)
+        self.cache.get(first, self.cinema)
+        self.cache.get(second, self.cinema)
+        self.assertEqual(self.calls, [first, second, third, second])
+
+    def test_ttl_expiry(self):
+        customer = self.customers[0]
+        self.cache.get(customer, self.cinema)
+        self.now = 9.9
+        self.cache.get(customer, self.cinema)
+        self.now = 10.0
+        self.cache.get(customer, self.cinema)
+        self.assertEqual(self.cache.stats(),
+                         {"hits": 1, "misses": 2, "evictions": 0,
+                          "size": 1, "maxsize": 2})
+
+    def test_invalidated_by_events(self):
+        other_cinema = Cinema("Other", "Street 2")
+        test_cases = [
+            ("buy_ticket", lambda c: c.buy_ticket(self.comedy), 0),
+            ("history_replaced",
+             lambda c: setattr(c, "ticket_history", []), 0),
+            ("add_movie",
+             lambda c: self.cinema.add_movie(self.manager, self.comedy), 0),
+            ("remove_movie",
+             lambda c: self.cinema.remove_movie(self.manager, self.drama), 0),
+            ("choose_movies_to_play",
+             lambda c: self.cinema.choose_movies_to_play(self.manager,
+                                                         [self.comedy]), 0),
+            ("clear_schedule", lambda c: self.cinema.clear_schedule(), 0),
+            ("other_cinema_changed",
+             lambda c: other_cinema.add_movie(self.manager, self.comedy), 1),
+            ("choose_already_scheduled",
+             lambda c: self.cinema.choose_movies_to_play(self.manager,
+                                                         [self.drama]), 1),
+        ]
+        for case, change, expected_size in test_cases:
+            with self.subTest(case=case):
+                self.cinema.schedule = [self.drama]
+                self.cache.clear()
+                customer = self.customers[0]
+                self.cache.get(customer, self.cinema)
+                change(customer)
+                self.assertEqual(len(self.cache), expected_size)
+
+    def test_fresh_value_after_invalidation(self):
+        customer = self.customers[0]
+        self.assertIs(self.cache.get(customer, self.cinema), self.drama)
+        self.cinema.remove_movie(self.manager, self.drama)
+        self.assertIsNone(self.cache.get(customer, self.cinema))
+
+    def test_listeners_released(self):
+        customer = self.customers[0]
+        self.cache.get(customer, self.cinema)
+        self.cache.clear()
+        self.assertEqual(customer._listeners, [])
+        self.assertEqual(self.cinema._listeners, [])
+
+    def test_invalid_configuration_should_fail(self):
+        test_cases = [
+            ("zero_size", {"maxsize": 0}),
+            ("negative_ttl", {"ttl": -1}),
+        ]
+        for case, options in test_cases:
+            with self.subTest(case=case):
+                with self.assertRaises(ValueError):
+                    RecommendationCache(**options)
+
+
+if __name__ == '__main__':
+    unittest.main()
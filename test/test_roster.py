@@ -0,0 +1,138 @@
+import unittest
+from koncowy.src.roster import RosterSolver, solve_roster
+from koncowy.src.shift_store import ShiftStore, shift_end
+from koncowy.src.staff import Staff
+
+WEEK = [f"2025-06-{day:02d}" for day in range(2, 9)]
+
+
+class TestRosterSolver(unittest.TestCase):
+
+    def setUp(self):
+        self.workers = [Staff(f"Worker{i}", "Nowak", "worker")
+                        for i in range(4)]
+        self.cashiers = [Staff(f"Cashier{i}", "Lis", "Cashier")
+                         for i in range(2)]
+        self.staff = self.workers + self.cashiers
+
+    def assert_feasible(self, roster, max_hours=None, max_days=None):
+        for staff_member in self.staff:
+            shifts = roster.shifts_for(staff_member)
+            self.assertEqual(len(shifts), len(set(shifts)))
+            _, minutes = staff_member.shifts.minutes_by_day(WEEK[0], WEEK[-1])
+            hours = sum(minutes) / 60 + 5 * len(shifts)
+            days = {date for date, _ in shifts} | {
+                date for date, _ in staff_member.shifts.between(WEEK[0],
+                                                                WEEK[-1])}
+            if max_hours is not None:
+                self.assertLessEqual(hours, max_hours)
+            if max_days is not None:
+                self.assertLessEqual(len(days), max_days)
+            calendar = ShiftStore(staff_member.shifts.with_end_times())
+            for date, time in shifts:
+                self.assertIsNone(calendar.clash(date, time))
+                calendar.add(date, time, shift_end(time))
+
+    def test_fills_demand_by_role(self):
+        demand = {(date, "10:00"): {"worker": 2, "cashier": 1}
+                  for date in WEEK}
+        roster = solve_roster(self.staff, demand, max_hours=20, max_days=4)
+        self.assertTrue(roster.is_complete())
+        self.assert_feasible(roster, max_hours=20, max_days=4)
+        for slot, roles in roster.assignments.items():
+            self.assertEqual(len(roles["worker"]), 2)
+            self.assertTrue(all(m in self.workers for m in roles["worker"]))
+            self.assertEqual(len(roles["cashier"]), 1)
+        self.assertGreaterEqual(roster.elapsed, 0)
+
+    def test_reports_unfilled_demand(self):
+        test_cases = [
+            ("unknown_role", {(WEEK[0], "10:00"): {"projectionist": 1}},
+             {(WEEK[0], "10:00"): 1}),
+            ("not_enough_staff", {(WEEK[0], "10:00"): {"cashier": 3}},
+             {(WEEK[0], "10:00"): 1}),
+            ("hours_cap", {(date, "10:00"): {"cashier": 2}
+                           for date in WEEK[:3]},
+             {(WEEK[2], "10:00"): 2}),
+        ]
+        for case, demand, expected in test_cases:
+            with self.subTest(case=case):
+                roster = solve_roster(self.staff, demand, max_hours=10)
+                self.assertEqual(
+                    {slot: count
+                     for (slot, _), count in roster.unfilled.items()},
+                    expected)
+                self.assert_feasible(roster, max_hours=10)
+
+    def test_respects_existing_shifts(self):
+        self.cashiers[0].assign_shift(WEEK[0], "10:00")
+        self.cashiers[0].assign_shift(WEEK[1], "10:00")
+        demand = {(date, "10:00"): {"cashier": 1} for date in WEEK[:4]}
+        roster = solve_roster(self.staff, demand, max_days=3)
+        self.assertTrue(roster.is_complete())
+        self.assert_feasible(roster, max_days=3)
+        self.assertEqual(roster.shifts_for(self.cashiers[0]),
+                         [(WEEK[2], "10:00")])
+
+    def test_caps_ignore_shifts_outside_planning_window(self):
+        worker = self.workers[0]
+        for day in range(10):
+            worker.assign_shift(f"2025-05-{day + 1:02d}", "10:00")
+        worker.assign_shift(WEEK[0], "18:00")
+        demand = {(date, "10:00"): {"worker": 1} for date in WEEK}
+        solver = RosterSolver([worker], demand, max_hours=40, max_days=5)
+        roster = solver.solve()
+        self.assertEqual(solver._hours[worker], 5 * 6)
+        self.assertEqual(len(roster.shifts_for(worker)), 5)
+        self.assertEqual(len(roster.unfilled), 2)
+        self.assert_feasible(roster, max_hours=40, max_days=5)
+
+    def test_local_search_repairs_greedy_choice(self):
+        self.cashiers[1].assign_shift(WEEK[0], "18:00")
+        demand = {(WEEK[0], "10:00"): {"cashier": 1},
+                  (WEEK[1], "10:00"): {"cashier": 1}}
+        solver = RosterSolver(self.staff, demand, max_days=1)
+        solver._reset()
+        self.assertEqual(solver._fill(*solver._demand[0][:2], 1), 1)
+        self.assertEqual(solver._fill(*solver._demand[1][:2], 1), 0)
+        roster = solver.solve()
+        self.assertTrue(roster.is_complete())
+        self.assert_feasible(roster, max_days=1)
+        self.assertEqual(roster.shifts_for(self.cashiers[0]),
+                         [(WEEK[1], "10:00")])
+
+    def test_balances_load(self):
+        demand = {(date, time): {"worker": 1}
+                  for date in WEEK for time in ("10:00", "16:00")}
+        roster = solve_roster(self.staff, demand)
+        loads = [len(roster.shifts_for(worker)) for worker in self.workers]
+        self.assertLessEqual(max(loads) - min(loads), 1)
+
+    def test_apply_assigns_shifts(self):
+        demand = {(WEEK[0], "10:00"): {"worker": 4}}
+        roster = solve_roster(self.staff, demand)
+        roster.apply()
+        for worker in self.workers:
+            self.assertFalse(worker.is_available(WEEK[0], "10:00"))
+
+    def test_avoids_overlapping_shifts(self):
+        self.workers[0].assign_shift(WEEK[0], "08:00", "18:00")
+        demand = {(WEEK[0], "12:00"): {"worker": 4},
+                  (WEEK[1], "10:00"): {"cashier": 2},
+                  (WEEK[1], "12:00"): {"cashier": 1}}
+        roster = solve_roster(self.staff, demand)
+        self.assertEqual(
+            {slot: count for (slot, _), count in roster.unfilled.items()},
+            {(WEEK[0], "12:00"): 1, (WEEK[1], "12:00"): 1})
+        self.assertEqual(roster.shifts_for(self.workers[0]), [])
+        self.assert_feasible(roster)
+        roster.apply()
+        self.assertEqual(self.workers[0].total_hours_assigned(), 10)
+
+    def test_negative_headcount(self):
+        with self.assertRaises(ValueError):
+            RosterSolver(self.staff, {(WEEK[0], "10:00"): {"worker": -1}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+import unittest
+from koncowy.src.schedule import Schedule
+from koncowy.src.movie import Movie
+
+
+class TestSchedule(unittest.TestCase):
+
+    def setUp(self):
+        self.movies = [
+            Movie(f"Movie {i}", genre, 100, 0, "D", "EN", 2000, 7.0, "Desc")
+            for i, genre in enumerate(["Drama", "Sci-Fi", "drama"])
+        ]
+        self.schedule = Schedule(self.movies)
+
+    def test_keeps_insertion_order(self):
+        self.assertEqual(list(self.schedule), self.movies)
+        self.assertEqual(self.schedule, self.movies)
+        self.assertEqual(self.schedule[-1], self.movies[-1])
+
+    def test_add(self):
+        test_cases = [
+            ("new_movie", Movie("New", "Drama", 90, 0, "D", "EN",
+                                2001, 6.0, "Desc"), True, 4),
+            ("duplicate_movie", None, False, 3),
+        ]
+        for case, movie, expected, expected_len in test_cases:
+            with self.subTest(case=case):
+                schedule = Schedule(self.movies)
+                movie = movie or self.movies[0]
+                self.assertEqual(schedule.add(movie), expected)
+                self.assertEqual(len(schedule), expected_len)
+                self.assertIn(movie, schedule)
+
+    def test_remove(self):
+        self.schedule.remove(self.movies[1])
+        self.assertNotIn(self.movies[1], self.schedule)
+        self.assertEqual(self.schedule, [self.movies[0], self.movies[2]])
+        self.assertEqual(self.schedule.by_genre("sci-fi"), [])
+        with self.assertRaises(ValueError):
+            self.schedule.remove(self.movies[1])
+
+    def test_by_genre_is_case_insensitive(self):
+        self.assertEqual(self.schedule.by_genre("DRAMA"),
+                         [self.movies[0], self.movies[2]])
+
+    def test_first_by_title(self):
+        test_cases = [
+            ("present", "movie 1", self.movies[1]),
+            ("absent", "Other", None),
+        ]
+        for case, title, expected in test_cases:
+            with self.subTest(case=case):
+                self.assertIs(self.schedule.first_by_title(title), expected)
+
+    def test_clear(self):
+        self.schedule.clear()
+        self.assertEqual(self.schedule, [])
+        self.assertEqual(self.schedule.by_title("Movie 0"), [])
+
+    def test_genre_counts_follow_mutations(self):
+        extra = Movie("Extra", "Drama", 90, 0, "D", "EN", 2001, 6.0, "Desc")
+        test_cases = [
+            ("initial", lambda s: None,
+             {"Drama": 1, "Sci-Fi": 1, "drama": 1}),
+            ("add", lambda s: s.add(extra),
+             {"Drama": 2, "Sci-Fi": 1, "drama": 1}),
+            ("add_duplicate", lambda s: s.add(self.movies[0]),
+             {"Drama": 1, "Sci-Fi": 1, "drama": 1}),
+            ("remove", lambda s: s.remove(self.movies[1]),
+             {"Drama": 1, "drama": 1}),
+            ("clear", lambda s: s.clear(), {}),
+        ]
+        for case, mutate, expected in test_cases:
+            with self.subTest(case=case):
+                schedule = Schedule(self.movies)
+                mutate(schedule)
+                self.assertEqual(schedule.genre_counts(), expected)
+
+    def test_genre_counts_returns_copy(self):
+        counts = self.schedule.genre_counts()
+        counts["Drama"] = 100
+        self.assertEqual(self.schedule.genre_counts()["Drama"], 1)
+
+    def test_equality_with_other_types(self):
+        self.assertEqual(Schedule(self.movies), Schedule(self.movies))
+        self.assertNotEqual(self.schedule, "not a schedule")
+
+    def test_movie_without_genre(self):
+        untyped = Movie("Untyped", None, 90, 0, "D", "EN", 2001, 6.0, "Desc")
+        self.assertTrue(self.schedule.add(untyped))
+        self.assertEqual(self.schedule.genre_counts()[None], 1)
+        self.assertEqual(self.schedule.by_genre("drama"),
+                         [self.movies[0], self.movies[2]])
+        self.schedule.remove(untyped)
+        self.assertNotIn(None, self.schedule.genre_counts())
+
+    def test_copy_does_not_affect_original(self):
+        extra = Movie("Extra", "Drama", 90, 0, "D", "EN", 2001, 6.0, "Desc")
+        test_cases = [
+            ("add", lambda s: s.add(extra)),
+            ("remove", lambda s: s.remove(self.movies[0])),
+            ("clear", lambda s: s.clear()),
+        ]
+        for case, mutate in test_cases:
+            with self.subTest(case=case):
+                original = Schedule(self.movies)
+                copy = original.copy()
+                mutate(copy)
+                self.assertEqual(original, self.movies)
+                self.assertEqual(original.by_genre("drama"),
+                                 [self.movies[0], self.movies[2]])
+                self.assertEqual(original.first_by_title("Movie 0"),
+                                 self.movies[0])
+                self.assertEqual(original.genre_counts(),
+                                 {"Drama": 1, "Sci-Fi": 1, "drama": 1})
+
+    def test_original_changes_do_not_affect_copy(self):
+        extra = Movie("Extra", "Drama", 90, 0, "D", "EN", 2001, 6.0, "Desc")
+        test_cases = [
+            ("add", lambda s: s.add(extra)),
+            ("remove", lambda s: s.remove(self.movies[0])),
+            ("clear", lambda s: s.clear()),
+        ]
+        for case, mutate in test_cases:
+            with self.subTest(case=case):
+                original = Schedule(self.movies)
+                copy = original.copy()
+                mutate(original)
+                self.assertEqual(copy, self.movies)
+                self.assertEqual(copy.by_genre("drama"),
+                                 [self.movies[0], self.movies[2]])
+                self.assertEqual(copy.first_by_title("Movie 0"),
+                                 self.movies[0])
+
+    def test_large_copy_is_isolated_from_writes(self):
+        movies = [Movie(f"Movie {i}", ("Drama", "Comedy")[i % 2], 90, 0,
+                        "D", "EN", 2001, 6.0, "Desc") for i in range(2000)]
+        original = Schedule(movies[:1000])
+        copy = original.copy().freeze()
+        for movie in movies[1000:]:
+            original.add(movie)
+        for movie in movies[:1000:3]:
+            original.remove(movie)
+        self.assertEqual(copy, movies[:1000])
+        self.assertEqual(copy.by_genre("drama"), movies[:1000:2])
+        self.assertEqual(copy.by_title("Movie 3"), [movies[3]])
+        self.assertEqual(copy.genre_counts(), {"Drama": 500, "Comedy": 500})
+        expected = [movie for i, movie in enumerate(movies)
+                    if i >= 1000 or i % 3]
+        self.assertEqual(original, expected)
+        self.assertEqual(original.by_genre("comedy"),
+                         [movie for movie in expected
+                          if movie.genre == "Comedy"])
+        self.assertEqual(original.by_title("Movie 3"), [])
+        self.assertNotIn(movies[3], original)
+        self.assertIn(movies[3], copy)
+
+    def test_frozen_schedule_is_read_only(self):
+        schedule = Schedule(self.movies).freeze()
+        self.assertTrue(schedule.frozen)
+        test_cases = [
+            ("add", lambda s: s.add(self.movies[0])),
+            ("remove", lambda s: s.remove(self.movies[0])),
+            ("clear", lambda s: s.clear()),
+        ]
+        for case, mutate in test_cases:
+            with self.subTest(case=case):
+                with self.assertRaises(ValueError):
+                    mutate(schedule)
+                self.assertEqual(schedule, self.movies)
+        self.assertFalse(schedule.copy().frozen)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+import threading
+import unittest
+from koncowy.src.movie import Movie
+from koncowy.src.seating import Auditorium, Screening
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAuditorium(unittest.TestCase):
+
+    def test_invalid_auditorium(self):
+        test_cases = [
+            ("empty_name", "", 5, 5),
+            ("no_rows", "Hall", 0, 5),
+            ("no_seats", "Hall", 5, 0),
+        ]
+        for case, name, rows, seats in test_cases:
+            with self.subTest(case=case):
+                with self.assertRaises(ValueError):
+                    Auditorium(name, rows, seats)
+
+    def test_capacity(self):
+        self.assertEqual(Auditorium("Hall", 4, 6).capacity, 24)
+
+
+class TestScreening(unittest.TestCase):
+
+    def setUp(self):
+        self.movie = Movie("Inception", "Sci-Fi", 148, 13, "Nolan", "EN",
+                           2010, 8.8, "Dreams")
+        self.clock = FakeClock()
+        self.screening = Screening(self.movie, Auditorium("Hall", 5, 10),
+                                   hold_ttl=60, clock=self.clock)
+
+    def test_best_available_prefers_centre(self):
+        test_cases = [
+            ("two_seats", 2, [(2, 4), (2, 5)]),
+            ("three_seats", 3, [(2, 3), (2, 4), (2, 5)]),
+            ("whole_row", 10, [(2, seat) for seat in range(10)]),
+        ]
+        for case, count, expected in test_cases:
+            with self.subTest(case=case):
+                self.assertEqual(self.screening.best_available(count),
+                                 expected)
+
+    def test_best_available_skips_to_next_best_row(self):
+        self.screening.hold([(2, 0), (2, 9)])
+        self.assertEqual(self.screening.best_available(9)[0], (1, 0))
+        self.screening.hold([(2, 4)])
+        self.assertEqual(self.screening.best_available(4),
+                         [(2, 5), (2, 6), (2, 7), (2, 8)])
+
+    def test_best_available_invalid_count(self):
+        for count in (0, -1, 11, None):
+            with self.subTest(count=count):
+                with self.assertRaises(ValueError):
+                    self.screening.best_available(count)
+
+    def test_best_available_when_full(self):
+        for row in range(5):
+            self.screening.hold(count=10)
+        self.assertIsNone(self.screening.best_available(1))
+        with self.assertRaises(ValueError):
+            self.screening.hold(count=1)
+
+    def test_hold_rejects_taken_or_invalid_seats(self):
+        self.screening.hold([(0, 0), (0, 1)])
+        test_cases = [
+            ("taken", [(0, 1), (0, 2)]),
+            ("missing_row", [(5, 0)]),
+            ("missing_seat", [(0, 10)]),
+            ("duplicate", [(1, 1), (1, 1)]),
+            ("empty", []),
+        ]
+        for case, seats in test_cases:
+            with self.subTest(case=case):
+                with self.assertRaises(ValueError):
+                    self.screening.hold(seats)
+                self.assertEqual(self.screening.available_count(), 48)
+
+    def test_confirm(self):
+        hold = self.screening.hold(count=2)
+        self.assertEqual(self.screening.confirm(hold), ((2, 4), (2, 5)))
+        self.assertTrue(self.screening.is_sold(2, 4))
+        self.assertEqual(self.screening.sold_count(), 2)
+        with self.assertRaises(ValueError):
+            self.screening.confirm(hold)
+
+    def test_hold_expires(self):
+        hold = self.screening.hold([(0, 0)])
+        self.clock.now = 59
+        self.assertFalse(self.screening.is_available(0, 0))
+        self.clock.now = 60
+        self.assertTrue(self.screening.is_available(0, 0))
+        with self.assertRaises(ValueError):
+            self.screening.confirm(hold)
+        self.assertEqual(self.screening.sold_count(), 0)
+
+    def test_confirmed_seats_do_not_expire(self):
+        self.screening.confirm(self.screening.hold([(0, 0)]))
+        self.clock.now = 1000
+        self.assertFalse(self.screening.is_available(0, 0))
+
+    def test_release(self):
+        hold = self.screening.hold([(0, 0)])
+        self.screening.release(hold)
+        self.screening.release(hold)
+        self.assertTrue(self.screening.is_available(0, 0))
+        with self.assertRaises(ValueError):
+            self.screening.confirm(hold)
+
+    def test_cancel(self):
+        hold = self.screening.hold([(0, 0)])
+        self.screening.confirm(self.screening.hold([(0, 1)]))
+        self.screening.cancel()
+        self.assertTrue(self.screening.cancelled)
+        self.assertTrue(self.screening.is_available(0, 0))
+        test_cases = [
+            ("confirm", lambda s: s.confirm(hold)),
+            ("hold", lambda s: s.hold(count=1)),
+        ]
+        for case, action in test_cases:
+            with self.subTest(case=case):
+                with self.assertRaises(ValueError):
+                    action(self.screening)
+        self.assertEqual(self.screening.sold_count(), 1)
+
+    def test_concurrent_holds_never_oversell(self):
+        confirmed = []
+
+        def book():
+            while True:
+                try:
+                    hold = self.screening.hold(count=3)
+                except ValueError:
+                    return
+                confirmed.extend(self.screening.confirm(hold))
+
+        threads = [threading.Thread(target=book) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(confirmed), len(set(confirmed)))
+        self.assertEqual(len(confirmed), 45)
+        self.assertEqual(self.screening.sold_count(), 45)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,222 @@
+import unittest
+from datetime import date
+from koncowy.src.shift_store import Shift, ShiftStore
+
+
+class TestShiftStore(unittest.TestCase):
+
+    def setUp(self):
+        self.shifts = [("2025-05-20", "10:00"), ("2025-05-21", "12:00"),
+                       ("2025-05-20", "14:00")]
+        self.store = ShiftStore(self.shifts)
+
+    def test_keeps_insertion_order_as_tuples(self):
+        self.assertEqual(list(self.store), self.shifts)
+        self.assertEqual(self.store, self.shifts)
+        self.assertIsInstance(self.store[0], Shift)
+        self.assertEqual(self.store[0].date, "2025-05-20")
+
+    def test_contains(self):
+        test_cases = [
+            ("tuple", ("2025-05-20", "10:00"), True),
+            ("list_from_json", ["2025-05-20", "10:00"], True),
+            ("shift", Shift("2025-05-21", "12:00"), True),
+            ("missing", ("2025-05-21", "10:00"), False),
+            ("malformed", ("2025-05-20",), False),
+        ]
+        for case, shift, expected in test_cases:
+            with self.subTest(case=case):
+                self.assertEqual(shift in self.store, expected)
+
+    def test_add(self):
+        test_cases = [
+            ("new_slot", ("2025-05-22", "10:00"), True, 4, 3),
+            ("new_time_same_day", ("2025-05-21", "18:00"), True, 4, 2),
+            ("duplicate", ("2025-05-20", "10:00"), False, 3, 2),
+        ]
+        for case, shift, expected, expected_len, expected_days in test_cases:
+            with self.subTest(case=case):
+                store = ShiftStore(self.shifts)
+                self.assertEqual(store.add(*shift), expected)
+                self.assertEqual(len(store), expected_len)
+                self.assertEqual(store.day_count(), expected_days)
+
+    def test_clash(self):
+        store = ShiftStore([("2025-05-20", "08:00", "18:00"),
+                            ("2025-05-20", "09:00", "10:00"),
+                            ("2025-05-20", "22:00", "06:00")])
+        test_cases = [
+            ("inside_long_shift", "2025-05-20", "12:00", "17:00",
+             ("2025-05-20", "08:00")),
+            ("covering", "2025-05-20", "07:00", "19:00",
+             ("2025-05-20", "08:00")),
+            ("overnight_from_previous_day", "2025-05-21", "05:00", "07:00",
+             ("2025-05-20", "22:00")),
+            ("runs_into_next_day", "2025-05-19", "20:00", "09:00",
+             ("2025-05-20", "08:00")),
+            ("between_shifts", "2025-05-20", "18:00", "22:00", None),
+        ]
+        for case, day, time, end, expected in test_cases:
+            with self.subTest(case=case):
+                self.assertEqual(store.clash(day, time, end), expected)
+
+    def test_strict_add_rejects_overlaps(self):
+        store = ShiftStore([("2025-05-20", "08:00", "18:00")])
+        with self.assertRaises(ValueError):
+            store.add("2025-05-20", "12:00", "17:00", strict=True)
+        self.assertEqual(len(store), 1)
+        self.assertTrue(store.add("2025-05-20", "18:00", "22:00",
+                                  strict=True))
+        self.assertTrue(store.add("2025-05-20", "12:00", "17:00"))
+        self.assertEqual(store.total_hours(), 19)
+
+    def test_remove(self):
+        self.store.remove("2025-05-21", "12:00")
+        self.assertEqual(self.store.dates(), ["2025-05-20"])
+        self.store.remove("2025-05-20", "10:00")
+        self.assertEqual(self.store.on_date("2025-05-20"), ["14:00"])
+        with self.assertRaises(ValueError):
+            self.store.remove("2025-05-20", "10:00")
+
+    def test_normalizes_date_and_time(self):
+        test_cases = [
+            ("date_object", date(2025, 5, 20), "10:00"),
+            ("iso_string", "2025-05-21", "12:00"),
+        ]
+        store = ShiftStore([(date(2025, 5, 20), "9:00")])
+        self.assertEqual(store, [("2025-05-20", "09:00")])
+        self.assertIn(("2025-05-20", "09:00"), store)
+        for case, day, time in test_cases:
+            with self.subTest(case=case):
+                store = ShiftStore(self.shifts)
+                self.assertIn((day, time), store)
+                self.assertFalse(store.add(day, time))
+                self.assertEqual(len(store), 3)
+                self.assertEqual(store.day_count(), 2)
+        self.assertEqual(self.store.on_date(date(2025, 5, 20)),
+                         ["10:00", "14:00"])
+        self.assertEqual(self.store.end_of(date(2025, 5, 21), "12:00"),
+                         "17:00")
+
+    def test_orders_times_by_clock(self):
+        store = ShiftStore([("2025-05-20", "10:00"), ("2025-05-20", "9:00"),
+                            ("2025-05-19", "23:00")])
+        self.assertEqual(store.ordered(), [
+            ("2025-05-19", "23:00"), ("2025-05-20", "09:00"),
+            ("2025-05-20", "10:00")])
+        self.assertEqual(store.next_shift("2025-05-20", "8:30"),
+                         ("2025-05-20", "09:00"))
+        store.remove(date(2025, 5, 20), "9:00")
+        self.assertEqual(store.ordered()[1], ("2025-05-20", "10:00"))
+
+    def test_clear(self):
+        self.store.clear()
+        self.assertEqual(self.store, [])
+        self.assertEqual(self.store.day_count(), 0)
+        self.assertEqual(self.store.on_date("2025-05-20"), [])
+
+    def test_invalid_date(self):
+        for day in ("20.05.2025", None, ""):
+            with self.subTest(day=day):
+                with self.assertRaises(ValueError):
+                    self.store.add(day, "10:00")
+                self.assertEqual(len(self.store), 3)
+
+    def test_ordered(self):
+        self.store.add("2025-05-19", "18:00")
+        self.assertEqual(self.store.ordered(), [
+            ("2025-05-19", "18:00"), ("2025-05-20", "10:00"),
+            ("2025-05-20", "14:00"), ("2025-05-21", "12:00")])
+        self.store.remove("2025-05-20", "10:00")
+        self.assertEqual(self.store.ordered()[1], ("2025-05-20", "14:00"))
+
+    def test_between(self):
+        test_cases = [
+            ("single_day", "2025-05-20", "2025-05-20",
+             [("2025-05-20", "10:00"), ("2025-05-20", "14:00")]),
+            ("inclusive_range", "2025-05-19", "2025-05-21",
+             [("2025-05-20", "10:00"), ("2025-05-20", "14:00"),
+              ("2025-05-21", "12:00")]),
+            ("date_objects", date(2025, 5, 21), date(2025, 6, 1),
+             [("2025-05-21", "12:00")]),
+            ("empty", "2025-06-01", "2025-06-30", []),
+        ]
+        for case, start, end, expected in test_cases:
+            with self.subTest(case=case):
+                self.assertEqual(self.store.between(start, end), expected)
+
+    def test_next_shift(self):
+        test_cases = [
+            ("same_day_later", "2025-05-20", "11:00",
+             ("2025-05-20", "14:00")),
+            ("exact_slot", "2025-05-20", "10:00", ("2025-05-20", "10:00")),
+            ("whole_day", "2025-05-21", None, ("2025-05-21", "12:00")),
+            ("none_left", "2025-05-21", "13:00", None),
+        ]
+        for case, day, time, expected in test_cases:
+            with self.subTest(case=case):
+                self.assertEqual(self.store.next_shift(day, time), expected)
+
+    def test_week_counts(self):
+        self.store.add("2025-05-26", "10:00")
+        self.store.add("2025-06-08", "10:00")
+        self.assertEqual(self.store.week_counts("2025-05-21", "2025-06-09"), {
+            "2025-05-19": 1,
+            "2025-05-26": 1,
+            "2025-06-02": 1,
+            "2025-06-09": 0,
+        })
+
+    def test_end_times_and_hours(self):
+        test_cases = [
+            ("default_length", None, "15:00", 5),
+            ("custom_length", "13:30", "13:30", 3.5),
+            ("overnight", "02:00", "02:00", 16),
+        ]
+        for case, end, expected_end, expected_hours in test_cases:
+            with self.subTest(case=case):
+                store = ShiftStore()
+                store.add("2025-05-20", "10:00", end)
+                self.assertEqual(store.end_of("2025-05-20", "10:00"),
+                                 expected_end)
+                self.assertEqual(store.total_hours(), expected_hours)
+
+    def test_invalid_times(self):
+        test_cases = [
+            ("bad_start", "10h", None),
+            ("bad_end", "10:00", "25:00"),
+            ("zero_length", "10:00", "10:00"),
+        ]
+        for case, time, end in test_cases:
+            with self.subTest(case=case):
+                with self.assertRaises(ValueError):
+                    self.store.add("2025-06-01", time, end)
+                self.assertEqual(len(self.store), 3)
+
+    def test_total_hours_follow_mutations(self):
+        store = ShiftStore([("2025-05-20", "10:00", "18:00"),
+                            ("2025-05-21", "12:00")])
+        self.assertEqual(store.total_hours(), 13)
+        store.remove("2025-05-20", "10:00")
+        self.assertEqual(store.total_hours(), 5)
+        store.clear()
+        self.assertEqual(store.total_hours(), 0)
+
+    def test_minutes_by_day(self):
+        store = ShiftStore([("2025-05-21", "12:00", "14:00"),
+                            ("2025-05-20", "10:00", "18:00")])
+        first = date(2025, 5, 20).toordinal()
+        test_cases = [
+            ("all", None, None, [first, first + 1], [480, 120]),
+            ("from_start", "2025-05-21", None, [first + 1], [120]),
+            ("until_end", None, "2025-05-20", [first], [480]),
+        ]
+        for case, start, end, expected_days, expected_minutes in test_cases:
+            with self.subTest(case=case):
+                days, minutes = store.minutes_by_day(start, end)
+                self.assertEqual(list(days), expected_days)
+                self.assertEqual(list(minutes), expected_minutes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+from datetime import datetime
+from koncowy.src.movie import Movie
+from koncowy.src.showtime import Showtime, ShowtimeIndex
+
+
+def at(hour, minute=0):
+    return datetime(2025, 5, 20, hour, minute)
+
+
+class TestShowtime(unittest.TestCase):
+
+    def setUp(self):
+        self.movie = Movie("Inception", "Sci-Fi", 120, 13, "Nolan", "EN",
+                           2010, 8.8, "Dreams")
+
+    def test_end_is_computed_from_duration(self):
+        showtime = Showtime(self.movie, 1, at(18))
+        self.assertEqual(showtime.end, at(20))
+
+    def test_invalid_showtime(self):
+        test_cases = [
+            ("missing_movie", None, at(18)),
+            ("start_not_datetime", self.movie, "18:00"),
+        ]
+        for case, movie, start in test_cases:
+            with self.subTest(case=case):
+                with self.assertRaises(ValueError):
+                    Showtime(movie, 1, start)
+
+
+class TestShowtimeIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.movie = Movie("Inception", "Sci-Fi", 120, 13, "Nolan", "EN",
+                           2010, 8.8, "Dreams")
+        self.short = Movie("Short", "Drama", 30, 0, "D", "EN", 2020, 6.0,
+                           "Desc")
+        self.showtimes = [
+            Showtime(self.movie, 1, at(14)),
+            Showtime(self.short, 1, at(17)),
+            Showtime(self.movie, 1, at(20)),
+            Showtime(self.movie, 2, at(18, 30)),
+        ]
+        self.index = ShowtimeIndex(self.showtimes)
+
+    def test_iterates_in_start_order(self):
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(list(self.index),
+                         [self.showtimes[i] for i in (0, 1, 3, 2)])
+
+    def test_add_detects_clashes(self):
+        test_cases = [
+            ("overlaps_previous_end", Showtime(self.short, 1, at(15, 59)),
+             True),
+            ("overlaps_next_start", Showtime(self.movie, 1, at(18, 1)),
+             True),
+            ("same_start", Showtime(self.short, 1, at(14)), True),
+            ("contains_existing", Showtime(self.movie, 1, at(16, 45)), True),
+            ("back_to_back", Showtime(self.short, 1, at(16)), False),
+            ("fits_gap", Showtime(self.movie, 1, at(17, 30)), False),
+            ("other_screen", Showtime(self.movie, 3, at(14)), False),
+        ]
+        for case, showtime, clashes in test_cases:
+            with self.subTest(case=case):
+                index = ShowtimeIndex(self.showtimes)
+                if clashes:
+                    with self.assertRaises(ValueError):
+                        index.add(showtime)
+                    self.assertEqual(len(index), 4)
+                else:
+                    index.add(showtime)
+                    self.assertIn(showtime, list(index))
+
+    def test_clash(self):
+        self.assertIs(self.index.clash(1, at(19), at(21)), self.showtimes[2])
+        self.assertIsNone(self.index.clash(1, at(17, 30), at(20)))
+        self.assertIsNone(self.index.clash(9, at(0), at(23)))
+
+    def test_between(self):
+        test_cases = [
+            ("evening_all_screens", at(18), at(21), None,
+             [self.showtimes[i] for i in (3, 2)]),
+            ("evening_screen_1", at(18), at(21), 1, [self.showtimes[2]]),
+            ("touching_edges_excluded", at(16), at(17), None, []),
+            ("partial_overlap_included", at(15), at(17, 10), 1,
+             self.showtimes[:2]),
+            ("unknown_screen", at(0), at(23), 9, []),
+        ]
+        for case, start, end, screen, expected in test_cases:
+            with self.subTest(case=case):
+                self.assertEqual(self.index.between(start, end, screen),
+                                 expected)
+
+    def test_remove(self):
+        self.index.remove(self.showtimes[3])
+        self.assertEqual(self.index.screens(), [1])
+        self.index.add(Showtime(self.movie, 2, at(18)))
+        with self.assertRaises(ValueError):
+            self.index.remove(self.showtimes[3])
+        with self.assertRaises(ValueError):
+            self.index.remove(Showtime(self.movie, 1, at(14, 30)))
+        self.assertEqual(len(self.index), 4)
+
+    def test_remove_movies(self):
+        test_cases = [
+            ("one_movie", [self.movie], [self.showtimes[1]], [1]),
+            ("all_movies", [self.movie, self.short], [], []),
+            ("nothing", [], self.showtimes, [1, 2]),
+        ]
+        for case, movies, expected, screens in test_cases:
+            with self.subTest(case=case):
+                index = ShowtimeIndex(self.showtimes)
+                removed = index.remove_movies(movies)
+                self.assertEqual(len(removed), 4 - len(expected))
+                self.assertEqual(sorted(index, key=id),
+                                 sorted(expected, key=id))
+                self.assertEqual(len(index), len(expected))
+                self.assertEqual(index.screens(), screens)
+                self.assertEqual(index.between(at(0), at(23)),
+                                 list(index))
+
+
+if __name__ == '__main__':
+    unittest.main()
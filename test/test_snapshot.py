@@ -0,0 +1,76 @@
+import io
+import unittest
+from koncowy.src.movie import Movie
+from koncowy.src.snapshot import read_snapshot, write_snapshot
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.movies = [
+            Movie("Inception", "Sci-Fi", 148, 13, "Christopher Nolan",
+                  "English", 2010, 8.8, "Dreams within dreams"),
+            Movie("Żywot Briana", "Komedia", 94, 12, "Terry Jones",
+                  "Polski", 1979, 8, "Zażółć gęślą jaźń"),
+            Movie("Matrix", "Sci-Fi", 136.5, 16, "Wachowski",
+                  "English", 1999, 8.7, ""),
+        ]
+        self.movies[1].watch()
+
+    def round_trip(self, movies):
+        f = io.BytesIO()
+        write_snapshot(f, "KinoTest", "Testowa 123", movies)
+        f.seek(0)
+        return read_snapshot(f)
+
+    def test_round_trip(self):
+        name, address, loaded = self.round_trip(self.movies)
+        self.assertEqual((name, address), ("KinoTest", "Testowa 123"))
+        self.assertEqual(len(loaded), len(self.movies))
+        for original, movie in zip(self.movies, loaded):
+            with self.subTest(title=original.title):
+                self.assertIsInstance(movie, Movie)
+                self.assertEqual(movie.to_dict(), original.to_dict())
+
+    def test_preserves_number_types(self):
+        test_cases = [
+            ("int_column", "release_year", 1, int),
+            ("mixed_column_becomes_float", "duration", 0, float),
+            ("float_column", "rating", 0, float),
+            ("views", "views", 1, int),
+        ]
+        _, _, loaded = self.round_trip(self.movies)
+        for case, field, index, expected_type in test_cases:
+            with self.subTest(case=case):
+                self.assertIsInstance(getattr(loaded[index], field),
+                                      expected_type)
+
+    def test_missing_values(self):
+        test_cases = [
+            ("genre", "genre"),
+            ("director", "director"),
+            ("language", "language"),
+            ("description", "description"),
+            ("release_year", "release_year"),
+        ]
+        for case, field in test_cases:
+            with self.subTest(case=case):
+                movies = [Movie("Inception", "Sci-Fi", 148, 13, "Nolan",
+                                "English", 2010, 8.8, "Dreams")
+                          for _ in range(10)]
+                for movie in movies[1::3]:
+                    setattr(movie, field, None)
+                _, _, loaded = self.round_trip(movies)
+                self.assertEqual([movie.to_dict() for movie in loaded],
+                                 [movie.to_dict() for movie in movies])
+
+    def test_empty_schedule(self):
+        self.assertEqual(self.round_trip([]), ("KinoTest", "Testowa 123", []))
+
+    def test_invalid_file_should_fail(self):
+        with self.assertRaises(ValueError):
+            read_snapshot(io.BytesIO(b"{\"name\": \"x\"}"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 import tempfile
 import os
+from datetime import date as Date
+from koncowy.src.shift_store import Shift
 from koncowy.src.staff import Staff
 
 
@@ -63,6 +65,21 @@ class TestStaff(unittest.TestCase):
         staff.clear_schedule()
         self.assertEqual(len(staff.shifts), 0)
 
+    def test_shifts_are_read_only(self):
+        staff = Staff("Anna", "Nowak", "manager")
+        staff.assign_shift("2025-05-20", "10:00")
+        test_cases = [
+            ("add", ("2025-05-21", "12:00")),
+            ("remove", ("2025-05-20", "10:00")),
+            ("clear", ()),
+        ]
+        for case, args in test_cases:
+            with self.subTest(case=case):
+                with self.assertRaises(AttributeError):
+                    getattr(staff.shifts, case)(*args)
+                self.assertEqual(staff.shifts, [("2025-05-20", "10:00")])
+        self.assertEqual(staff.shifts.on_date("2025-05-20"), ["10:00"])
+
     def test_complete_task(self):
         test_cases = [
             ("valid_task_adds_to_completed",
@@ -142,9 +159,50 @@ class TestStaff(unittest.TestCase):
             tmp_file.close()
             self.staff.save_to_json(tmp_file.name)
             loaded = Staff.read_from_json(tmp_file.name)
-            self.assertIn(["2025-05-20", "10:00"], loaded.shifts)
+            self.assertIn(("2025-05-20", "10:00"), loaded.shifts)
+            self.assertFalse(loaded.is_available("2025-05-20", "10:00"))
+            self.assertEqual(loaded.get_schedule(),
+                             [Shift("2025-05-20", "10:00")])
+            with self.assertRaises(ValueError):
+                loaded.assign_shift("2025-05-20", "10:00")
         os.remove(tmp_file.name)
 
+    def test_position_listener_notified(self):
+        events = []
+        self.staff.add_listener(lambda *args: events.append(args))
+        self.staff.change_position("worker")
+        self.staff.position = "worker"
+        self.assertEqual(events,
+                         [(self.staff, "position_changed", "manager")])
+
+    def test_shift_calendar_queries(self):
+        staff = Staff("Zofia", "Lis", "worker")
+        for day, hour in [("2025-06-03", "10:00"), ("2025-05-20", "18:00"),
+                          ("2025-05-20", "10:00"), ("2025-05-28", "12:00")]:
+            staff.assign_shift(day, hour)
+        self.assertEqual(staff.get_sorted_schedule(), [
+            ("2025-05-20", "10:00"), ("2025-05-20", "18:00"),
+            ("2025-05-28", "12:00"), ("2025-06-03", "10:00")])
+        self.assertEqual(staff.get_shifts_between("2025-05-21", "2025-06-02"),
+                         [("2025-05-28", "12:00")])
+        self.assertEqual(staff.next_shift("2025-05-20", "12:00"),
+                         ("2025-05-20", "18:00"))
+        self.assertEqual(staff.weekly_shift_counts("2025-05-19",
+                                                   "2025-06-08"),
+                         {"2025-05-19": 2, "2025-05-26": 1, "2025-06-02": 1})
+
+    def test_shift_listeners_notified(self):
+        events = []
+        self.staff.assign_shift("2025-05-20", "10:00")
+        self.staff.add_listener(lambda *args: events.append(args))
+        self.staff.assign_shift("2025-05-21", "12:00")
+        self.staff.clear_schedule()
+        self.assertEqual(events, [
+            (self.staff, "shift_assigned", "2025-05-21", "12:00"),
+            (self.staff, "shifts_replaced",
+             [("2025-05-20", "10:00"), ("2025-05-21", "12:00")]),
+        ])
+
     def test_str_contains_first_name(self):
         result = str(self.staff)
         self.assertIn("Anna", result)
@@ -210,12 +268,53 @@ class TestStaff(unittest.TestCase):
                 self.assertEqual(self.staff.total_hours_assigned(),
                                  expected_total)
 
+    def test_total_hours_with_shift_end_times(self):
+        self.staff.assign_shift("2025-06-01", "08:00", "16:00")
+        self.staff.assign_shift("2025-06-01", "22:00", "02:30")
+        self.staff.assign_shift("2025-06-02", "10:00")
+        self.assertEqual(self.staff.total_hours_assigned(), 17.5)
+        self.staff.clear_schedule()
+        self.assertEqual(self.staff.total_hours_assigned(), 0)
+
+    def test_save_and_load_json_keeps_end_times(self):
+        self.staff.assign_shift("2025-05-20", "10:00", "14:30")
+        self.staff.assign_shift("2025-05-21", "10:00")
+        path = tempfile.mktemp(suffix=".json")
+        try:
+            self.staff.save_to_json(path)
+            loaded = Staff.read_from_json(path)
+        finally:
+            os.remove(path)
+        self.assertEqual(loaded.shifts.end_of("2025-05-20", "10:00"),
+                         "14:30")
+        self.assertEqual(loaded.total_hours_assigned(), 9.5)
+
     def test_worked_days_parametrized(self):
         staff = Staff("Zofia", "Lis", "manager")
         staff.assign_shift("2025-05-20", "10:00")
         staff.assign_shift("2025-05-21", "12:00")
         staff.assign_shift("2025-05-20", "14:00")
         self.assertEqual(staff.worked_days(), 2)
+        self.assertEqual(staff.shifts.on_date("2025-05-20"),
+                         ["10:00", "14:00"])
+
+    def test_strict_assign_rejects_overlapping_shift(self):
+        self.staff.assign_shift("2025-05-20", "08:00", "18:00")
+        with self.assertRaises(ValueError):
+            self.staff.assign_shift("2025-05-20", "12:00", "17:00",
+                                    strict=True)
+        self.assertEqual(self.staff.get_schedule(), [("2025-05-20", "08:00")])
+        self.staff.assign_shift("2025-05-20", "12:00", "17:00")
+        self.assertTrue(self.staff.is_available("2025-05-20", "11:00"))
+
+    def test_same_slot_in_different_formats(self):
+        staff = Staff("Zofia", "Lis", "manager")
+        staff.assign_shift(Date(2025, 5, 20), "9:00")
+        with self.assertRaises(ValueError):
+            staff.assign_shift("2025-05-20", "09:00")
+        self.assertEqual(staff.worked_days(), 1)
+        self.assertEqual(staff.get_schedule(), [("2025-05-20", "09:00")])
+        self.assertFalse(staff.is_available("2025-05-20", "09:00"))
 
     def test_has_task(self):
         test_cases = [
@@ -0,0 +1,126 @@
+import unittest
+from datetime import date
+from koncowy.src.staff import Staff
+from koncowy.src.staff_registry import StaffRegistry
+
+
+class TestStaffRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.anna = Staff("Anna", "Nowak", "manager")
+        self.jan = Staff("Jan", "Kowalski", "worker")
+        self.registry = StaffRegistry([self.anna, self.jan])
+
+    def test_default_state(self):
+        registry = StaffRegistry()
+        self.assertEqual(registry, [])
+        self.assertEqual(len(registry), 0)
+
+    def test_add_duplicate_counts_twice(self):
+        self.registry.add(self.jan)
+        self.assertEqual(self.registry.count(self.jan), 2)
+        self.assertEqual(len(self.registry), 3)
+        self.assertEqual(self.registry.by_role("worker"), [self.jan])
+
+    def test_by_role_is_case_insensitive(self):
+        test_cases = [
+            ("lower", "manager", [self.anna]),
+            ("upper", "WORKER", [self.jan]),
+            ("missing", "cleaner", []),
+        ]
+        for case, role, expected in test_cases:
+            with self.subTest(case=case):
+                self.assertEqual(self.registry.by_role(role), expected)
+
+    def test_by_name(self):
+        namesake = Staff("Anna", "Nowak", "worker")
+        self.registry.add(namesake)
+        self.assertEqual(self.registry.by_name("Anna", "Nowak"),
+                         [self.anna, namesake])
+        self.assertEqual(self.registry.by_name("Ghost", "Person"), [])
+
+    def test_remove(self):
+        self.registry.remove(self.anna)
+        self.assertNotIn(self.anna, self.registry)
+        self.assertEqual(self.registry.by_role("manager"), [])
+        self.assertEqual(self.registry.by_name("Anna", "Nowak"), [])
+        with self.assertRaises(ValueError):
+            self.registry.remove(self.anna)
+
+    def test_position_change_moves_role(self):
+        test_cases = [
+            ("change_position",
+             lambda s: s.change_position("projectionist")),
+            ("direct_assignment",
+             lambda s: setattr(s, "position", "Projectionist")),
+        ]
+        for case, change in test_cases:
+            with self.subTest(case=case):
+                jan = Staff("Jan", "Kowalski", "worker")
+                registry = StaffRegistry([jan])
+                change(jan)
+                self.assertEqual(registry.by_role("worker"), [])
+                self.assertEqual(registry.by_role("projectionist"), [jan])
+
+    def test_removed_member_no_longer_tracked(self):
+        self.registry.remove(self.jan)
+        self.jan.change_position("manager")
+        self.assertEqual(self.registry.by_role("manager"), [self.anna])
+
+    def test_free_at_follows_shift_changes(self):
+        eva = Staff("Ewa", "Lis", "worker")
+        eva.assign_shift("2025-05-20", "10:00")
+        self.registry.add(eva)
+        self.jan.assign_shift("2025-05-20", "10:00")
+        test_cases = [
+            ("all_roles", None, [self.anna]),
+            ("role", "worker", []),
+            ("other_role", "manager", [self.anna]),
+        ]
+        for case, role, expected in test_cases:
+            with self.subTest(case=case):
+                self.assertEqual(
+                    self.registry.free_at("2025-05-20", "10:00", role),
+                    expected)
+        self.assertEqual(self.registry.busy_at("2025-05-20", "10:00"),
+                         [eva, self.jan])
+        self.jan.clear_schedule()
+        eva.shifts = [("2025-05-21", "10:00")]
+        self.assertEqual(self.registry.free_at("2025-05-20", "10:00",
+                                               "worker"), [self.jan, eva])
+        self.assertEqual(self.registry.busy_at("2025-05-21", "10:00"), [eva])
+        self.registry.remove(eva)
+        self.assertEqual(self.registry.busy_at("2025-05-21", "10:00"), [])
+
+    def test_busy_index_normalizes_slots(self):
+        self.jan.assign_shift(date(2025, 5, 20), "9:00")
+        test_cases = [
+            ("same_format", date(2025, 5, 20), "9:00"),
+            ("iso_padded", "2025-05-20", "09:00"),
+        ]
+        for case, day, time in test_cases:
+            with self.subTest(case=case):
+                self.assertEqual(self.registry.busy_at(day, time),
+                                 [self.jan])
+                self.assertEqual(self.registry.free_at(day, time),
+                                 [self.anna])
+
+    def test_free_for_slots(self):
+        self.anna.assign_shift("2025-05-20", "10:00")
+        self.jan.assign_shift("2025-05-20", "14:00")
+        slots = [("2025-05-20", "10:00"), ("2025-05-20", "14:00"),
+                 ("2025-05-21", "10:00")]
+        self.assertEqual(self.registry.free_for_slots(slots), {
+            slots[0]: [self.jan],
+            slots[1]: [self.anna],
+            slots[2]: [self.anna, self.jan],
+        })
+        self.assertEqual(self.registry.free_for_slots(slots, "manager"), {
+            slots[0]: [],
+            slots[1]: [self.anna],
+            slots[2]: [self.anna],
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()